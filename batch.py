@@ -0,0 +1,76 @@
+import argparse
+import json
+import sys
+
+from core import cache, registry, store
+
+def answer(graph, query, with_log=False):
+    key = query.get("query")
+    if key not in registry.ALGORITHMS:
+        raise ValueError(f"Consulta desconhecida: {key}")
+
+    param_names = registry.ALGORITHMS[key][2]
+    params = {name: query[name] for name in param_names if name in query}
+    if isinstance(params.get("vertices"), str):
+        params["vertices"] = [v.strip() for v in params["vertices"].split(",")]
+
+    log_lines = []
+    kind, title, message = registry.run(key, graph, params, log_lines.append if with_log else None)
+    result = {"query": key, "kind": kind, "title": title, "message": message}
+    if with_log:
+        result["log"] = log_lines
+    return result
+
+def run_batch(graph_name, lines, with_log=False):
+    graph = cache.load_graph(graph_name)
+    memo = {}
+
+    for line in lines:
+        if not line.strip():
+            continue
+        query_id = None
+        try:
+            query = json.loads(line)
+            if not isinstance(query, dict):
+                raise ValueError("Cada linha deve ser um objeto JSON.")
+            query_id = query.get("id")
+
+            name = query.get("graph", graph_name)
+            if name == graph_name:
+                target = graph
+            elif store.graph_exists(name):
+                target = cache.load_graph(name)
+            else:
+                raise ValueError(f"Grafo não encontrado: {name}")
+
+            key = query.get("query")
+            if key in registry.ALGORITHMS and not registry.ALGORITHMS[key][2] and not with_log:
+                if (name, key) not in memo:
+                    memo[(name, key)] = answer(target, query)
+                result = dict(memo[(name, key)])
+            else:
+                result = answer(target, query, with_log)
+        except (TypeError, ValueError) as e:
+            result = {"error": str(e)}
+        except Exception as e:
+            result = {"error": f"Erro interno: {type(e).__name__}: {e}"}
+
+        if query_id is not None:
+            result["id"] = query_id
+        yield result
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Responde consultas sobre um grafo da biblioteca, uma por linha em JSON.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("arquivo", nargs="?", help="arquivo de consultas (padrão: entrada padrão)")
+    parser.add_argument("--log", action="store_true", help="inclui o log de cada algoritmo na resposta")
+    args = parser.parse_args()
+
+    if not store.graph_exists(args.grafo):
+        print(f"Grafo não encontrado: {args.grafo}", file=sys.stderr)
+        sys.exit(1)
+
+    source = open(args.arquivo, "r") if args.arquivo else sys.stdin
+    with source:
+        for result in run_batch(args.grafo, source, args.log):
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
@@ -1,27 +1,68 @@
-import tkinter as tk
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, cycles, properties, store, topo, ui
+
+def check_if_cyclic(graph, log):
+    total_vertices = graph.num_vertices()
+    if topo.load(graph) is not None:
+        log("O grafo tem uma ordem topológica válida salva, portanto não contém ciclos.")
+        return ("info", "Verificação Cíclica do Grafo", 
+            f"O grafo não contém um ciclo.\nTotal de vértices: {total_vertices}.")
+
+    undirected = not graph.is_directed
+    if undirected:
+        log("Verificando se algum componente conexo tem mais arestas que uma árvore...")
+    else:
+        log("Verificando laços e componentes fortemente conexos com mais de um vértice...")
+    if properties.get(graph)["acyclic"]:
+        log("O grafo não contém ciclos.")
+        return ("info", "Verificação Cíclica do Grafo", 
+            f"O grafo não contém um ciclo.\nTotal de vértices: {total_vertices}.")
+
+    log("O grafo contém ciclos. Listando ciclos elementares em cada componente fortemente conexo (algoritmo de Johnson)...")
+    search = cycles.CycleSearch(graph, cycles.MAX_CYCLES, None, cycles.TIME_LIMIT, undirected)
+    cycle_vertices = []
+    seen = set()
+    for cycle in search:
+        names = graph.names(cycle)
+        log(f"Ciclo {search.found}: {' -> '.join(names + names[:1])}")
+        for v in cycle:
+            if v not in seen:
+                seen.add(v)
+                cycle_vertices.append(graph.name_of(v))
+
+    if search.stopped == "count":
+        return ("info", "Verificação Cíclica do Grafo", 
+            f"O grafo contém ciclos; os primeiros {search.found} foram listados (busca interrompida ao atingir {cycles.MAX_CYCLES} ciclos).\n"
+            f"Vértices envolvidos nos ciclos listados: {', '.join(cycle_vertices)}.")
+    if search.stopped == "time":
+        listed = f"{search.found} ciclo(s) listados em {cycles.TIME_LIMIT} segundos" if search.found else f"nenhum ciclo listado em {cycles.TIME_LIMIT} segundos"
+        vertices = f"\nVértices envolvidos nos ciclos listados: {', '.join(cycle_vertices)}." if cycle_vertices else ""
+        return ("info", "Verificação Cíclica do Grafo", f"O grafo contém ciclos; {listed} (busca interrompida).{vertices}")
+    return ("info", "Verificação Cíclica do Grafo", 
+        f"O grafo contém {search.found} ciclo(s).\n"
+        f"Vértices envolvidos em ciclo(s): {', '.join(cycle_vertices)}.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,70 +74,27 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar se o Grafo é Cíclico", command=self.check_if_cyclic).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_if_cyclic(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-        vertices = list(adjacency_matrix.keys())
-        visited = set()
-        visiting = set()
-        cycle_vertices = set()
-
-        def has_cycle(v):
-            self.log_message(f"Verificando o vértice: {v}")
-            if v in visiting:
-                self.log_message(f"Vértice {v} está em 'visiting', ciclo encontrado!")
-                return True
-            if v in visited:
-                self.log_message(f"Vértice {v} já foi visitado, pulando.")
-                return False
-
-            visiting.add(v)
-            self.log_message(f"Adicionando {v} a 'visiting'.")
-            for neighbor in adjacency_matrix[v]:
-                if adjacency_matrix[v][neighbor] != 0:
-                    self.log_message(f"Vértice {v} tem vizinho: {neighbor}.")
-                    if has_cycle(neighbor):
-                        cycle_vertices.add(v)
-                        self.log_message(f"Vértice {v} está envolvido em um ciclo.")
-                        return True
-            
-            visiting.remove(v)
-            visited.add(v)
-            self.log_message(f"Marcando {v} como visitado.")
-            return False
-
-        cycle_count = 0
-
-        for vertex in vertices:
-            if vertex not in visited:
-                self.log_message(f"Iniciando verificação para o vértice: {vertex}.")
-                if has_cycle(vertex):
-                    cycle_count += 1
-
-        total_vertices = len(vertices)
+        ui.show_result(check_if_cyclic(graph, self.log_message))
 
-        if cycle_count > 0:
-            messagebox.showinfo("Verificação Cíclica do Grafo", 
-                f"O grafo contém {cycle_count} ciclo(s).\n"
-                f"Vértices envolvidos em ciclo(s): {', '.join(cycle_vertices)}.")
-        else:
-            messagebox.showinfo("Verificação Cíclica do Grafo", 
-                f"O grafo não contém um ciclo.\nTotal de vértices: {total_vertices}.")
-            
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,27 +1,62 @@
-import tkinter as tk
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, topo, ui
+
+def check_dag_and_topological_sort(graph, log):
+    def is_directed():
+        log("Verificando se o grafo é direcionado...")
+        if not graph.is_directed:
+            log("O grafo não é direcionado.")
+            return False
+        log("O grafo é direcionado.")
+        return True
+
+    def layered_sort():
+        log("Gerando ordenação topológica em camadas...")
+        sweep = topo.KahnSweep(graph)
+        order = []
+        widths = []
+        for layer in sweep:
+            order.extend(layer)
+            widths.append(len(layer))
+            log(f"Camada {len(widths)}: {', '.join(graph.names(layer))}")
+        return sweep.cycle, order, widths
+
+    if not is_directed():
+        return ("error", "Não é um Grafo Direcionado", "O grafo não é direcionado.")
+
+    cycle, order, widths = layered_sort()
+    if cycle:
+        names = graph.names(cycle)
+        cycle_info = " -> ".join(names + names[:1])
+        log(f"O grafo contém um ciclo: {cycle_info}")
+        return ("error", "Grafo Cíclico", f"O grafo é direcionado, mas contém um ciclo, portanto não é um DAG.\nCiclo: {cycle_info}")
+
+    topo.save(graph, order)
+    return ("info", "DAG e Ordenação Topológica", 
+        f"O grafo é um grafo acíclico direcionado (DAG).\nOrdem Topológica: {', '.join(graph.names(order))}\n"
+        f"Camadas: {len(widths)} (até {max(widths, default=0)} vértices em paralelo)")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack(pady=5)
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,91 +68,27 @@ class VerificationApp:
         tk.Button(self.root, text="Gerar uma Ordenação Topológica em um DAG", command=self.check_dag_and_topological_sort).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_dag_and_topological_sort(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
-        def is_directed():
-            self.log_message("Verificando se o grafo é direcionado...")
-            for u in adjacency_matrix:
-                for v in adjacency_matrix[u]:
-                    if adjacency_matrix[u][v] != adjacency_matrix[v].get(u, 0):
-                        self.log_message(f"Grafo não é direcionado: {u} -> {v} e {v} não é {u}.")
-                        return True
-            self.log_message("O grafo é direcionado.")
-            return False
-
-        def is_acyclic():
-            self.log_message("Verificando se o grafo é acíclico...")
-            visited = set()
-            recursion_stack = set()
-
-            def dfs(v):
-                visited.add(v)
-                recursion_stack.add(v)
-                self.log_message(f"Visitando vértice: {v}")
-                for neighbor in adjacency_matrix[v]:
-                    if adjacency_matrix[v][neighbor] != 0:
-                        if neighbor not in visited:
-                            if dfs(neighbor):
-                                return True
-                        elif neighbor in recursion_stack:
-                            self.log_message(f"Ciclo encontrado ao visitar: {neighbor}")
-                            return True
-                recursion_stack.remove(v)
-                return False
-
-            for vertex in adjacency_matrix:
-                if vertex not in visited:
-                    if dfs(vertex):
-                        self.log_message("O grafo contém um ciclo.")
-                        return False
-            self.log_message("O grafo é acíclico.")
-            return True
-
-        def topological_sort():
-            self.log_message("Gerando ordenação topológica...")
-            visited = set()
-            stack = []
-
-            def dfs(v):
-                visited.add(v)
-                for neighbor in adjacency_matrix[v]:
-                    if adjacency_matrix[v][neighbor] != 0 and neighbor not in visited:
-                        dfs(neighbor)
-                stack.append(v)
-                self.log_message(f"Vértice {v} adicionado à pilha.")
-
-            for vertex in adjacency_matrix:
-                if vertex not in visited:
-                    dfs(vertex)
-
-            return stack[::-1]
-
-        if is_directed():
-            if is_acyclic():
-                topo_sort = topological_sort()
-                messagebox.showinfo("DAG e Ordenação Topológica", 
-                    f"O grafo é um grafo acíclico direcionado (DAG).\nOrdem Topológica: {', '.join(topo_sort)}")
-            else:
-                messagebox.showerror("Grafo Cíclico", "O grafo é direcionado, mas contém um ciclo, portanto não é um DAG.")
-        else:
-            messagebox.showerror("Não é um Grafo Direcionado", "O grafo não é direcionado.")
+        ui.show_result(check_dag_and_topological_sort(graph, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
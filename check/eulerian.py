@@ -1,27 +1,72 @@
-import tkinter as tk
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, euler, properties, store, ui
+
+def check_eulerian(graph, log):
+    def is_directed():
+        log("Verificando se o grafo é direcionado...")
+        if not graph.is_directed:
+            log("O grafo não é direcionado.")
+            return False
+        arc = properties.get(graph)["asymmetric_arc"]
+        if arc:
+            u, v = arc
+            log(f"O grafo é direcionado: {graph.name_of(u)} -> {graph.name_of(v)} sem {graph.name_of(v)} -> {graph.name_of(u)}.")
+        else:
+            log("O grafo é direcionado, com todos os arcos em pares simétricos.")
+        return True
+
+    directed = is_directed()
+    description = "direcionado" if directed else "não direcionado"
+
+    if directed:
+        log("Verificando se os graus de entrada e de saída estão equilibrados...")
+    else:
+        log("Verificando se há no máximo dois vértices de grau ímpar...")
+    start, end, unbalanced = euler.endpoints(graph, directed)
+    if start is None:
+        if unbalanced:
+            log(f"Vértices com grau {'desequilibrado' if directed else 'ímpar'}: {', '.join(graph.names(unbalanced))}.")
+        else:
+            log("O grafo não possui arestas.")
+        log(f"O grafo {description} não é Euleriano.")
+        return ("error", "Não é Euleriano", f"O grafo {description} não é Euleriano.")
+
+    kind = "Ciclo Euleriano" if start == end else "Caminho Euleriano"
+    log(f"Encontrando o {kind.lower()} usando o Algoritmo de Hierholzer...")
+    walk = euler.EulerWalk(graph, directed, start, end)
+    trail = graph.names(list(walk))
+    if not walk.complete():
+        log(f"Apenas {walk.edges_used} de {walk.num_edges} arestas foram alcançadas; o grafo não é conectado.")
+        log(f"O grafo {description} não é Euleriano.")
+        return ("error", "Não é Euleriano", f"O grafo {description} não é Euleriano.")
+
+    trail_str = " -> ".join(trail)
+    log(f"{kind} encontrado: {trail_str}")
+    if start == end:
+        return ("info", "Grafo Euleriano", f"O grafo {description} é Euleriano.\n{kind}: {trail_str}")
+    return ("info", "Grafo Semi-Euleriano", f"O grafo {description} não tem ciclo Euleriano, mas tem um caminho Euleriano.\n{kind}: {trail_str}")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,174 +78,31 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar se o Grafo é Euleriano", command=self.check_eulerian).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_eulerian(self):
+        import tkinter as tk
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando a verificação do grafo Euleriano...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
-        def is_directed():
-            self.log_message("Verificando se o grafo é direcionado...")
-            for u in adjacency_matrix:
-                for v in adjacency_matrix[u]:
-                    if adjacency_matrix[u][v] != adjacency_matrix[v].get(u, 0):
-                        self.log_message(f"Grafo não é direcionado: {u} -> {v} e {v} não é {u}.")
-                        return True
-            self.log_message("O grafo é direcionado.")
-            return False
-
-        def is_directed_eulerian():
-            self.log_message("Verificando se todos os vértices têm grau de entrada e grau de saída iguais...")
-
-            in_degree = {v: 0 for v in adjacency_matrix}
-            out_degree = {v: 0 for v in adjacency_matrix}
-
-            for u in adjacency_matrix:
-                for v in adjacency_matrix[u]:
-                    if adjacency_matrix[u][v] != 0:
-                        out_degree[u] += 1
-                        in_degree[v] += 1
-
-            for v in adjacency_matrix:
-                self.log_message(f"Vértice {v}: grau de entrada = {in_degree[v]}, grau de saída = {out_degree[v]}.")
-                if in_degree[v] != out_degree[v]:
-                    self.log_message(f"Vértice {v} não possui grau de entrada e saída iguais. O grafo não é Euleriano.")
-                    return False
-
-            def is_weakly_connected():
-                self.log_message("Verificando se o grafo é fraco-conectado...")
-                visited = set()
-                def dfs(v):
-                    visited.add(v)
-                    for neighbor in adjacency_matrix[v]:
-                        if adjacency_matrix[v][neighbor] != 0 and neighbor not in visited:
-                            dfs(neighbor)
-
-                initial_vertex = next((v for v in adjacency_matrix if any(adjacency_matrix[v].values())), None)
-                if not initial_vertex:
-                    return False
-                dfs(initial_vertex)
-
-                return all(v in visited for v in adjacency_matrix if any(adjacency_matrix[v].values()))
-
-            if not is_weakly_connected():
-                self.log_message("O grafo não é fraco-conectado. O grafo não é Euleriano.")
-                return False
-
-            self.log_message("O grafo é direcionado e fraco-conectado.")
-            return True
-
-        def is_undirected_eulerian():
-            self.log_message("Verificando se todos os vértices têm grau par...")
-
-            def is_connected():
-                self.log_message("Verificando se o grafo é conectado...")
-                visited = set()
-                def dfs(v):
-                    visited.add(v)
-                    for neighbor in adjacency_matrix[v]:
-                        if adjacency_matrix[v][neighbor] != 0 and neighbor not in visited:
-                            dfs(neighbor)
-
-                start_vertex = next((v for v in adjacency_matrix if any(adjacency_matrix[v].values())), None)
-                if not start_vertex:
-                    return False
-                dfs(start_vertex)
-
-                return all(v in visited for v in adjacency_matrix if any(adjacency_matrix[v].values()))
-
-            for v in adjacency_matrix:
-                degree = sum(1 for neighbor in adjacency_matrix[v] if adjacency_matrix[v][neighbor] != 0)
-                self.log_message(f"Vértice {v} tem grau {degree}.")
-                if degree % 2 != 0:
-                    self.log_message(f"Vértice {v} tem grau ímpar. O grafo não é Euleriano.")
-                    return False
-
-            if not is_connected():
-                self.log_message("O grafo não é conectado. O grafo não é Euleriano.")
-                return False
-
-            self.log_message("Todos os vértices têm grau par e o grafo é conectado.")
-            return True
-
-        def hierholzer_algorithm_directed():
-            self.log_message("Encontrando o ciclo Euleriano usando o Algoritmo de Hierholzer (Direcionado)...")
-
-            edges = {u: [v for v in adjacency_matrix[u] if adjacency_matrix[u][v] != 0] for u in adjacency_matrix}
-            cycle = []
-            stack = []
-            current = next(iter(edges))
-
-            while edges[current] or stack:
-                if not edges[current]:
-                    cycle.append(current)
-                    current = stack.pop()
-                else:
-                    stack.append(current)
-                    next_vertex = edges[current].pop()
-                    current = next_vertex
-
-            cycle.append(current)
-            return cycle
-
-        def hierholzer_algorithm():
-            self.log_message("Encontrando o ciclo Euleriano usando o Algoritmo de Hierholzer...")
-
-            edges = {u: [v for v in adjacency_matrix[u] if adjacency_matrix[u][v] != 0] for u in adjacency_matrix}
-            cycle = []
-            stack = []
-            current = next(iter(edges))
-
-            while edges[current] or stack:
-                if not edges[current]:
-                    cycle.append(current)
-                    current = stack.pop()
-                else:
-                    stack.append(current)
-                    next_vertex = edges[current].pop()
-                    edges[next_vertex].remove(current)
-                    current = next_vertex
-
-            cycle.append(current)
-            return cycle
-
-        if is_directed():
-            if is_directed_eulerian():
-                self.log_message("O grafo direcionado é Euleriano.")
-                cycle = hierholzer_algorithm_directed()
-                cycle_str = " -> ".join(cycle)
-                self.log_message(f"Ciclo Euleriano encontrado: {cycle_str}")
-                messagebox.showinfo("Grafo Euleriano", f"O grafo direcionado é Euleriano.\nCiclo Euleriano: {cycle_str}")
-            else:
-                self.log_message("O grafo direcionado não é Euleriano.")
-                messagebox.showerror("Não é Euleriano", "O grafo direcionado não é Euleriano.")
-        else:
-            eulerian = is_undirected_eulerian()
-            if eulerian:
-                self.log_message("O grafo não direcionado é Euleriano.")
-                cycle = hierholzer_algorithm()
-                cycle_str = " -> ".join(cycle)
-                self.log_message(f"Ciclo Euleriano encontrado: {cycle_str}")
-                messagebox.showinfo("Grafo Euleriano", f"O grafo não direcionado é Euleriano.\nCiclo Euleriano: {cycle_str}")
-            else:
-                self.log_message("O grafo não direcionado não é Euleriano.")
-                messagebox.showerror("Não é Euleriano", "O grafo não direcionado não é Euleriano.")
+        ui.show_result(check_eulerian(graph, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
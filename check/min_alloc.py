@@ -1,28 +1,51 @@
-import tkinter as tk 
-from scipy.optimize import linear_sum_assignment
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import assignment, cache, store, ui
+
+def find_minimum_allocation(graph, log):
+    problem = assignment.from_graph(graph)
+    if not problem.num_edges():
+        log("O grafo não possui arestas.")
+        return ("error", "Erro", "O grafo não possui arestas para alocar.")
+
+    if problem.bipartite:
+        log(f"Grafo bipartido: {len(problem.rows)} vértices de um lado e {len(problem.columns)} do outro.")
+    else:
+        log("O grafo não é bipartido; cada vértice será alocado a um de seus vizinhos.")
+    log(f"Resolvendo a alocação sobre {problem.num_edges()} arestas...")
+    result, blocked = assignment.solve(problem)
+    if result is None:
+        rows, columns = blocked
+        names = ", ".join(graph.name_of(v) for v in rows)
+        neighbors = ", ".join(graph.name_of(v) for v in columns) or "nenhum"
+        log(f"Os vértices {names} só alcançam {len(columns)} vizinhos: {neighbors}.")
+        return ("error", "Alocação Impossível", f"Não existe alocação completa: os vértices {names} têm apenas {len(columns)} vizinhos ({neighbors}).")
+
+    allocation = [f"{graph.name_of(u)} -> {graph.name_of(v)}" for u, v in result.matches]
+    log(f"Alocação mínima com custo {result.cost}:")
+    log("\n".join(allocation))
+    return ("info", "Alocação Mínima", f"Alocação mínima com custo {result.cost}:\n" + "\n".join(allocation))
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Gráficos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um gráfico para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um gráfico")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -34,79 +57,31 @@ class VerificationApp:
         tk.Button(self.root, text="Encontrar Alocação Mínima", command=self.find_minimum_allocation).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um gráfico" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um gráfico" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de gráfico válido.")
             return None
-        return self.graph_data[graph_name]
-
-    def make_undirected(self, adjacency_matrix):
-        self.log_message("Convertendo a matriz de adjacência para não direcionada...")
-        undirected_matrix = {}
-        for u in adjacency_matrix:
-            undirected_matrix[u] = {}
-            for v, weight in adjacency_matrix[u].items():
-                if weight > 0:
-                    undirected_matrix[u][v] = weight
-                    if v not in undirected_matrix:
-                        undirected_matrix[v] = {}
-                    undirected_matrix[v][u] = weight
-        self.log_message("Conversão concluída.")
-        return undirected_matrix
-
-    def convert_to_bipartite(self, adjacency_matrix):
-        self.log_message("Convertendo o grafo em um bipartido completo e ponderado...")
-        vertices = list(adjacency_matrix.keys())
-        mid_point = len(vertices) // 2
-
-        bipartite_matrix = {f'left_{v}': {} for v in vertices[:mid_point]}
-        bipartite_matrix.update({f'right_{v}': {} for v in vertices[mid_point:]})
-
-        for u in bipartite_matrix.keys():
-            for v in bipartite_matrix.keys():
-                if u != v:
-                    weight = adjacency_matrix.get(u.replace('left_', ''), {}).get(v.replace('right_', ''), 1)
-                    bipartite_matrix[u][v] = weight
-
-        self.log_message("Conversão concluída.")
-        return bipartite_matrix
+        return cache.load_graph(graph_name)
 
     def find_minimum_allocation(self):
+        import tkinter as tk
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando a busca pela alocação mínima...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        if not graph_info.get('has_weights', False):
-            self.log_message("Transformando em bipartido completo e ponderado.")
-            adjacency_matrix = self.convert_to_bipartite(graph_info['adjacency_matrix'])
-        else:
-            adjacency_matrix = self.make_undirected(graph_info['adjacency_matrix'])
-
-        cost_matrix = []
-        vertices = list(adjacency_matrix.keys())
-        self.log_message("Construindo a matriz de custo...")
-
-        for u in vertices:
-            cost_row = [adjacency_matrix[u].get(v, float('inf')) for v in vertices]
-            cost_matrix.append(cost_row)
-            self.log_message(f"Matriz de custo para {u}: {cost_row}")
-
-        row_ind, col_ind = linear_sum_assignment(cost_matrix)
-        min_cost = sum(cost_matrix[row][col] for row, col in zip(row_ind, col_ind))
-
-        allocation = [f"{vertices[row]} -> {vertices[col]}" for row, col in zip(row_ind, col_ind)]
-        self.log_message(f"Alocação mínima com custo {min_cost}:")
-        self.log_message("\n".join(allocation))
-        messagebox.showinfo("Alocação Mínima", f"Alocação mínima com custo {min_cost}:\n" + "\n".join(allocation))
+        ui.show_result(find_minimum_allocation(graph, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,28 +1,66 @@
-import tkinter as tk 
-from tkinter import messagebox
-import json
 import os
-from itertools import combinations
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, planarity, store, ui
+
+def check_planarity(graph, log, witness=False):
+    v = graph.num_vertices()
+    edges = planarity.simple_edges(graph)
+    e = len(edges)
+
+    log(f"Número de vértices: {v}, Número de arestas: {e}")
+
+    if v >= 3 and e > 3 * v - 6:
+        log("O grafo não é planar pela fórmula de Euler.")
+        if not witness:
+            return ("info", "Verificação de Planaridade", "O grafo não é planar: tem mais de 3V - 6 arestas.")
+
+    log("Executando o teste de planaridade esquerda-direita...")
+    embedding, kuratowski = planarity.test(graph, edges, witness)
+
+    if embedding:
+        log("O grafo é planar. Imersão combinatória (vizinhos em sentido horário):")
+        for vertex in range(v):
+            log(f"{graph.name_of(vertex)}: " + (", ".join(graph.names(embedding.clockwise(vertex))) or "(isolado)"))
+        return ("info", "Verificação de Planaridade", "O grafo é planar.")
+
+    if not kuratowski:
+        log("O grafo não é planar.")
+        return ("info", "Verificação de Planaridade", "O grafo não é planar.")
+
+    paths = [" -> ".join(graph.names(path)) for path in kuratowski.paths]
+    if kuratowski.kind == "K5":
+        description = "K5 com vértices principais " + ", ".join(graph.names(kuratowski.branch_vertices))
+    else:
+        left, right = kuratowski.parts()
+        description = "K3,3 com partes {" + ", ".join(graph.names(left)) + "} e {" + ", ".join(graph.names(right)) + "}"
+    log(f"O grafo contém uma subdivisão de {description}.")
+    log("Caminhos da subdivisão:\n" + "\n".join(paths))
+    log("O grafo não é planar devido a subgrafos proibidos.")
+    return ("info", "Verificação de Planaridade", f"O grafo contém uma subdivisão de {description}, então não é planar.\n" + "\n".join(paths))
+
+def find_kuratowski_subgraph(graph, log):
+    return check_planarity(graph, log, witness=True)
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -31,67 +69,46 @@ class VerificationApp:
         self.log_text = tk.Text(self.root, height=20, width=70)
         self.log_text.pack()
         
-        tk.Button(self.root, text="Verificar Planaridade", command=self.check_planarity).pack(pady=20)
+        tk.Button(self.root, text="Verificar Planaridade", command=self.check_planarity).pack(pady=10)
+        tk.Button(self.root, text="Encontrar Subgrafo de Kuratowski", command=self.find_kuratowski_subgraph).pack(pady=10)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_planarity(self):
+        import tkinter as tk
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando a verificação de planaridade...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-        vertices = list(adjacency_matrix.keys())
-        v = len(vertices)
-        e = sum(len([n for n in adjacency_matrix[vertex] if adjacency_matrix[vertex][n] != 0]) for vertex in vertices) // 2
+        ui.show_result(check_planarity(graph, self.log_message))
 
-        self.log_message(f"Número de vértices: {v}, Número de arestas: {e}")
+    def find_kuratowski_subgraph(self):
+        import tkinter as tk
+        self.log_text.delete(1.0, tk.END)
+        self.log_message("Procurando uma subdivisão de K5 ou K3,3...")
 
-        if e > 3 * v - 6:
-            self.log_message("O grafo não é planar pela fórmula de Euler.")
-            messagebox.showinfo("Verificação de Planaridade", "O grafo não é planar pela fórmula de Euler.")
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        def contains_k5_k33(graph):
-            self.log_message("Verificando se o grafo contém subgrafos homeomorfos a K5 ou K3,3...")
-            for comb in combinations(graph.keys(), 5):
-                subgraph = {v: set(n for n in graph[v] if n in comb) for v in comb}
-                if all(len(neighbors) == 4 for neighbors in subgraph.values()):
-                    self.log_message("O grafo contém um subgrafo homeomorfo a K5.")
-                    return True
-
-            for comb in combinations(graph.keys(), 6):
-                set1, set2 = comb[:3], comb[3:]
-                is_k33 = all(adjacency_matrix[v1][v2] != 0 for v1 in set1 for v2 in set2) and \
-                          all(adjacency_matrix[v1][v2] == 0 for v1 in set1 for v2 in set1) and \
-                          all(adjacency_matrix[v1][v2] == 0 for v1 in set2 for v2 in set2)
-                if is_k33:
-                    self.log_message("O grafo contém um subgrafo homeomorfo a K3,3.")
-                    return True
-
-            self.log_message("Nenhum subgrafo proibido encontrado.")
-            return False
-
-        if contains_k5_k33(adjacency_matrix):
-            self.log_message("O grafo não é planar devido a subgrafos proibidos.")
-            messagebox.showinfo("Verificação de Planaridade", "O grafo contém um subgrafo homeomorfo a K5 ou K3,3, então não é planar.")
-        else:
-            self.log_message("O grafo é planar.")
-            messagebox.showinfo("Verificação de Planaridade", "O grafo é planar.")
+        ui.show_result(find_kuratowski_subgraph(graph, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,27 +1,58 @@
-import tkinter as tk
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, properties, store, ui
+
+def check_if_undirected_and_connected(graph, log):
+    def is_undirected():
+        log("Verificando se o grafo é não direcionado...")
+        if graph.is_directed:
+            arc = properties.get(graph)["asymmetric_arc"]
+            if arc:
+                u, v = arc
+                log(f"Grafo é direcionado: {graph.name_of(u)} -> {graph.name_of(v)} diferente de {graph.name_of(v)} -> {graph.name_of(u)}.")
+            else:
+                log("Grafo é direcionado, com todos os arcos em pares simétricos.")
+            return False
+        log("O grafo é não direcionado.")
+        return True
+
+    def is_connected():
+        log("Verificando se o grafo está conexo...")
+        if properties.get(graph)["weak_component_count"] == 1:
+            log("O grafo é conexo.")
+            return True
+        else:
+            log("O grafo não é conexo.")
+            return False
+
+    if is_undirected():
+        if is_connected():
+            return ("info", "Verificação do Grafo", "O grafo é não direcionado e conexo.")
+        else:
+            return ("info", "Verificação do Grafo", "O grafo é não direcionado, mas não é conexo.")
+    else:
+        return ("info", "Verificação do Grafo", "O grafo é direcionado.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,65 +64,31 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar se o Grafo é Não Direcionado e conexo", command=self.check_if_undirected_and_connected).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_if_undirected_and_connected(self):
+        import tkinter as tk
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando a verificação se o grafo é não direcionado e conexo...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
-        def is_undirected():
-            self.log_message("Verificando se o grafo é não direcionado...")
-            for u in adjacency_matrix:
-                for v in adjacency_matrix[u]:
-                    if adjacency_matrix[u][v] != adjacency_matrix[v].get(u, 0):
-                        self.log_message(f"Grafo é direcionado: {u} -> {v} diferente de {v} -> {u}.")
-                        return False
-            self.log_message("O grafo é não direcionado.")
-            return True
-
-        def is_connected():
-            self.log_message("Verificando se o grafo está conexo...")
-            visited = set()
-
-            def dfs(v):
-                visited.add(v)
-                for neighbor in adjacency_matrix[v]:
-                    if adjacency_matrix[v][neighbor] != 0 and neighbor not in visited:
-                        dfs(neighbor)
-
-            initial_vertex = next(iter(adjacency_matrix))
-            dfs(initial_vertex)
-
-            if len(visited) == len(adjacency_matrix):
-                self.log_message("O grafo é conexo.")
-                return True
-            else:
-                self.log_message("O grafo não é conexo.")
-                return False
-
-        if is_undirected():
-            if is_connected():
-                messagebox.showinfo("Verificação do Grafo", "O grafo é não direcionado e conexo.")
-            else:
-                messagebox.showinfo("Verificação do Grafo", "O grafo é não direcionado, mas não é conexo.")
-        else:
-            messagebox.showinfo("Verificação do Grafo", "O grafo é direcionado.")
+        ui.show_result(check_if_undirected_and_connected(graph, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -0,0 +1,143 @@
+import argparse
+import heapq
+import os
+
+from core import npstore, paths, properties, store
+
+DEFAULT_LANDMARKS = 8
+FROM_FILE = "alt_from.npy"
+TO_FILE = "alt_to.npy"
+META_FILE = "alt.json"
+
+class LandmarkIndex:
+    def __init__(self, landmarks, from_landmarks, to_landmarks):
+        self.landmarks = landmarks
+        self.from_landmarks = from_landmarks
+        self.to_landmarks = to_landmarks
+
+    def lower_bounds(self, target):
+        return LowerBounds(self, target)
+
+class LowerBounds:
+    def __init__(self, index, target):
+        self.index = index
+        self.from_target = index.from_landmarks[:, target].tolist()
+        self.to_target = index.to_landmarks[:, target].tolist()
+        self.bounds = {}
+
+    def __getitem__(self, v):
+        bound = self.bounds.get(v)
+        if bound is not None:
+            return bound
+        bound = 0
+        from_v = self.index.from_landmarks[:, v].tolist()
+        to_v = self.index.to_landmarks[:, v].tolist()
+        for from_target, from_vertex, to_target, to_vertex in zip(self.from_target, from_v, self.to_target, to_v):
+            if from_target != paths.INF and from_vertex != paths.INF and from_target - from_vertex > bound:
+                bound = from_target - from_vertex
+            if to_target != paths.INF and to_vertex - to_target > bound:
+                bound = to_vertex - to_target
+        self.bounds[v] = bound
+        return bound
+
+def select_landmarks(graph, count):
+    import numpy as np
+    n = graph.num_vertices()
+    count = min(count, n)
+    landmarks = []
+    from_rows = []
+    to_rows = []
+    nearest = np.full(n, np.inf)
+
+    candidate = int(np.argmax(paths.dijkstra(graph, 0).costs)) if n else 0
+    for _ in range(count):
+        landmarks.append(candidate)
+        from_rows.append(paths.dijkstra(graph, candidate).costs)
+        to_rows.append(paths.dijkstra(graph, candidate, reverse=True).costs)
+        nearest = np.minimum(nearest, np.minimum(from_rows[-1], to_rows[-1]))
+        nearest[landmarks] = -1
+        candidate = int(np.argmax(nearest))
+
+    return LandmarkIndex(landmarks, np.array(from_rows).reshape(len(landmarks), n), np.array(to_rows).reshape(len(landmarks), n))
+
+def astar(graph, source, target, index, log=None):
+    n = graph.num_vertices()
+    offsets = graph.out_offsets
+    targets = graph.out_targets
+    weights = graph.out_weights
+    bounds = index.lower_bounds(target)
+
+    costs = [paths.INF] * n
+    predecessors = [None] * n
+    settled = bytearray(n)
+    costs[source] = 0
+    heap = [(bounds[source], source)]
+
+    while heap:
+        estimate, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        cost = costs[u]
+        if log:
+            log(f"Visitando {graph.name_of(u)} com custo atual {cost}")
+        if u == target:
+            break
+
+        start, end = int(offsets[u]), int(offsets[u + 1])
+        for v, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            if weight > 0 and not settled[v] and bounds[v] != paths.INF:
+                new_cost = cost + weight
+                if new_cost < costs[v]:
+                    costs[v] = new_cost
+                    predecessors[v] = u
+                    heapq.heappush(heap, (new_cost + bounds[v], v))
+                    if log:
+                        log(f"Atualizando custo de {graph.name_of(v)} para {new_cost} (predecessor: {graph.name_of(u)})")
+
+    return paths.ShortestPathTree(graph, source, costs, predecessors, False)
+
+def build(name, count=DEFAULT_LANDMARKS):
+    graph = store.load_graph(name)
+    min_weight = properties.get(graph)["min_weight"]
+    if min_weight is not None and min_weight < 0:
+        raise ValueError("Marcos ALT exigem pesos não negativos.")
+
+    index = select_landmarks(graph, count)
+    os.makedirs(graph.directory, exist_ok=True)
+    meta_path = os.path.join(graph.directory, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    npstore.save_array(os.path.join(graph.directory, FROM_FILE), index.from_landmarks)
+    npstore.save_array(os.path.join(graph.directory, TO_FILE), index.to_landmarks)
+    npstore.save_meta(meta_path, {"version": properties.get(graph)["version"], "landmarks": index.landmarks})
+    return index
+
+def load(graph):
+    index = getattr(graph, "_landmark_index", None)
+    if index is not None:
+        return index
+    directory = getattr(graph, "directory", None)
+    if not directory or not npstore.available():
+        return None
+
+    meta = npstore.load_meta(os.path.join(directory, META_FILE))
+    if meta is None or meta.get("version") != properties.get(graph)["version"]:
+        return None
+
+    import numpy as np
+    graph._landmark_index = LandmarkIndex(
+        meta["landmarks"],
+        np.load(os.path.join(directory, FROM_FILE), mmap_mode="r"),
+        np.load(os.path.join(directory, TO_FILE), mmap_mode="r"),
+    )
+    return graph._landmark_index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-calcula marcos (ALT) para buscas A* de menor custo em um grafo.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("--landmarks", type=int, default=DEFAULT_LANDMARKS, help="quantidade de marcos")
+    args = parser.parse_args()
+
+    index = build(args.grafo, args.landmarks)
+    print(f"{len(index.landmarks)} marcos gerados para '{args.grafo}'.")
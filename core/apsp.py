@@ -0,0 +1,182 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core import npstore, paths, properties, store
+
+METRICS = ("hops", "cost")
+DENSE_RATIO = 0.25
+POOL_MIN_VERTICES = 256
+
+_worker_graph = None
+
+class DistanceMatrix:
+    def __init__(self, graph, metric, distances, next_hops, integral):
+        self.graph = graph
+        self.metric = metric
+        self.distances = distances
+        self.next_hops = next_hops
+        self.integral = integral
+
+    def reached(self, u, v):
+        return self.next_hops[u, v] != -1
+
+    def distance(self, u, v):
+        distance = float(self.distances[u, v])
+        return int(distance) if self.integral and distance != paths.INF else distance
+
+    def path(self, u, v):
+        if not self.reached(u, v):
+            return None
+        path = [u]
+        while u != v:
+            u = int(self.next_hops[u, v])
+            path.append(u)
+        return path
+
+def _integral(graph, metric):
+    if metric == "hops":
+        return True
+    weights = graph.out_weights
+    return getattr(weights, "typecode", None) == "q" or getattr(getattr(weights, "dtype", None), "kind", None) in ("i", "u")
+
+def _files(directory, metric):
+    base = os.path.join(directory, f"apsp_{metric}")
+    return base + ".dist.npy", base + ".next.npy", base + ".json"
+
+def floyd_warshall(graph, metric):
+    import numpy as np
+    n = graph.num_vertices()
+    distances = np.full((n, n), np.inf)
+    next_hops = np.full((n, n), -1, dtype=np.int32)
+    for u, v, weight in graph.arcs():
+        distances[u, v] = 1 if metric == "hops" else weight
+        next_hops[u, v] = v
+    for v in range(n):
+        if distances[v, v] < 0:
+            raise ValueError(f"O grafo tem um ciclo negativo em {graph.name_of(v)}.")
+        distances[v, v] = 0
+        next_hops[v, v] = v
+
+    for k in range(n):
+        through = distances[:, k, None] + distances[None, k, :]
+        better = through < distances
+        np.copyto(distances, through, where=better)
+        np.copyto(next_hops, np.broadcast_to(next_hops[:, k, None], (n, n)), where=better)
+
+    if (np.diagonal(distances) < 0).any():
+        v = int(np.argmin(np.diagonal(distances)))
+        raise ValueError(f"O grafo tem um ciclo negativo passando por {graph.name_of(v)}.")
+    return distances, next_hops
+
+def _init_worker(graph):
+    global _worker_graph
+    _worker_graph = graph
+
+def _rows(metric, sources):
+    import numpy as np
+    graph = _worker_graph
+    n = graph.num_vertices()
+    distances = np.empty((len(sources), n))
+    next_hops = np.empty((len(sources), n), dtype=np.int32)
+
+    vertices = np.arange(n)
+    for i, source in enumerate(sources):
+        tree = paths.bfs_tree(graph, source) if metric == "hops" else paths.dijkstra(graph, source)
+        predecessors = np.array([-1 if p is None else p for p in tree.predecessors])
+        unreached = predecessors == -1
+        first = np.where((predecessors == source) | unreached, vertices, predecessors)
+        while True:
+            jumped = first[first]
+            if (jumped == first).all():
+                break
+            first = jumped
+        first[unreached] = -1
+        first[source] = source
+        distances[i] = tree.costs
+        next_hops[i] = first
+    return sources[0], distances, next_hops
+
+def repeated_search(graph, metric, workers=None):
+    import numpy as np
+    n = graph.num_vertices()
+    distances = np.empty((n, n))
+    next_hops = np.empty((n, n), dtype=np.int32)
+
+    if workers == 1 or n < POOL_MIN_VERTICES:
+        _init_worker(graph)
+        results = [_rows(metric, list(range(n)))]
+    else:
+        workers = workers or os.cpu_count() or 1
+        chunk = max(1, n // (workers * 4))
+        chunks = [list(range(start, min(n, start + chunk))) for start in range(0, n, chunk)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(graph,)) as pool:
+            results = list(pool.map(partial(_rows, metric), chunks))
+
+    for first_source, rows, hops in results:
+        distances[first_source:first_source + len(rows)] = rows
+        next_hops[first_source:first_source + len(rows)] = hops
+    return distances, next_hops
+
+def compute(graph, metric, workers=None):
+    if metric not in METRICS:
+        raise ValueError(f"Métrica desconhecida: {metric}")
+    n = graph.num_vertices()
+    min_weight = properties.get(graph)["min_weight"]
+    if metric == "cost" and min_weight is not None and min_weight < 0:
+        return "floyd_warshall", floyd_warshall(graph, metric)
+    if graph.num_arcs() >= DENSE_RATIO * n * n:
+        return "floyd_warshall", floyd_warshall(graph, metric)
+    return "repeated_search", repeated_search(graph, metric, workers)
+
+def build(name, metric="hops", workers=None):
+    graph = store.load_graph(name)
+    method, (distances, next_hops) = compute(graph, metric, workers)
+
+    directory = graph.directory
+    os.makedirs(directory, exist_ok=True)
+    dist_path, next_path, meta_path = _files(directory, metric)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+    npstore.save_array(dist_path, distances)
+    npstore.save_array(next_path, next_hops)
+
+    meta = {"version": properties.get(graph)["version"], "metric": metric, "method": method}
+    npstore.save_meta(meta_path, meta)
+    return meta
+
+def load(graph, metric):
+    matrices = getattr(graph, "_distance_matrices", None)
+    if matrices is None:
+        matrices = graph._distance_matrices = {}
+    if metric in matrices:
+        return matrices[metric]
+    directory = getattr(graph, "directory", None)
+    if not directory or not npstore.available():
+        return None
+
+    dist_path, next_path, meta_path = _files(directory, metric)
+    meta = npstore.load_meta(meta_path)
+    if meta is None or meta.get("version") != properties.get(graph)["version"]:
+        return None
+
+    import numpy as np
+    matrices[metric] = DistanceMatrix(
+        graph,
+        metric,
+        np.load(dist_path, mmap_mode="r"),
+        np.load(next_path, mmap_mode="r"),
+        _integral(graph, metric),
+    )
+    return matrices[metric]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-calcula as distâncias entre todos os pares de vértices de um grafo.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("--metric", choices=METRICS, default="hops", help="hops (número de arestas) ou cost (soma dos pesos)")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    meta = build(args.grafo, args.metric, args.workers)
+    print(f"Matriz de distâncias ({args.metric}) de '{args.grafo}' gerada por {meta['method']}.")
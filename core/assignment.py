@@ -0,0 +1,177 @@
+import heapq
+from collections import deque
+
+from core import paths, properties
+
+AUGMENTING_ROW_REDUCTIONS = 2
+
+class AssignmentProblem:
+    def __init__(self, graph, rows, columns, costs, bipartite):
+        self.graph = graph
+        self.rows = rows
+        self.columns = columns
+        self.costs = costs
+        self.bipartite = bipartite
+
+    def num_edges(self):
+        return sum(len(row) for row in self.costs)
+
+class Assignment:
+    def __init__(self, problem, matches, cost):
+        self.problem = problem
+        self.matches = matches
+        self.cost = cost
+
+def from_graph(graph):
+    n = graph.num_vertices()
+    colors = properties.bipartition(graph)
+    if colors is None:
+        rows = columns = list(range(n))
+    else:
+        labels, count = properties.weak_components(graph)
+        sides = [[0, 0] for _ in range(count)]
+        for v in range(n):
+            sides[labels[v]][colors[v]] += 1
+        row_color = [int(zeros > ones) for zeros, ones in sides]
+        rows = [v for v in range(n) if colors[v] == row_color[labels[v]]]
+        columns = [v for v in range(n) if colors[v] != row_color[labels[v]]]
+
+    row_index = [-1] * n
+    column_index = [-1] * n
+    for i, v in enumerate(rows):
+        row_index[v] = i
+    for j, v in enumerate(columns):
+        column_index[v] = j
+
+    best = [{} for _ in rows]
+    for u, v, weight in graph.arcs():
+        if u == v:
+            continue
+        for a, b in ((u, v), (v, u)):
+            i, j = row_index[a], column_index[b]
+            if i != -1 and j != -1 and weight < best[i].get(j, paths.INF):
+                best[i][j] = weight
+    return AssignmentProblem(graph, rows, columns, [list(row.items()) for row in best], colors is not None)
+
+def solve(problem):
+    costs = problem.costs
+    n_rows, n_columns = len(costs), len(problem.columns)
+    row_match = [-1] * n_rows
+    row_cost = [0] * n_rows
+    column_match = [-1] * n_columns
+    column_potential = [0] * n_columns
+
+    for r, edges in enumerate(costs):
+        if not edges:
+            return None, ([problem.rows[r]], [])
+        cost, c = min((cost, c) for c, cost in edges)
+        if column_match[c] == -1:
+            row_match[r], row_cost[r] = c, cost
+            column_match[c] = r
+
+    free_rows = [r for r in range(n_rows) if row_match[r] == -1]
+    for _ in range(AUGMENTING_ROW_REDUCTIONS):
+        pending = deque(free_rows)
+        free_rows = []
+        evictions = problem.num_edges()
+        while pending:
+            r = pending.popleft()
+            first, second = paths.INF, paths.INF
+            first_column = second_column = -1
+            first_cost = second_cost = 0
+            for c, cost in costs[r]:
+                reduced = cost - column_potential[c]
+                if reduced < second:
+                    if reduced < first:
+                        second, second_column, second_cost = first, first_column, first_cost
+                        first, first_column, first_cost = reduced, c, cost
+                    else:
+                        second, second_column, second_cost = reduced, c, cost
+
+            owner = column_match[first_column]
+            if second == paths.INF:
+                if owner != -1:
+                    free_rows.append(r)
+                    continue
+            elif first < second:
+                column_potential[first_column] -= second - first
+            elif owner != -1 and column_match[second_column] == -1:
+                first_column, first_cost, owner = second_column, second_cost, -1
+
+            row_match[r] = first_column
+            row_cost[r] = first_cost
+            column_match[first_column] = r
+            if owner != -1:
+                row_match[owner] = -1
+                if first < second and evictions:
+                    evictions -= 1
+                    pending.appendleft(owner)
+                else:
+                    free_rows.append(owner)
+
+    distances = [paths.INF] * n_columns
+    predecessors = [-1] * n_columns
+    predecessor_costs = [0] * n_columns
+    done = [False] * n_columns
+    for r in free_rows:
+        touched = []
+        heap = []
+        for c, cost in costs[r]:
+            distance = cost - column_potential[c]
+            if distance < distances[c]:
+                if distances[c] == paths.INF:
+                    touched.append(c)
+                distances[c] = distance
+                predecessors[c] = r
+                predecessor_costs[c] = cost
+                heapq.heappush(heap, (distance, c))
+
+        free = -1
+        settled = []
+        while heap:
+            distance, c = heapq.heappop(heap)
+            if done[c]:
+                continue
+            done[c] = True
+            settled.append(c)
+            x = column_match[c]
+            if x == -1:
+                free = c
+                break
+            base = distance - row_cost[x] + column_potential[c]
+            for c2, cost in costs[x]:
+                new_distance = base + cost - column_potential[c2]
+                if new_distance < distances[c2] and not done[c2]:
+                    if distances[c2] == paths.INF:
+                        touched.append(c2)
+                    distances[c2] = new_distance
+                    predecessors[c2] = x
+                    predecessor_costs[c2] = cost
+                    heapq.heappush(heap, (new_distance, c2))
+
+        for c in settled:
+            done[c] = False
+        if free == -1:
+            for c in touched:
+                distances[c] = paths.INF
+            blocked = [problem.rows[r]] + [problem.rows[column_match[c]] for c in settled]
+            return None, (blocked, [problem.columns[c] for c in settled])
+
+        shortest = distances[free]
+        for c in settled:
+            column_potential[c] -= shortest - distances[c]
+        c = free
+        while True:
+            x = predecessors[c]
+            previous = row_match[x]
+            row_match[x] = c
+            column_match[c] = x
+            row_cost[x] = predecessor_costs[c]
+            if previous == -1:
+                break
+            c = previous
+        for c in touched:
+            distances[c] = paths.INF
+
+    matches = [(problem.rows[r], problem.columns[row_match[r]]) for r in range(n_rows)]
+    return Assignment(problem, matches, sum(row_cost)), None
@@ -0,0 +1,35 @@
+import os
+import threading
+
+from core import store
+
+_lock = threading.Lock()
+_graphs = {}
+_stamp = None
+
+def _library_stamp():
+    stamp = []
+    for path in (store.CATALOG_PATH, store.JOURNAL_PATH):
+        if os.path.exists(path):
+            info = os.stat(path)
+            stamp.append((info.st_mtime_ns, info.st_size))
+        else:
+            stamp.append(None)
+    return tuple(stamp)
+
+def load_graph(name):
+    global _stamp
+    with _lock:
+        stamp = _library_stamp()
+        if stamp != _stamp:
+            _graphs.clear()
+            _stamp = stamp
+        if name not in _graphs:
+            _graphs[name] = store.load_graph(name)
+        return _graphs[name]
+
+def clear():
+    global _stamp
+    with _lock:
+        _graphs.clear()
+        _stamp = None
@@ -0,0 +1,272 @@
+import argparse
+import heapq
+import os
+import threading
+from bisect import bisect_left
+
+from core import npstore, paths, properties, store
+
+WITNESS_SETTLE_LIMIT = 200
+META_FILE = "ch.json"
+ARRAY_NAMES = ("rank", "up_offsets", "up_targets", "up_weights", "up_middles", "down_offsets", "down_sources", "down_weights", "down_middles")
+
+_lock = threading.Lock()
+_rebuilding = set()
+_pending = set()
+
+class Hierarchy:
+    def __init__(self, rank, up_offsets, up_targets, up_weights, up_middles, down_offsets, down_sources, down_weights, down_middles):
+        self.rank = rank
+        self.up_offsets = up_offsets
+        self.up_targets = up_targets
+        self.up_weights = up_weights
+        self.up_middles = up_middles
+        self.down_offsets = down_offsets
+        self.down_sources = down_sources
+        self.down_weights = down_weights
+        self.down_middles = down_middles
+
+    def up_edges(self, u):
+        start, end = int(self.up_offsets[u]), int(self.up_offsets[u + 1])
+        return zip(self.up_targets[start:end].tolist(), self.up_weights[start:end].tolist())
+
+    def down_edges(self, v):
+        start, end = int(self.down_offsets[v]), int(self.down_offsets[v + 1])
+        return zip(self.down_sources[start:end].tolist(), self.down_weights[start:end].tolist())
+
+    def middle(self, u, v):
+        if self.rank[u] < self.rank[v]:
+            offsets, others, middles, row, other = self.up_offsets, self.up_targets, self.up_middles, u, v
+        else:
+            offsets, others, middles, row, other = self.down_offsets, self.down_sources, self.down_middles, v, u
+        start, end = int(offsets[row]), int(offsets[row + 1])
+        return int(middles[bisect_left(others, other, start, end)])
+
+    def unpack(self, u, v):
+        path = [u]
+        stack = [v]
+        while stack:
+            target = stack[-1]
+            middle = self.middle(path[-1], target)
+            if middle == -1:
+                path.append(stack.pop())
+            else:
+                stack.append(middle)
+        return path
+
+    def query(self, source, target):
+        if source == target:
+            return [source], 0
+
+        costs = ({source: 0}, {target: 0})
+        parents = ({source: None}, {target: None})
+        heaps = ([(0, source)], [(0, target)])
+        edges = (self.up_edges, self.down_edges)
+        best, meet = paths.INF, None
+
+        while True:
+            forward = heaps[0][0][0] if heaps[0] and heaps[0][0][0] < best else None
+            backward = heaps[1][0][0] if heaps[1] and heaps[1][0][0] < best else None
+            if forward is None and backward is None:
+                break
+            side = 0 if backward is None or (forward is not None and forward <= backward) else 1
+            cost, u = heapq.heappop(heaps[side])
+            if cost > costs[side][u]:
+                continue
+            other = costs[1 - side].get(u)
+            if other is not None and cost + other < best:
+                best, meet = cost + other, u
+            if any(costs[side].get(w, paths.INF) + weight < cost for w, weight in edges[1 - side](u)):
+                continue
+            for v, weight in edges[side](u):
+                new_cost = cost + weight
+                if new_cost < costs[side].get(v, paths.INF):
+                    costs[side][v] = new_cost
+                    parents[side][v] = u
+                    heapq.heappush(heaps[side], (new_cost, v))
+
+        if meet is None:
+            return None, paths.INF
+
+        chain = [meet]
+        while parents[0][chain[-1]] is not None:
+            chain.append(parents[0][chain[-1]])
+        chain.reverse()
+        while parents[1][chain[-1]] is not None:
+            chain.append(parents[1][chain[-1]])
+
+        path = [source]
+        for u, v in zip(chain, chain[1:]):
+            path.extend(self.unpack(u, v)[1:])
+        return path, best
+
+def _witness_costs(out_arcs, source, skip, limit, targets):
+    costs = {source: 0}
+    heap = [(0, source)]
+    remaining = len(targets)
+    settled = 0
+    while heap and remaining and settled < WITNESS_SETTLE_LIMIT:
+        cost, u = heapq.heappop(heap)
+        if cost > costs[u]:
+            continue
+        if cost > limit:
+            break
+        settled += 1
+        if u in targets:
+            remaining -= 1
+        for v, (weight, middle) in out_arcs[u].items():
+            if v == skip:
+                continue
+            new_cost = cost + weight
+            if new_cost < costs.get(v, paths.INF):
+                costs[v] = new_cost
+                heapq.heappush(heap, (new_cost, v))
+    return costs
+
+def _shortcuts(out_arcs, in_arcs, v):
+    shortcuts = []
+    for u, weight_in in in_arcs[v].items():
+        targets = {w: weight_in + weight_out for w, (weight_out, middle) in out_arcs[v].items() if w != u}
+        if not targets:
+            continue
+        witness = _witness_costs(out_arcs, u, v, max(targets.values()), targets)
+        for w, cost in targets.items():
+            if witness.get(w, paths.INF) > cost:
+                shortcuts.append((u, w, cost))
+    return shortcuts
+
+def contract(graph):
+    n = graph.num_vertices()
+    out_arcs = [{} for _ in range(n)]
+    in_arcs = [{} for _ in range(n)]
+    for u, v, weight in graph.arcs():
+        if weight > 0 and u != v:
+            out_arcs[u][v] = (weight, -1)
+            in_arcs[v][u] = weight
+
+    contracted_neighbors = [0] * n
+
+    def priority(v, shortcuts):
+        return len(shortcuts) - len(out_arcs[v]) - len(in_arcs[v]) + contracted_neighbors[v]
+
+    heap = [(priority(v, _shortcuts(out_arcs, in_arcs, v)), v) for v in range(n)]
+    heapq.heapify(heap)
+    rank = [0] * n
+    up = [None] * n
+    down = [None] * n
+    order = 0
+
+    while heap:
+        _, v = heapq.heappop(heap)
+        shortcuts = _shortcuts(out_arcs, in_arcs, v)
+        current = priority(v, shortcuts)
+        if heap and current > heap[0][0]:
+            heapq.heappush(heap, (current, v))
+            continue
+
+        for u, w, cost in shortcuts:
+            if cost < out_arcs[u].get(w, (paths.INF, -1))[0]:
+                out_arcs[u][w] = (cost, v)
+                in_arcs[w][u] = cost
+
+        rank[v] = order
+        order += 1
+        up[v] = sorted((w, weight, middle) for w, (weight, middle) in out_arcs[v].items())
+        down[v] = sorted((u, weight, out_arcs[u][v][1]) for u, weight in in_arcs[v].items())
+        for w in out_arcs[v]:
+            del in_arcs[w][v]
+            contracted_neighbors[w] += 1
+        for u in in_arcs[v]:
+            del out_arcs[u][v]
+            contracted_neighbors[u] += 1
+        out_arcs[v] = {}
+        in_arcs[v] = {}
+
+    return rank, up, down
+
+def build_hierarchy(graph):
+    import numpy as np
+    rank, up, down = contract(graph)
+
+    def csr(rows):
+        offsets = np.zeros(len(rows) + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum([len(row) for row in rows])
+        flat = [arc for row in rows for arc in row]
+        ids = np.array([arc[0] for arc in flat], dtype=np.int64)
+        weights = np.array([arc[1] for arc in flat])
+        middles = np.array([arc[2] for arc in flat], dtype=np.int64)
+        return offsets, ids, weights, middles
+
+    return Hierarchy(np.array(rank, dtype=np.int64), *csr(up), *csr(down))
+
+def build(name):
+    graph = store.load_graph(name)
+    min_weight = properties.get(graph)["min_weight"]
+    if min_weight is not None and min_weight < 0:
+        raise ValueError("Hierarquias de contração exigem pesos não negativos.")
+
+    hierarchy = build_hierarchy(graph)
+    os.makedirs(graph.directory, exist_ok=True)
+    meta_path = os.path.join(graph.directory, META_FILE)
+    npstore.save_meta(meta_path, {"version": None})
+    for array_name in ARRAY_NAMES:
+        npstore.save_array(os.path.join(graph.directory, f"ch_{array_name}.npy"), getattr(hierarchy, array_name))
+    npstore.save_meta(meta_path, {"version": properties.get(graph)["version"]})
+    return hierarchy
+
+def schedule_rebuild(name, directory):
+    if not os.path.exists(os.path.join(directory, META_FILE)):
+        return False
+    with _lock:
+        if name in _rebuilding:
+            _pending.add(name)
+            return True
+        _rebuilding.add(name)
+    threading.Thread(target=_rebuild, args=(name,), daemon=True).start()
+    return True
+
+def _rebuild(name):
+    try:
+        while True:
+            try:
+                build(name)
+            except (KeyError, ValueError):
+                pass
+            with _lock:
+                if name not in _pending:
+                    _rebuilding.discard(name)
+                    return
+                _pending.discard(name)
+    except BaseException:
+        with _lock:
+            _rebuilding.discard(name)
+            _pending.discard(name)
+        raise
+
+def rebuilding(name):
+    with _lock:
+        return name in _rebuilding
+
+def load(graph):
+    hierarchy = getattr(graph, "_hierarchy", None)
+    if hierarchy is not None:
+        return hierarchy
+    directory = getattr(graph, "directory", None)
+    if not directory or not npstore.available():
+        return None
+
+    meta = npstore.load_meta(os.path.join(directory, META_FILE))
+    if meta is None or meta.get("version") != properties.get(graph)["version"]:
+        return None
+
+    import numpy as np
+    graph._hierarchy = Hierarchy(*[np.load(os.path.join(directory, f"ch_{array_name}.npy"), mmap_mode="r") for array_name in ARRAY_NAMES])
+    return graph._hierarchy
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pré-calcula hierarquias de contração para consultas de menor custo em um grafo.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    args = parser.parse_args()
+
+    build(args.grafo)
+    print(f"Hierarquia de contração gerada para '{args.grafo}'.")
@@ -0,0 +1,164 @@
+import argparse
+import time
+
+from core import scc, store
+
+MAX_CYCLES = 1000
+TIME_LIMIT = 10
+
+class CycleSearch:
+    def __init__(self, graph, max_cycles=None, max_length=None, time_limit=None, undirected=False):
+        self.graph = graph
+        self.max_cycles = max_cycles
+        self.max_length = max_length
+        self.time_limit = time_limit
+        self.undirected = undirected
+        self.found = 0
+        self.stopped = None
+
+    def __iter__(self):
+        return self._cycles()
+
+    def _keep(self, cycle):
+        if not self.undirected or len(cycle) == 1:
+            return True
+        return len(cycle) > 2 and cycle[1] < cycle[-1]
+
+    def _cycles(self):
+        deadline = None if self.time_limit is None else time.monotonic() + self.time_limit
+        labels, count = scc.tarjan(self.graph)
+        components = []
+        for component in scc.members(labels, count):
+            for v in component:
+                if self.graph.has_edge(v, v):
+                    self.found += 1
+                    yield [v]
+                    if self.found == self.max_cycles:
+                        self.stopped = "count"
+                        return
+            if len(component) > 1:
+                components.append(component)
+
+        while components:
+            component = components.pop()
+            allowed = set(component)
+            adjacency = {v: [w for w in self.graph.out_neighbors(v) if w in allowed and w != v] for v in component}
+            starts = [min(component)] if self.max_length is None else sorted(component)
+            for start in starts:
+                if self.max_length is None:
+                    search = self._johnson(adjacency, start, deadline)
+                else:
+                    search = self._bounded(adjacency, start, deadline)
+                for cycle in search:
+                    if not self._keep(cycle):
+                        continue
+                    self.found += 1
+                    yield cycle
+                    if self.found == self.max_cycles:
+                        self.stopped = "count"
+                        return
+                if self.stopped:
+                    return
+                del adjacency[start]
+
+            if self.max_length is None:
+                components.extend(c for c in scc.subgraph_components(adjacency) if len(c) > 1)
+
+    def _expired(self, deadline):
+        if deadline is not None and time.monotonic() > deadline:
+            self.stopped = "time"
+            return True
+        return False
+
+    def _johnson(self, adjacency, start, deadline):
+        path = [start]
+        blocked = {start}
+        blocking = {}
+        stack = [iter(adjacency[start])]
+        closed = [False]
+        while stack:
+            if self._expired(deadline):
+                return
+            for w in stack[-1]:
+                if self.undirected and len(path) > 1 and w == path[-2]:
+                    continue
+                if w == start:
+                    yield path[:]
+                    closed[-1] = True
+                elif w not in blocked and w in adjacency:
+                    path.append(w)
+                    closed.append(False)
+                    stack.append(iter(adjacency[w]))
+                    blocked.add(w)
+                    break
+            else:
+                stack.pop()
+                v = path.pop()
+                if closed.pop():
+                    if closed:
+                        closed[-1] = True
+                    pending = {v}
+                    while pending:
+                        u = pending.pop()
+                        if u in blocked:
+                            blocked.remove(u)
+                            pending.update(blocking.pop(u, ()))
+                else:
+                    for w in adjacency[v]:
+                        blocking.setdefault(w, set()).add(v)
+
+    def _bounded(self, adjacency, start, deadline):
+        limit = self.max_length
+        path = [start]
+        lock = {start: 0}
+        blocking = {}
+        stack = [iter(adjacency[start])]
+        lengths = [limit]
+        while stack:
+            if self._expired(deadline):
+                return
+            for w in stack[-1]:
+                if self.undirected and len(path) > 1 and w == path[-2]:
+                    continue
+                if w == start:
+                    yield path[:]
+                    lengths[-1] = 1
+                elif w in adjacency and len(path) < lock.get(w, limit):
+                    path.append(w)
+                    lengths.append(limit)
+                    lock[w] = len(path)
+                    stack.append(iter(adjacency[w]))
+                    break
+            else:
+                stack.pop()
+                v = path.pop()
+                length = lengths.pop()
+                if lengths:
+                    lengths[-1] = min(lengths[-1], length)
+                if length < limit:
+                    relax = [(length, v)]
+                    while relax:
+                        length, u = relax.pop()
+                        if lock.get(u, limit) < limit - length + 1:
+                            lock[u] = limit - length + 1
+                            relax.extend((length + 1, w) for w in blocking.get(u, ()) if w not in path)
+                else:
+                    for w in adjacency[v]:
+                        blocking.setdefault(w, set()).add(v)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lista os ciclos elementares de um grafo (algoritmo de Johnson por componente fortemente conexo).")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("--max", type=int, default=None, help="número máximo de ciclos")
+    parser.add_argument("--length", type=int, default=None, help="comprimento máximo de cada ciclo")
+    parser.add_argument("--time", type=float, default=None, help="tempo máximo em segundos")
+    args = parser.parse_args()
+
+    graph = store.load_graph(args.grafo)
+    undirected = not graph.is_directed
+    search = CycleSearch(graph, args.max, args.length, args.time, undirected)
+    for cycle in search:
+        names = graph.names(cycle)
+        print(" -> ".join(names + names[:1]))
+    reason = {"count": "limite de ciclos atingido", "time": "tempo esgotado"}.get(search.stopped, "busca completa")
+    print(f"{search.found} ciclo(s) ({reason}).")
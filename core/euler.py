@@ -0,0 +1,158 @@
+import argparse
+import os
+from array import array
+
+from core import npstore, store
+
+class EulerWalk:
+    def __init__(self, graph, directed, start, end):
+        self.graph = graph
+        self.directed = directed
+        self.start = start
+        self.end = end
+        self.edges_used = 0
+        if directed:
+            self.num_edges = graph.num_arcs()
+        else:
+            self.sources, self.targets = undirected_edges(graph)
+            self.num_edges = len(self.sources)
+
+    def is_circuit(self):
+        return self.start == self.end
+
+    def complete(self):
+        return self.edges_used == self.num_edges
+
+    def __iter__(self):
+        if self.directed:
+            return self._walk(self.graph.in_offsets.tolist(), self.graph.in_sources.tolist(), None)
+        offsets, incident = _incidence(self.graph.num_vertices(), self.sources, self.targets)
+        ends = [u ^ v for u, v in zip(self.sources, self.targets)]
+        return self._walk(offsets, incident, ends)
+
+    def _walk(self, offsets, incident, ends):
+        used = bytearray(self.num_edges) if ends is not None else None
+        cursor = offsets[:-1]
+        stack = array("l", [self.end])
+        while stack:
+            v = stack[-1]
+            i, stop = cursor[v], offsets[v + 1]
+            if used is not None:
+                while i < stop and used[incident[i]]:
+                    i += 1
+            if i < stop:
+                cursor[v] = i + 1
+                if used is None:
+                    stack.append(incident[i])
+                else:
+                    used[incident[i]] = 1
+                    stack.append(ends[incident[i]] ^ v)
+                self.edges_used += 1
+            else:
+                cursor[v] = i
+                stack.pop()
+                yield v
+
+def undirected_edges(graph):
+    if npstore.available():
+        import numpy as np
+        offsets = np.asarray(graph.out_offsets)
+        sources = np.repeat(np.arange(graph.num_vertices()), np.diff(offsets))
+        targets = np.asarray(graph.out_targets)
+        keep = sources <= targets
+        return sources[keep].tolist(), targets[keep].tolist()
+    edges = [(u, v) for u, v, weight in graph.arcs() if u <= v]
+    return [u for u, v in edges], [v for u, v in edges]
+
+def _incidence(n, sources, targets):
+    if npstore.available():
+        import numpy as np
+        sources, targets = np.asarray(sources, dtype=np.int64), np.asarray(targets, dtype=np.int64)
+        edge_ids = np.arange(len(sources))
+        proper = sources != targets
+        ends = np.concatenate([sources, targets[proper]])
+        order = np.argsort(ends, kind="stable")
+        offsets = np.zeros(n + 1, dtype=np.int64)
+        offsets[1:] = np.cumsum(np.bincount(ends, minlength=n))
+        return offsets.tolist(), np.concatenate([edge_ids, edge_ids[proper]])[order].tolist()
+
+    rows = [[] for _ in range(n)]
+    for e, u in enumerate(sources):
+        rows[u].append(e)
+    for e, (u, v) in enumerate(zip(sources, targets)):
+        if u != v:
+            rows[v].append(e)
+    offsets = [0] * (n + 1)
+    for v, row in enumerate(rows):
+        offsets[v + 1] = offsets[v] + len(row)
+    return offsets, [e for row in rows for e in row]
+
+def degrees(graph, directed):
+    n = graph.num_vertices()
+    if npstore.available():
+        import numpy as np
+        out_degrees = np.diff(np.asarray(graph.out_offsets))
+        if directed:
+            return out_degrees.tolist(), np.diff(np.asarray(graph.in_offsets)).tolist()
+        sources = np.repeat(np.arange(n), out_degrees)
+        loops = np.bincount(sources[sources == np.asarray(graph.out_targets)], minlength=n)
+        return (out_degrees + loops).tolist(), None
+
+    offsets = graph.out_offsets.tolist()
+    out_degrees = [offsets[v + 1] - offsets[v] for v in range(n)]
+    if directed:
+        in_offsets = graph.in_offsets.tolist()
+        return out_degrees, [in_offsets[v + 1] - in_offsets[v] for v in range(n)]
+    for u, v, weight in graph.arcs():
+        if u == v:
+            out_degrees[u] += 1
+    return out_degrees, None
+
+def endpoints(graph, directed):
+    out_degrees, in_degrees = degrees(graph, directed)
+    first = next((v for v, degree in enumerate(out_degrees) if degree), None)
+    if directed:
+        sources = [v for v in range(len(out_degrees)) if out_degrees[v] - in_degrees[v] == 1]
+        sinks = [v for v in range(len(out_degrees)) if in_degrees[v] - out_degrees[v] == 1]
+        unbalanced = [v for v in range(len(out_degrees)) if abs(out_degrees[v] - in_degrees[v]) > 1]
+        if not unbalanced and not sources and not sinks:
+            return first, first, []
+        if not unbalanced and len(sources) == 1 and len(sinks) == 1:
+            return sources[0], sinks[0], []
+        return None, None, unbalanced + sources + sinks
+
+    odd = [v for v, degree in enumerate(out_degrees) if degree % 2]
+    if not odd:
+        return first, first, []
+    if len(odd) == 2:
+        return odd[0], odd[1], []
+    return None, None, odd
+
+def write_trail(walk, path):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        for v in walk:
+            f.write(walk.graph.name_of(v) + "\n")
+    if not walk.complete():
+        os.remove(temp_path)
+        return False
+    os.replace(temp_path, path)
+    return True
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Grava em arquivo um ciclo ou caminho euleriano de um grafo, um vértice por linha.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("saida", help="arquivo de saída")
+    args = parser.parse_args()
+
+    graph = store.load_graph(args.grafo)
+    directed = graph.is_directed
+    start, end, unbalanced = endpoints(graph, directed)
+    if start is None:
+        print(f"'{args.grafo}' não é euleriano: {len(unbalanced)} vértices com grau incompatível." if unbalanced else f"'{args.grafo}' não possui arestas.")
+    else:
+        walk = EulerWalk(graph, directed, start, end)
+        if write_trail(walk, args.saida):
+            print(f"{'Ciclo' if walk.is_circuit() else 'Caminho'} euleriano com {walk.num_edges} arestas gravado em {args.saida}.")
+        else:
+            print(f"'{args.grafo}' não é euleriano: as arestas não estão todas em um mesmo componente.")
@@ -0,0 +1,143 @@
+from array import array
+from bisect import bisect_left
+
+class Graph:
+    def __init__(self, name, vertices, arcs, graph_type="directed", has_weights=False, is_bipartite=False, is_complete=False):
+        self.name = name
+        self.type = graph_type
+        self.has_weights = has_weights
+        self.is_bipartite = is_bipartite
+        self.is_complete = is_complete
+
+        self.vertices = list(vertices)
+        self._index = {v: i for i, v in enumerate(self.vertices)}
+
+        sources = array('l')
+        targets = array('l')
+        weights = []
+        for u, v, w in arcs:
+            sources.append(u)
+            targets.append(v)
+            weights.append(w)
+        typecode = 'q' if all(isinstance(w, int) for w in weights) else 'd'
+        weights = array(typecode, weights)
+
+        n = len(self.vertices)
+        self.out_offsets, self.out_targets, self.out_weights = self._build_rows(n, sources, targets, weights)
+        self.in_offsets, self.in_sources, self.in_weights = self._build_rows(n, targets, sources, weights)
+
+    @staticmethod
+    def _build_rows(n, rows, cols, weights):
+        m = len(rows)
+
+        by_col = array('l', [0]) * m
+        counts = array('l', [0]) * (n + 1)
+        for c in cols:
+            counts[c + 1] += 1
+        for i in range(n):
+            counts[i + 1] += counts[i]
+        for k in range(m):
+            c = cols[k]
+            by_col[counts[c]] = k
+            counts[c] += 1
+
+        offsets = array('l', [0]) * (n + 1)
+        for r in rows:
+            offsets[r + 1] += 1
+        for i in range(n):
+            offsets[i + 1] += offsets[i]
+
+        cursor = array('l', offsets)
+        row_cols = array('l', [0]) * m
+        row_weights = array(weights.typecode, [0]) * m
+        for k in by_col:
+            r = rows[k]
+            row_cols[cursor[r]] = cols[k]
+            row_weights[cursor[r]] = weights[k]
+            cursor[r] += 1
+
+        return offsets, row_cols, row_weights
+
+    @classmethod
+    def from_arrays(cls, name, vertices, out_offsets, out_targets, out_weights, in_offsets, in_sources, in_weights, graph_type="directed", has_weights=False, is_bipartite=False, is_complete=False):
+        graph = cls.__new__(cls)
+        graph.name = name
+        graph.type = graph_type
+        graph.has_weights = has_weights
+        graph.is_bipartite = is_bipartite
+        graph.is_complete = is_complete
+        graph.vertices = vertices
+        graph._index = None
+        graph.out_offsets = out_offsets
+        graph.out_targets = out_targets
+        graph.out_weights = out_weights
+        graph.in_offsets = in_offsets
+        graph.in_sources = in_sources
+        graph.in_weights = in_weights
+        return graph
+
+    @property
+    def is_directed(self):
+        return self.type == "directed"
+
+    @property
+    def index(self):
+        if self._index is None:
+            self._index = {str(v): i for i, v in enumerate(self.vertices)}
+        return self._index
+
+    def num_vertices(self):
+        return len(self.vertices)
+
+    def num_arcs(self):
+        return len(self.out_targets)
+
+    def vertex_id(self, name):
+        return self.index.get(name)
+
+    def has_vertex(self, name):
+        return name in self.index
+
+    def name_of(self, v):
+        return str(self.vertices[v])
+
+    def names(self, ids):
+        return [str(self.vertices[v]) for v in ids]
+
+    def out_degree(self, v):
+        return int(self.out_offsets[v + 1] - self.out_offsets[v])
+
+    def in_degree(self, v):
+        return int(self.in_offsets[v + 1] - self.in_offsets[v])
+
+    def out_neighbors(self, v):
+        return self.out_targets[self.out_offsets[v]:self.out_offsets[v + 1]].tolist()
+
+    def in_neighbors(self, v):
+        return self.in_sources[self.in_offsets[v]:self.in_offsets[v + 1]].tolist()
+
+    def out_edges(self, v):
+        start, end = self.out_offsets[v], self.out_offsets[v + 1]
+        return zip(self.out_targets[start:end].tolist(), self.out_weights[start:end].tolist())
+
+    def in_edges(self, v):
+        start, end = self.in_offsets[v], self.in_offsets[v + 1]
+        return zip(self.in_sources[start:end].tolist(), self.in_weights[start:end].tolist())
+
+    def arcs(self):
+        offsets = self.out_offsets.tolist()
+        targets = self.out_targets.tolist()
+        weights = self.out_weights.tolist()
+        for u in range(len(self.vertices)):
+            for k in range(offsets[u], offsets[u + 1]):
+                yield u, targets[k], weights[k]
+
+    def weight(self, u, v):
+        start, end = int(self.out_offsets[u]), int(self.out_offsets[u + 1])
+        k = bisect_left(self.out_targets, v, start, end)
+        if k < end and self.out_targets[k] == v:
+            return self.out_weights[k:k + 1].tolist()[0]
+        return 0
+
+    def has_edge(self, u, v):
+        return self.weight(u, v) != 0
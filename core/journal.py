@@ -0,0 +1,107 @@
+import json
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+TAIL_BYTES = 4096
+
+_lock = threading.Lock()
+
+@contextmanager
+def locked(path):
+    with _lock:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path + ".lock", "a") as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+def _parse(line):
+    try:
+        op = json.loads(line)
+    except ValueError:
+        return None
+    return op if isinstance(op, dict) and "seq" in op else None
+
+def read_ops(path):
+    if not os.path.exists(path):
+        return []
+    ops = []
+    with open(path, "r") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            op = _parse(line)
+            if op is not None:
+                ops.append(op)
+    return ops
+
+def last_seq(path):
+    if not os.path.exists(path):
+        return 0
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        f.seek(max(0, size - TAIL_BYTES))
+        tail = f.read().decode("utf-8", errors="replace")
+    for line in reversed(tail.splitlines(keepends=True)):
+        if line.endswith("\n"):
+            op = _parse(line)
+            if op is not None:
+                return op["seq"]
+    ops = read_ops(path)
+    return ops[-1]["seq"] if ops else 0
+
+def append(path, op):
+    with locked(path):
+        op = dict(op, seq=last_seq(path) + 1)
+        line = json.dumps(op, separators=(",", ":")) + "\n"
+        with open(path, "ab+") as f:
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode("utf-8"))
+            f.flush()
+            os.fsync(f.fileno())
+    return op
+
+def checkpoint(path, seq):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        f.write(json.dumps({"op": "checkpoint", "seq": seq}, separators=(",", ":")) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
+def size(path):
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+def apply_op(graph_info, op):
+    adjacency_matrix = graph_info["adjacency_matrix"]
+    kind = op["op"]
+
+    if kind == "add_vertex":
+        adjacency_matrix.setdefault(op["vertex"], {})
+    elif kind == "remove_vertex":
+        adjacency_matrix.pop(op["vertex"], None)
+        for row in adjacency_matrix.values():
+            row.pop(op["vertex"], None)
+    elif kind == "rename_vertex":
+        old_vertex, new_vertex = op["old"], op["new"]
+        if old_vertex in adjacency_matrix and new_vertex not in adjacency_matrix:
+            adjacency_matrix[new_vertex] = adjacency_matrix.pop(old_vertex)
+            for row in adjacency_matrix.values():
+                if old_vertex in row:
+                    row[new_vertex] = row.pop(old_vertex)
+    elif kind == "set_edge":
+        if op["weight"] == 0:
+            adjacency_matrix.get(op["source"], {}).pop(op["target"], None)
+        else:
+            adjacency_matrix.setdefault(op["source"], {})[op["target"]] = op["weight"]
+    elif kind == "set_type":
+        graph_info["type"] = op["type"]
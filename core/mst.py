@@ -0,0 +1,189 @@
+import argparse
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from core import npstore, store
+
+METHODS = ("boruvka", "kruskal")
+POOL_MIN_EDGES = 500000
+
+_worker_edges = None
+
+class SpanningForest:
+    def __init__(self, graph, edges, labels, totals):
+        self.graph = graph
+        self.edges = edges
+        self.labels = labels
+        self.totals = totals
+
+    def component_count(self):
+        return len(self.totals)
+
+    def total_weight(self):
+        return sum(self.totals)
+
+    def components(self):
+        members = [[] for _ in self.totals]
+        for v, label in enumerate(self.labels):
+            members[label].append(v)
+        return members
+
+def sorted_edges(graph):
+    n = graph.num_vertices()
+    if not npstore.available():
+        edges = sorted((weight, u, v) for u, v, weight in graph.arcs() if u < v and weight > 0)
+        return [u for _, u, _ in edges], [v for _, _, v in edges], [weight for weight, _, _ in edges]
+
+    import numpy as np
+    offsets = np.asarray(graph.out_offsets)
+    sources = np.repeat(np.arange(n), np.diff(offsets))
+    targets = np.asarray(graph.out_targets)
+    weights = np.asarray(graph.out_weights)
+    keep = (sources < targets) & (weights > 0)
+    sources, targets, weights = sources[keep], targets[keep], weights[keep]
+    order = np.argsort(weights, kind="stable")
+    return sources[order], targets[order], weights[order]
+
+def _forest(graph, sources, targets, weights, chosen, roots):
+    if not hasattr(weights, "dtype"):
+        chosen = sorted(chosen)
+        edges = [(sources[i], targets[i], weights[i]) for i in chosen]
+        component_of = {}
+        labels = [component_of.setdefault(root, len(component_of)) for root in roots]
+        totals = [0] * len(component_of)
+        for u, v, weight in edges:
+            totals[labels[u]] += weight
+        return SpanningForest(graph, edges, labels, totals)
+
+    import numpy as np
+    chosen = np.sort(np.asarray(chosen, dtype=np.int64))
+    _, first, inverse = np.unique(np.asarray(roots), return_index=True, return_inverse=True)
+    relabel = np.empty(len(first), dtype=np.int64)
+    relabel[np.argsort(first)] = np.arange(len(first))
+    labels = relabel[inverse]
+    totals = np.zeros(len(first), dtype=weights.dtype)
+    np.add.at(totals, labels[sources[chosen]], weights[chosen])
+    edges = list(zip(sources[chosen].tolist(), targets[chosen].tolist(), weights[chosen].tolist()))
+    return SpanningForest(graph, edges, labels.tolist(), totals.tolist())
+
+def kruskal(graph):
+    n = graph.num_vertices()
+    sources, targets, weights = sorted_edges(graph)
+    if hasattr(sources, "tolist"):
+        sources_list, targets_list = sources.tolist(), targets.tolist()
+    else:
+        sources_list, targets_list = sources, targets
+
+    parent = list(range(n))
+    size = [1] * n
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    chosen = []
+    for i, (u, v) in enumerate(zip(sources_list, targets_list)):
+        if len(chosen) == n - 1:
+            break
+        root_u, root_v = find(u), find(v)
+        if root_u == root_v:
+            continue
+        if size[root_u] < size[root_v]:
+            root_u, root_v = root_v, root_u
+        parent[root_v] = root_u
+        size[root_u] += size[root_v]
+        chosen.append(i)
+
+    return _forest(graph, sources, targets, weights, chosen, [find(v) for v in range(n)])
+
+def _init_worker(sources, targets):
+    global _worker_edges
+    _worker_edges = (sources, targets)
+
+def _cheapest(labels, bounds):
+    import numpy as np
+    sources, targets = _worker_edges
+    start, end = bounds
+    edge_ids = np.arange(start, end)
+    source_labels = labels[sources[start:end]]
+    target_labels = labels[targets[start:end]]
+    crossing = source_labels != target_labels
+    edge_ids, source_labels, target_labels = edge_ids[crossing], source_labels[crossing], target_labels[crossing]
+
+    best = np.full(len(labels), len(sources), dtype=np.int64)
+    np.minimum.at(best, source_labels, edge_ids)
+    np.minimum.at(best, target_labels, edge_ids)
+    return best
+
+def boruvka(graph, workers=None):
+    if not npstore.available():
+        return kruskal(graph)
+
+    import numpy as np
+    n = graph.num_vertices()
+    sources, targets, weights = sorted_edges(graph)
+    m = len(sources)
+    vertices = np.arange(n)
+    labels = vertices.copy()
+    chosen = []
+
+    pool = None
+    if workers != 1 and m >= POOL_MIN_EDGES:
+        workers = workers or os.cpu_count() or 1
+        pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(sources, targets))
+        step = -(-m // workers)
+        chunks = [(start, min(m, start + step)) for start in range(0, m, step)]
+    else:
+        _init_worker(sources, targets)
+
+    try:
+        while True:
+            if pool:
+                best = np.minimum.reduce(list(pool.map(partial(_cheapest, labels), chunks)))
+            else:
+                best = _cheapest(labels, (0, m))
+            components = np.flatnonzero(best < m)
+            if not len(components):
+                break
+
+            edge_ids = best[components]
+            source_labels, target_labels = labels[sources[edge_ids]], labels[targets[edge_ids]]
+            parent = vertices.copy()
+            parent[components] = np.where(source_labels == components, target_labels, source_labels)
+            mutual = (parent[parent] == vertices) & (vertices < parent)
+            parent[mutual] = vertices[mutual]
+            while True:
+                jumped = parent[parent]
+                if (jumped == parent).all():
+                    break
+                parent = jumped
+
+            chosen.extend(np.unique(edge_ids).tolist())
+            labels = parent[labels]
+    finally:
+        if pool:
+            pool.shutdown()
+
+    return _forest(graph, sources, targets, weights, chosen, labels)
+
+def minimum_spanning_forest(graph, method="boruvka", workers=None):
+    if method not in METHODS:
+        raise ValueError(f"Método desconhecido: {method}")
+    if method == "kruskal":
+        return kruskal(graph)
+    return boruvka(graph, workers)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcula a floresta geradora mínima de um grafo não direcionado.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("--method", choices=METHODS, default="boruvka")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    forest = minimum_spanning_forest(store.load_graph(args.grafo), args.method, args.workers)
+    print(f"Floresta geradora mínima de '{args.grafo}': {len(forest.edges)} arestas, {forest.component_count()} componentes, peso total {forest.total_weight()}.")
+    for component, total in enumerate(forest.totals):
+        print(f"Componente {component + 1}: peso {total}")
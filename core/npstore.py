@@ -0,0 +1,88 @@
+import json
+import os
+import shutil
+
+from core.graph import Graph
+
+ARRAY_NAMES = ("out_offsets", "out_targets", "out_weights", "in_offsets", "in_sources", "in_weights")
+VERTICES_FILE = "vertices.npy"
+META_FILE = "meta.json"
+
+_numpy = None
+_numpy_missing = False
+
+def _load_numpy():
+    global _numpy, _numpy_missing
+    if _numpy is None and not _numpy_missing:
+        try:
+            import numpy
+            _numpy = numpy
+        except ImportError:
+            _numpy_missing = True
+    return _numpy
+
+def available():
+    return _load_numpy() is not None
+
+def is_current(directory, source_path):
+    meta_path = os.path.join(directory, META_FILE)
+    if not os.path.exists(meta_path):
+        return False
+    return os.path.getmtime(meta_path) >= os.path.getmtime(source_path)
+
+def save_array(path, values):
+    np = _load_numpy()
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as f:
+        np.save(f, values)
+    os.replace(temp_path, path)
+
+def save_meta(path, meta):
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(temp_path, path)
+
+def load_meta(path):
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as f:
+        return json.load(f)
+
+def write_graph(directory, graph):
+    np = _load_numpy()
+    os.makedirs(directory, exist_ok=True)
+    meta_path = os.path.join(directory, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    save_array(os.path.join(directory, VERTICES_FILE), np.array(graph.vertices, dtype=str))
+    for array_name in ARRAY_NAMES:
+        save_array(os.path.join(directory, array_name + ".npy"), np.asarray(getattr(graph, array_name)))
+
+    meta = {
+        "type": graph.type,
+        "has_weights": graph.has_weights,
+        "is_bipartite": graph.is_bipartite,
+        "is_complete": graph.is_complete,
+    }
+    save_meta(meta_path, meta)
+
+def open_graph(name, directory):
+    np = _load_numpy()
+    meta = load_meta(os.path.join(directory, META_FILE))
+
+    arrays = {array_name: np.load(os.path.join(directory, array_name + ".npy"), mmap_mode="r") for array_name in ARRAY_NAMES}
+    return Graph.from_arrays(
+        name,
+        np.load(os.path.join(directory, VERTICES_FILE), mmap_mode="r"),
+        graph_type=meta["type"],
+        has_weights=meta["has_weights"],
+        is_bipartite=meta["is_bipartite"],
+        is_complete=meta["is_complete"],
+        **arrays,
+    )
+
+def remove_graph(directory):
+    if os.path.isdir(directory):
+        shutil.rmtree(directory)
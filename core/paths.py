@@ -0,0 +1,187 @@
+import heapq
+from collections import deque
+
+INF = float('inf')
+
+class ShortestPathTree:
+    def __init__(self, graph, source, costs, predecessors, complete):
+        self.graph = graph
+        self.source = source
+        self.costs = costs
+        self.predecessors = predecessors
+        self.complete = complete
+
+    def reached(self, v):
+        return self.costs[v] != INF
+
+    def cost(self, v):
+        return self.costs[v]
+
+    def path(self, v):
+        if not self.reached(v):
+            return None
+        path = []
+        while v is not None:
+            path.append(v)
+            v = self.predecessors[v]
+        path.reverse()
+        return path
+
+    def predecessor_names(self):
+        return {self.graph.name_of(v): self.graph.name_of(p) for v, p in enumerate(self.predecessors) if p is not None}
+
+def dijkstra(graph, source, target=None, log=None, reverse=False):
+    n = graph.num_vertices()
+    if reverse:
+        offsets, targets, weights = graph.in_offsets, graph.in_sources, graph.in_weights
+    else:
+        offsets, targets, weights = graph.out_offsets, graph.out_targets, graph.out_weights
+
+    costs = [INF] * n
+    predecessors = [None] * n
+    settled = bytearray(n)
+    costs[source] = 0
+    heap = [(0, source)]
+
+    while heap:
+        cost, u = heapq.heappop(heap)
+        if settled[u]:
+            continue
+        settled[u] = 1
+        if log:
+            log(f"Visitando {graph.name_of(u)} com custo atual {cost}")
+        if u == target:
+            return ShortestPathTree(graph, source, costs, predecessors, False)
+
+        start, end = int(offsets[u]), int(offsets[u + 1])
+        for v, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            if weight > 0 and not settled[v]:
+                new_cost = cost + weight
+                if new_cost < costs[v]:
+                    costs[v] = new_cost
+                    predecessors[v] = u
+                    heapq.heappush(heap, (new_cost, v))
+                    if log:
+                        log(f"Atualizando custo de {graph.name_of(v)} para {new_cost} (predecessor: {graph.name_of(u)})")
+
+    return ShortestPathTree(graph, source, costs, predecessors, True)
+
+def bfs_tree(graph, source):
+    n = graph.num_vertices()
+    costs = [INF] * n
+    predecessors = [None] * n
+    costs[source] = 0
+    queue = deque([source])
+
+    while queue:
+        u = queue.popleft()
+        for v in graph.out_neighbors(u):
+            if costs[v] == INF:
+                costs[v] = costs[u] + 1
+                predecessors[v] = u
+                queue.append(v)
+
+    return ShortestPathTree(graph, source, costs, predecessors, True)
+
+def predecessor_cycle(predecessors, v):
+    seen = set()
+    while v is not None and v not in seen:
+        seen.add(v)
+        v = predecessors[v]
+    if v is None:
+        return None
+    cycle = [v]
+    u = predecessors[v]
+    while u != v:
+        cycle.append(u)
+        u = predecessors[u]
+    cycle.append(v)
+    cycle.reverse()
+    return cycle
+
+def spfa(graph, source, log=None):
+    n = graph.num_vertices()
+    offsets = graph.out_offsets
+    targets = graph.out_targets
+    weights = graph.out_weights
+
+    costs = [INF] * n
+    predecessors = [None] * n
+    lengths = [0] * n
+    queued = bytearray(n)
+    costs[source] = 0
+    queue = deque([source])
+    queued[source] = 1
+
+    while queue:
+        u = queue.popleft()
+        queued[u] = 0
+        cost = costs[u]
+
+        start, end = int(offsets[u]), int(offsets[u + 1])
+        for v, weight in zip(targets[start:end].tolist(), weights[start:end].tolist()):
+            new_cost = cost + weight
+            if new_cost < costs[v]:
+                costs[v] = new_cost
+                predecessors[v] = u
+                lengths[v] = lengths[u] + 1
+                if log:
+                    log(f"Atualizando custo de {graph.name_of(v)} para {new_cost} (predecessor: {graph.name_of(u)})")
+                if lengths[v] >= n:
+                    cycle = predecessor_cycle(predecessors, v)
+                    if cycle:
+                        return ShortestPathTree(graph, source, costs, predecessors, False), cycle
+                if not queued[v]:
+                    queued[v] = 1
+                    queue.append(v)
+
+    return ShortestPathTree(graph, source, costs, predecessors, True), None
+
+def bidirectional_bfs(graph, source, target):
+    if source == target:
+        return [source], 1
+
+    n = graph.num_vertices()
+    forward = [-1] * n
+    backward = [-1] * n
+    forward[source] = source
+    backward[target] = target
+    forward_frontier = [source]
+    backward_frontier = [target]
+    explored = 2
+    meet = None
+
+    while forward_frontier and backward_frontier and meet is None:
+        if len(forward_frontier) <= len(backward_frontier):
+            frontier, parents, others, neighbors = forward_frontier, forward, backward, graph.out_neighbors
+        else:
+            frontier, parents, others, neighbors = backward_frontier, backward, forward, graph.in_neighbors
+
+        next_frontier = []
+        for u in frontier:
+            for v in neighbors(u):
+                if parents[v] == -1:
+                    parents[v] = u
+                    explored += 1
+                    if others[v] != -1:
+                        meet = v
+                        break
+                    next_frontier.append(v)
+            if meet is not None:
+                break
+
+        if frontier is forward_frontier:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+
+    if meet is None:
+        return None, explored
+
+    path = [meet]
+    while path[-1] != source:
+        path.append(forward[path[-1]])
+    path.reverse()
+    while path[-1] != target:
+        path.append(backward[path[-1]])
+    return path, explored
@@ -0,0 +1,451 @@
+from collections import deque
+
+class Interval:
+    def __init__(self, low=None, high=None):
+        self.low = low
+        self.high = high
+
+    def empty(self):
+        return self.low is None and self.high is None
+
+class ConflictPair:
+    def __init__(self, left=None, right=None):
+        self.left = left or Interval()
+        self.right = right or Interval()
+
+    def swap(self):
+        self.left, self.right = self.right, self.left
+
+    def empty(self):
+        return self.left.empty() and self.right.empty()
+
+class PlanarEmbedding:
+    def __init__(self, graph, rotation):
+        self.graph = graph
+        self.rotation = rotation
+
+    def clockwise(self, v):
+        return self.rotation[v]
+
+class KuratowskiSubgraph:
+    def __init__(self, graph, kind, branch_vertices, paths):
+        self.graph = graph
+        self.kind = kind
+        self.branch_vertices = branch_vertices
+        self.paths = paths
+
+    def parts(self):
+        if self.kind != "K3,3":
+            return None
+        first = self.branch_vertices[0]
+        across = {path[-1] if path[0] == first else path[0] for path in self.paths if first in (path[0], path[-1])}
+        return [v for v in self.branch_vertices if v not in across], sorted(across)
+
+def simple_edges(graph):
+    edges = set()
+    for u, v, weight in graph.arcs():
+        if u < v:
+            edges.add((u, v))
+        elif v < u:
+            edges.add((v, u))
+    return sorted(edges)
+
+def _left_right(n, edges, embed):
+    m = len(edges)
+    if n >= 3 and m > 3 * n - 6:
+        return None
+
+    adjacency = [[] for _ in range(n)]
+    for k, (u, v) in enumerate(edges):
+        adjacency[u].append((v, k))
+        adjacency[v].append((u, k))
+
+    height = [-1] * n
+    parent_edge = [-1] * n
+    tail = [-1] * m
+    head = [-1] * m
+    lowpt = [0] * m
+    lowpt2 = [0] * m
+    nesting_depth = [0] * m
+    out_edges = [[] for _ in range(n)]
+    roots = []
+
+    position = [0] * n
+    for root in range(n):
+        if height[root] != -1:
+            continue
+        height[root] = 0
+        roots.append(root)
+        stack = [root]
+        while stack:
+            v = stack[-1]
+            e = parent_edge[v]
+            neighbors = adjacency[v]
+            i = position[v]
+            descended = False
+            while i < len(neighbors):
+                w, k = neighbors[i]
+                if tail[k] == -1:
+                    tail[k] = v
+                    head[k] = w
+                    out_edges[v].append(k)
+                    lowpt[k] = lowpt2[k] = height[v]
+                    if height[w] == -1:
+                        parent_edge[w] = k
+                        height[w] = height[v] + 1
+                        position[v] = i
+                        stack.append(w)
+                        descended = True
+                        break
+                    lowpt[k] = height[w]
+                elif tail[k] != v:
+                    i += 1
+                    continue
+
+                nesting_depth[k] = 2 * lowpt[k] + (lowpt2[k] < height[v])
+                if e != -1:
+                    if lowpt[k] < lowpt[e]:
+                        lowpt2[e] = min(lowpt[e], lowpt2[k])
+                        lowpt[e] = lowpt[k]
+                    elif lowpt[k] > lowpt[e]:
+                        lowpt2[e] = min(lowpt2[e], lowpt[k])
+                    else:
+                        lowpt2[e] = min(lowpt2[e], lowpt2[k])
+                i += 1
+            if not descended:
+                position[v] = i
+                stack.pop()
+
+    for v in range(n):
+        out_edges[v].sort(key=nesting_depth.__getitem__)
+
+    stack_bottom = [None] * m
+    lowpt_edge = [-1] * m
+    ref = [None] * m
+    side = [1] * m
+    entered = bytearray(m)
+    conflicts = []
+
+    def conflicting(interval, k):
+        return interval.high is not None and lowpt[interval.high] > lowpt[k]
+
+    def lowest(pair):
+        if pair.left.empty():
+            return lowpt[pair.right.low]
+        if pair.right.empty():
+            return lowpt[pair.left.low]
+        return min(lowpt[pair.left.low], lowpt[pair.right.low])
+
+    def add_constraints(k, e):
+        pair = ConflictPair()
+        while True:
+            other = conflicts.pop()
+            if not other.left.empty():
+                other.swap()
+            if not other.left.empty():
+                return False
+            if lowpt[other.right.low] > lowpt[e]:
+                if pair.right.empty():
+                    pair.right.high = other.right.high
+                else:
+                    ref[pair.right.low] = other.right.high
+                pair.right.low = other.right.low
+            else:
+                ref[other.right.low] = lowpt_edge[e]
+            if (conflicts[-1] if conflicts else None) is stack_bottom[k]:
+                break
+
+        while conflicts and (conflicting(conflicts[-1].left, k) or conflicting(conflicts[-1].right, k)):
+            other = conflicts.pop()
+            if conflicting(other.right, k):
+                other.swap()
+            if conflicting(other.right, k):
+                return False
+            ref[pair.right.low] = other.right.high
+            if other.right.low is not None:
+                pair.right.low = other.right.low
+            if pair.left.empty():
+                pair.left.high = other.left.high
+            else:
+                ref[pair.left.low] = other.left.high
+            pair.left.low = other.left.low
+
+        if not pair.empty():
+            conflicts.append(pair)
+        return True
+
+    def trim_back_edges(e):
+        u = tail[e]
+        while conflicts and lowest(conflicts[-1]) == height[u]:
+            pair = conflicts.pop()
+            if pair.left.low is not None:
+                side[pair.left.low] = -1
+
+        if conflicts:
+            pair = conflicts.pop()
+            while pair.left.high is not None and head[pair.left.high] == u:
+                pair.left.high = ref[pair.left.high]
+            if pair.left.high is None and pair.left.low is not None:
+                ref[pair.left.low] = pair.right.low
+                side[pair.left.low] = -1
+                pair.left.low = None
+            while pair.right.high is not None and head[pair.right.high] == u:
+                pair.right.high = ref[pair.right.high]
+            if pair.right.high is None and pair.right.low is not None:
+                ref[pair.right.low] = pair.left.low
+                side[pair.right.low] = -1
+                pair.right.low = None
+            conflicts.append(pair)
+
+        if lowpt[e] < height[u]:
+            high_left, high_right = conflicts[-1].left.high, conflicts[-1].right.high
+            if high_left is not None and (high_right is None or lowpt[high_left] > lowpt[high_right]):
+                ref[e] = high_left
+            else:
+                ref[e] = high_right
+
+    position = [0] * n
+    for root in roots:
+        stack = [root]
+        while stack:
+            v = stack[-1]
+            e = parent_edge[v]
+            ordered = out_edges[v]
+            i = position[v]
+            descended = False
+            while i < len(ordered):
+                k = ordered[i]
+                w = head[k]
+                if not entered[k]:
+                    entered[k] = 1
+                    stack_bottom[k] = conflicts[-1] if conflicts else None
+                    if k == parent_edge[w]:
+                        position[v] = i
+                        stack.append(w)
+                        descended = True
+                        break
+                    lowpt_edge[k] = k
+                    conflicts.append(ConflictPair(right=Interval(k, k)))
+
+                if lowpt[k] < height[v]:
+                    if i == 0:
+                        lowpt_edge[e] = lowpt_edge[k]
+                    elif not add_constraints(k, e):
+                        return None
+                i += 1
+            if not descended:
+                position[v] = i
+                if e != -1:
+                    trim_back_edges(e)
+                stack.pop()
+
+    if not embed:
+        return True
+
+    for k in range(m):
+        chain = []
+        while ref[k] is not None:
+            chain.append(k)
+            k = ref[k]
+        for edge in reversed(chain):
+            side[edge] *= side[ref[edge]]
+            ref[edge] = None
+    for k in range(m):
+        nesting_depth[k] *= side[k]
+    for v in range(n):
+        out_edges[v].sort(key=nesting_depth.__getitem__)
+
+    clockwise = [{} for _ in range(n)]
+    counterclockwise = [{} for _ in range(n)]
+    first = [None] * n
+
+    def add_clockwise(v, w, reference):
+        if reference is None:
+            clockwise[v][w] = counterclockwise[v][w] = w
+            first[v] = w
+            return
+        after = clockwise[v][reference]
+        clockwise[v][reference] = w
+        counterclockwise[v][w] = reference
+        clockwise[v][w] = after
+        counterclockwise[v][after] = w
+
+    def add_counterclockwise(v, w, reference):
+        if reference is None:
+            add_clockwise(v, w, None)
+            return
+        add_clockwise(v, w, counterclockwise[v][reference])
+        if first[v] == reference:
+            first[v] = w
+
+    for v in range(n):
+        previous = None
+        for k in out_edges[v]:
+            add_clockwise(v, head[k], previous)
+            previous = head[k]
+
+    left_ref = [None] * n
+    right_ref = [None] * n
+    position = [0] * n
+    for root in roots:
+        stack = [root]
+        while stack:
+            v = stack[-1]
+            ordered = out_edges[v]
+            i = position[v]
+            descended = False
+            while i < len(ordered):
+                k = ordered[i]
+                w = head[k]
+                i += 1
+                if k == parent_edge[w]:
+                    add_counterclockwise(w, v, first[w])
+                    left_ref[v] = right_ref[v] = w
+                    position[v] = i
+                    stack.append(w)
+                    descended = True
+                    break
+                if side[k] == 1:
+                    add_clockwise(w, v, right_ref[w])
+                else:
+                    add_counterclockwise(w, v, left_ref[w])
+                    left_ref[w] = v
+            if not descended:
+                position[v] = i
+                stack.pop()
+
+    rotation = []
+    for v in range(n):
+        neighbors = []
+        w = first[v]
+        while w is not None:
+            neighbors.append(w)
+            w = clockwise[v][w]
+            if w == first[v]:
+                break
+        rotation.append(neighbors)
+    return rotation
+
+def _reduce(chains):
+    incident = {}
+    for i, (u, v, path) in enumerate(chains):
+        incident.setdefault(u, set()).add(i)
+        incident.setdefault(v, set()).add(i)
+    alive = [True] * len(chains)
+    chains = list(chains)
+
+    def drop(i):
+        alive[i] = False
+        u, v, path = chains[i]
+        incident[u].discard(i)
+        incident[v].discard(i)
+        return u, v
+
+    pending = list(incident)
+    while pending:
+        x = pending.pop()
+        degree = len(incident[x])
+        if degree == 1:
+            pending.extend(drop(next(iter(incident[x]))))
+        elif degree == 2:
+            i, j = sorted(incident[x])
+            (a, b, first), (c, d, second) = chains[i], chains[j]
+            u, w = (b if a == x else a), (d if c == x else c)
+            drop(i)
+            drop(j)
+            if u == w:
+                pending.append(u)
+                continue
+            parallel = next((k for k in incident[u] if w in chains[k][:2]), None)
+            if parallel is not None:
+                if len(chains[parallel][2]) <= len(first) + len(second):
+                    pending.extend((u, w))
+                    continue
+                drop(parallel)
+            chains[i] = (u, w, first + second)
+            alive[i] = True
+            incident[u].add(i)
+            incident[w].add(i)
+            pending.extend((u, w))
+    return [chain for i, chain in enumerate(chains) if alive[i]]
+
+def _is_planar(chains):
+    index = {}
+    compact = []
+    for u, v, path in chains:
+        compact.append((index.setdefault(u, len(index)), index.setdefault(v, len(index))))
+    return _left_right(len(index), compact, False) is not None
+
+def _bfs_order(n, edges):
+    adjacency = [[] for _ in range(n)]
+    for u, v in edges:
+        adjacency[u].append(v)
+        adjacency[v].append(u)
+
+    order = [-1] * n
+    count = 0
+    for start in range(n):
+        if order[start] != -1:
+            continue
+        order[start] = count
+        count += 1
+        queue = deque([start])
+        while queue:
+            u = queue.popleft()
+            for v in adjacency[u]:
+                if order[v] == -1:
+                    order[v] = count
+                    count += 1
+                    queue.append(v)
+    return order
+
+def _minimal_nonplanar(n, edges):
+    order = _bfs_order(n, edges)
+    chains = _reduce([(u, v, [(u, v)]) for u, v in sorted(edges, key=lambda edge: max(order[edge[0]], order[edge[1]]))])
+    chunk = len(chains)
+    while True:
+        chunk = max(1, min(chunk // 2, len(chains) // 2))
+        removed = False
+        i = 0
+        while i < len(chains):
+            trial = chains[:i] + chains[i + chunk:]
+            if _is_planar(trial):
+                i += chunk
+            else:
+                chains = _reduce(trial)
+                removed = True
+        if chunk == 1 and not removed:
+            break
+    return [edge for u, v, path in chains for edge in path]
+
+def kuratowski_subgraph(graph, edges=None):
+    if edges is None:
+        edges = simple_edges(graph)
+    required = _minimal_nonplanar(graph.num_vertices(), edges)
+
+    adjacency = {}
+    for u, v in required:
+        adjacency.setdefault(u, []).append(v)
+        adjacency.setdefault(v, []).append(u)
+    branch_vertices = sorted(v for v, neighbors in adjacency.items() if len(neighbors) > 2)
+
+    paths = []
+    for start in branch_vertices:
+        for step in adjacency[start]:
+            path = [start, step]
+            while len(adjacency[path[-1]]) == 2:
+                a, b = adjacency[path[-1]]
+                path.append(a if a != path[-2] else b)
+            if start < path[-1]:
+                paths.append(path)
+
+    kind = "K5" if len(branch_vertices) == 5 else "K3,3"
+    return KuratowskiSubgraph(graph, kind, branch_vertices, paths)
+
+def test(graph, edges=None, witness=False):
+    if edges is None:
+        edges = simple_edges(graph)
+    rotation = _left_right(graph.num_vertices(), edges, True)
+    if rotation is not None:
+        return PlanarEmbedding(graph, rotation), None
+    return None, kuratowski_subgraph(graph, edges) if witness else None
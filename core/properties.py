@@ -0,0 +1,99 @@
+import hashlib
+import threading
+
+from core import scc, store, traversal
+
+_lock = threading.Lock()
+
+def content_version(graph):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(graph.type.encode("utf-8"))
+    digest.update("\0".join(graph.names(range(graph.num_vertices()))).encode("utf-8"))
+    for values in (graph.out_offsets, graph.out_targets, graph.out_weights):
+        digest.update(values.tobytes())
+    return digest.hexdigest()
+
+def asymmetric_arc(graph):
+    if graph.type == "undirected":
+        return None
+    for u, v, weight in graph.arcs():
+        if weight != graph.weight(v, u):
+            return [u, v]
+    return None
+
+def weak_components(graph):
+    labels = [-1] * graph.num_vertices()
+    visited = set()
+    count = 0
+
+    def label(v):
+        labels[v] = count
+
+    for start in range(graph.num_vertices()):
+        if start in visited:
+            continue
+        traversal.bfs(graph, start, traversal.undirected_neighbors(graph), visited, pre=label)
+        count += 1
+    return labels, count
+
+def bipartition(graph):
+    colors = [-1] * graph.num_vertices()
+
+    def conflict(u, v):
+        if colors[v] == -1:
+            colors[v] = 1 - colors[u]
+        return colors[v] == colors[u]
+
+    for start in range(graph.num_vertices()):
+        if colors[start] != -1:
+            continue
+        colors[start] = 0
+        if traversal.bfs(graph, start, traversal.undirected_neighbors(graph), edge=conflict):
+            return None
+    return colors
+
+def is_bipartite(graph):
+    return bipartition(graph) is not None
+
+def compute(graph):
+    labels, count = weak_components(graph)
+    strong_labels, strong_count = scc.tarjan(graph)
+    self_loop = any(graph.has_edge(v, v) for v in range(graph.num_vertices()))
+    if graph.type == "undirected":
+        acyclic = not self_loop and graph.num_arcs() == 2 * (graph.num_vertices() - count)
+    else:
+        acyclic = not self_loop and strong_count == graph.num_vertices()
+    weights = graph.out_weights.tolist()
+    return {
+        "asymmetric_arc": asymmetric_arc(graph),
+        "out_degrees": [graph.out_degree(v) for v in range(graph.num_vertices())],
+        "in_degrees": [graph.in_degree(v) for v in range(graph.num_vertices())],
+        "weak_components": labels,
+        "weak_component_count": count,
+        "strong_components": strong_labels.tolist(),
+        "strong_component_count": strong_count,
+        "self_loop": self_loop,
+        "acyclic": acyclic,
+        "bipartite": is_bipartite(graph),
+        "min_weight": min(weights) if weights else None,
+        "max_weight": max(weights) if weights else None,
+    }
+
+def get(graph):
+    properties = getattr(graph, "_properties", None)
+    if properties is not None:
+        return properties
+
+    with _lock:
+        properties = getattr(graph, "_properties", None)
+        if properties is None:
+            version = content_version(graph)
+            saved = store.read_properties(graph.name)
+            if saved is not None and saved.get("version") == version and "in_degrees" in saved:
+                properties = saved
+            else:
+                properties = compute(graph)
+                properties["version"] = version
+                store.write_properties(graph.name, properties)
+            graph._properties = properties
+        return properties
@@ -0,0 +1,80 @@
+import importlib.util
+import os
+import sys
+import threading
+import time
+
+ROOT_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+ALGORITHMS = {
+    "cyclic": ("check/cyclic.py", "check_if_cyclic", ()),
+    "dag_top_gen": ("check/dag_top_gen.py", "check_dag_and_topological_sort", ()),
+    "eulerian": ("check/eulerian.py", "check_eulerian", ()),
+    "min_alloc": ("check/min_alloc.py", "find_minimum_allocation", ()),
+    "planarity": ("check/planarity.py", "check_planarity", ()),
+    "kuratowski": ("check/planarity.py", "find_kuratowski_subgraph", ()),
+    "str_con_comp": ("check/str_con_comp.py", "check_strongly_connected_components", ()),
+    "und_con": ("check/und_con.py", "check_if_undirected_and_connected", ()),
+    "click": ("gen/click.py", "check_click", ("vertices",)),
+    "domain_set": ("gen/domain_set.py", "check_dominating_set", ("vertices",)),
+    "edge_exist": ("gen/edge_exist.py", "check_edge_existence", ("vertex1", "vertex2")),
+    "indie_vert_set": ("gen/indie_vert_set.py", "check_independent_set", ("vertices",)),
+    "vert_adj": ("gen/vert_adj.py", "check_vertex_adjacency", ("vertex",)),
+    "vert_deg": ("gen/vert_deg.py", "check_vertex_degree", ("vertex",)),
+    "agm": ("pathmaker/agm.py", "find_mst", ("start_vertex",)),
+    "least_cost": ("pathmaker/least_cost.py", "find_lowest_cost_path", ("start_vertex", "end_vertex")),
+    "least_path": ("pathmaker/least_path.py", "find_shortest_path", ("start_vertex", "end_vertex")),
+    "least_path_bidir": ("pathmaker/least_path.py", "find_shortest_path_bidirectional", ("start_vertex", "end_vertex")),
+}
+
+APPS = {path: "VerificationApp" for path, function, params in ALGORITHMS.values()}
+APPS.update({
+    "src/create.py": "GraphApp",
+    "src/change.py": "ChangeGraphApp",
+    "src/draw.py": "DrawGraphApp",
+    "src/erase.py": "EraseGraphApp",
+    "src/editor.py": "MainApp",
+    "src/check.py": "MainApp",
+    "src/quest.py": "MainApp",
+    "src/path.py": "MainApp",
+    "project.py": "MainApp",
+})
+
+HEAVY_MODULES = ("numpy", "scipy", "networkx", "matplotlib")
+
+_lock = threading.Lock()
+_modules = {}
+
+def load_module(path):
+    with _lock:
+        if path not in _modules:
+            name = os.path.splitext(path)[0].replace("/", ".")
+            spec = importlib.util.spec_from_file_location(name, os.path.join(ROOT_DIR, path))
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _modules[path] = module
+        return _modules[path]
+
+def open_app(master, path):
+    import tkinter as tk
+    window = tk.Toplevel(master)
+    window.geometry("640x480")
+    return getattr(load_module(path), APPS[path])(window)
+
+def run(key, graph, params=None, log=None):
+    path, function_name, param_names = ALGORITHMS[key]
+    params = params or {}
+    missing = [name for name in param_names if name not in params]
+    if missing:
+        raise ValueError(f"Parâmetros ausentes para '{key}': {', '.join(missing)}")
+    function = getattr(load_module(path), function_name)
+    return function(graph, *[params[name] for name in param_names], log=log or (lambda message: None))
+
+def import_report():
+    timings = []
+    for path in APPS:
+        started = time.perf_counter()
+        load_module(path)
+        timings.append((path, time.perf_counter() - started))
+    heavy = [name for name in HEAVY_MODULES if name in sys.modules]
+    return timings, heavy
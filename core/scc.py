@@ -0,0 +1,154 @@
+import argparse
+from array import array
+
+from core import npstore, store, traversal
+
+class Condensation:
+    def __init__(self, labels, count, offsets, targets):
+        self.labels = labels
+        self.count = count
+        self.offsets = offsets
+        self.targets = targets
+
+    def num_arcs(self):
+        return len(self.targets)
+
+    def successors(self, component):
+        return [int(target) for target in self.targets[self.offsets[component]:self.offsets[component + 1]]]
+
+    def arcs(self):
+        for component in range(self.count):
+            for target in self.successors(component):
+                yield component, target
+
+def tarjan(graph):
+    n = graph.num_vertices()
+    offsets = graph.out_offsets.tolist()
+    targets = graph.out_targets.tolist()
+    index = [-1] * n
+    low = [0] * n
+    labels = [-1] * n
+    stack = []
+    count = 0
+    counter = 0
+
+    for root in range(n):
+        if index[root] != -1:
+            continue
+        index[root] = low[root] = counter
+        counter += 1
+        stack.append(root)
+        calls = [root]
+        positions = [offsets[root]]
+
+        while calls:
+            v = calls[-1]
+            i, end = positions[-1], offsets[v + 1]
+            while i < end:
+                w = targets[i]
+                i += 1
+                if index[w] == -1:
+                    positions[-1] = i
+                    index[w] = low[w] = counter
+                    counter += 1
+                    stack.append(w)
+                    calls.append(w)
+                    positions.append(offsets[w])
+                    break
+                if labels[w] == -1 and index[w] < low[v]:
+                    low[v] = index[w]
+            else:
+                calls.pop()
+                positions.pop()
+                if calls and low[v] < low[calls[-1]]:
+                    low[calls[-1]] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        labels[w] = count
+                        if w == v:
+                            break
+                    count += 1
+
+    return array("l", [count - 1 - label for label in labels]), count
+
+def subgraph_components(adjacency):
+    index = {}
+    low = {}
+    parent = {}
+    done = set()
+    stack = []
+    components = []
+
+    def enter(v):
+        index[v] = low[v] = len(index)
+        stack.append(v)
+
+    def arc(v, w):
+        if w not in index:
+            parent[w] = v
+        elif w not in done and index[w] < low[v]:
+            low[v] = index[w]
+
+    def leave(v):
+        u = parent.get(v)
+        if u is not None and low[v] < low[u]:
+            low[u] = low[v]
+        if low[v] == index[v]:
+            component = []
+            while True:
+                w = stack.pop()
+                done.add(w)
+                component.append(w)
+                if w == v:
+                    break
+            components.append(component)
+
+    neighbors = lambda v: (w for w in adjacency[v] if w in adjacency)
+    visited = set()
+    for root in adjacency:
+        if root not in visited:
+            traversal.dfs(None, root, neighbors, visited, pre=enter, edge=arc, post=leave)
+    return components
+
+def members(labels, count):
+    components = [[] for _ in range(count)]
+    for v, label in enumerate(labels):
+        components[label].append(v)
+    return components
+
+def condensation(graph, labels=None, count=None):
+    if labels is None:
+        labels, count = tarjan(graph)
+    n = graph.num_vertices()
+
+    if not npstore.available():
+        arcs = sorted({(labels[u], labels[v]) for u, v, weight in graph.arcs() if labels[u] != labels[v]})
+        offsets = array("l", [0]) * (count + 1)
+        for source, target in arcs:
+            offsets[source + 1] += 1
+        for i in range(count):
+            offsets[i + 1] += offsets[i]
+        return Condensation(labels, count, offsets, array("l", [target for source, target in arcs]))
+
+    import numpy as np
+    component_of = np.asarray(labels, dtype=np.int64)
+    sources = component_of[np.repeat(np.arange(n), np.diff(np.asarray(graph.out_offsets)))]
+    targets = component_of[np.asarray(graph.out_targets, dtype=np.int64)]
+    crossing = sources != targets
+    keys = np.unique(sources[crossing] * count + targets[crossing])
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(np.bincount(keys // count, minlength=count))
+    return Condensation(labels, count, offsets, keys % count)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Calcula os componentes fortemente conexos de um grafo e o DAG de condensação.")
+    parser.add_argument("grafo", help="nome do grafo na biblioteca")
+    parser.add_argument("--arcs", action="store_true", help="lista os arcos do DAG de condensação")
+    args = parser.parse_args()
+
+    dag = condensation(store.load_graph(args.grafo))
+    print(f"'{args.grafo}': {dag.count} componentes fortemente conexos, {dag.num_arcs()} arcos no DAG de condensação.")
+    if args.arcs:
+        for source, target in dag.arcs():
+            print(f"{source + 1} -> {target + 1}")
@@ -0,0 +1,316 @@
+import json
+import os
+import re
+
+from core import journal, npstore
+from core.graph import Graph
+
+LIB_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "lib"))
+GRAPHS_DIR = os.path.join(LIB_DIR, "graphs")
+CATALOG_PATH = os.path.join(GRAPHS_DIR, "catalog.json")
+SINGLE_FILE_PATH = os.path.join(LIB_DIR, "graphs.json")
+LEGACY_PATH = os.path.join(LIB_DIR, "adjacency_matrix.json")
+JOURNAL_PATH = os.path.join(GRAPHS_DIR, "journal.log")
+COMPACT_BYTES = 1 << 20
+
+CATALOG_OPS = ("create_graph", "rename_graph", "delete_graph")
+EDIT_OPS = ("add_vertex", "remove_vertex", "rename_vertex", "set_edge", "set_type")
+
+METADATA_DEFAULTS = {
+    "type": "directed",
+    "has_weights": False,
+    "is_bipartite": False,
+    "is_complete": False,
+}
+
+def record_from_adjacency(graph_info):
+    adjacency_matrix = graph_info['adjacency_matrix']
+    vertices = list(adjacency_matrix.keys())
+    index = {v: i for i, v in enumerate(vertices)}
+    undirected = graph_info.get('type', METADATA_DEFAULTS['type']) == "undirected"
+
+    edges = []
+    for u, row in adjacency_matrix.items():
+        for v, weight in row.items():
+            if weight == 0:
+                continue
+            if v not in index:
+                index[v] = len(vertices)
+                vertices.append(v)
+            if undirected and index[u] > index[v] and adjacency_matrix.get(v, {}).get(u, 0) != 0:
+                continue
+            edges.append([index[u], index[v], weight])
+
+    record = {key: graph_info.get(key, default) for key, default in METADATA_DEFAULTS.items()}
+    record["vertices"] = vertices
+    record["edges"] = edges
+    return record
+
+def record_arcs(record):
+    undirected = record["type"] == "undirected"
+    for u, v, weight in record["edges"]:
+        yield u, v, weight
+        if undirected and u != v:
+            yield v, u, weight
+
+def adjacency_from_record(record):
+    vertices = record["vertices"]
+    adjacency_matrix = {v: {} for v in vertices}
+    for u, v, weight in record_arcs(record):
+        adjacency_matrix[vertices[u]][vertices[v]] = weight
+
+    graph_info = {key: record.get(key, default) for key, default in METADATA_DEFAULTS.items()}
+    graph_info["adjacency_matrix"] = adjacency_matrix
+    return graph_info
+
+def graph_from_record(name, record):
+    return Graph(
+        name,
+        record["vertices"],
+        record_arcs(record),
+        graph_type=record.get("type", METADATA_DEFAULTS["type"]),
+        has_weights=record.get("has_weights", METADATA_DEFAULTS["has_weights"]),
+        is_bipartite=record.get("is_bipartite", METADATA_DEFAULTS["is_bipartite"]),
+        is_complete=record.get("is_complete", METADATA_DEFAULTS["is_complete"]),
+    )
+
+def _write_json(path, data):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+def _read_json(path):
+    with open(path, "r") as f:
+        return json.load(f)
+
+def _payload_path(entry):
+    return os.path.join(GRAPHS_DIR, entry["file"])
+
+def _arrays_dir(entry):
+    return os.path.join(GRAPHS_DIR, os.path.splitext(entry["file"])[0])
+
+def _properties_path(entry):
+    return os.path.join(GRAPHS_DIR, os.path.splitext(entry["file"])[0] + ".props.json")
+
+def _new_file_name(catalog, name):
+    base = re.sub(r"[^A-Za-z0-9_-]", "_", name) or "grafo"
+    used = {entry["file"] for entry in catalog.values()}
+    file_name = f"{base}.json"
+    suffix = 1
+    while file_name in used or file_name == os.path.basename(CATALOG_PATH) or os.path.exists(os.path.join(GRAPHS_DIR, file_name)):
+        file_name = f"{base}_{suffix}.json"
+        suffix += 1
+    return file_name
+
+def _catalog_entry(file_name, record):
+    return {
+        "file": file_name,
+        "type": record.get("type", METADATA_DEFAULTS["type"]),
+        "vertices": len(record["vertices"]),
+        "edges": len(record["edges"]),
+        "journal_seq": record.get("journal_seq", 0),
+    }
+
+def migrate_library():
+    if os.path.exists(SINGLE_FILE_PATH):
+        records = _read_json(SINGLE_FILE_PATH)
+        source = SINGLE_FILE_PATH
+    else:
+        legacy = _read_json(LEGACY_PATH)
+        records = {name: record_from_adjacency(graph_info) for name, graph_info in legacy.items()}
+        source = LEGACY_PATH
+
+    catalog = {}
+    for name, record in records.items():
+        file_name = _new_file_name(catalog, name)
+        _write_json(os.path.join(GRAPHS_DIR, file_name), record)
+        catalog[name] = _catalog_entry(file_name, record)
+    _write_json(CATALOG_PATH, catalog)
+    os.remove(source)
+    return catalog
+
+def library_exists():
+    return os.path.exists(CATALOG_PATH) or os.path.exists(SINGLE_FILE_PATH) or os.path.exists(LEGACY_PATH)
+
+def _base_catalog():
+    if not os.path.exists(CATALOG_PATH):
+        if os.path.exists(SINGLE_FILE_PATH) or os.path.exists(LEGACY_PATH):
+            return migrate_library()
+        return {}
+    return _read_json(CATALOG_PATH)
+
+def _name_of_file(catalog, file_name):
+    for name, entry in catalog.items():
+        if entry["file"] == file_name:
+            return name
+    return None
+
+def _apply_catalog_op(catalog, op):
+    current = _name_of_file(catalog, op["file"])
+    if op["op"] == "create_graph":
+        if current is None:
+            catalog[op["graph"]] = op["entry"]
+    elif op["op"] == "rename_graph":
+        if current is not None and op["graph"] not in catalog:
+            catalog = {op["graph"] if name == current else name: entry for name, entry in catalog.items()}
+    elif op["op"] == "delete_graph":
+        if current is not None:
+            del catalog[current]
+    return catalog
+
+def _replay_catalog(ops):
+    catalog = _base_catalog()
+    for op in ops:
+        if op["op"] in CATALOG_OPS:
+            catalog = _apply_catalog_op(catalog, op)
+    return catalog
+
+def _pending_edits(ops, file_name):
+    pending = []
+    for op in ops:
+        if op.get("file") != file_name:
+            continue
+        if op["op"] in ("create_graph", "delete_graph"):
+            pending = []
+        elif op["op"] in EDIT_OPS:
+            pending.append(op)
+    return pending
+
+def _edit_seq(ops, entry):
+    if "journal_seq" in entry:
+        seq = entry["journal_seq"]
+    else:
+        seq = ops[0]["seq"] if ops and ops[0]["op"] == "checkpoint" else 0
+    for op in ops:
+        if op.get("file") == entry["file"] and (op["op"] == "create_graph" or op["op"] in EDIT_OPS):
+            seq = op["seq"]
+    return seq
+
+def _replay_record(entry, ops):
+    record = _read_json(_payload_path(entry))
+    pending = [op for op in _pending_edits(ops, entry["file"]) if op["seq"] > record.get("journal_seq", 0)]
+    if not pending:
+        return record, False
+
+    graph_info = adjacency_from_record(record)
+    for op in pending:
+        journal.apply_op(graph_info, op)
+    record = record_from_adjacency(graph_info)
+    record["journal_seq"] = pending[-1]["seq"]
+    return record, True
+
+def _append(op):
+    journal.append(JOURNAL_PATH, op)
+    if journal.size(JOURNAL_PATH) > COMPACT_BYTES:
+        compact()
+
+def read_catalog():
+    return _replay_catalog(journal.read_ops(JOURNAL_PATH))
+
+def list_graphs():
+    return list(read_catalog().keys())
+
+def graph_exists(name):
+    return name in read_catalog()
+
+def read_record(name):
+    ops = journal.read_ops(JOURNAL_PATH)
+    return _replay_record(_replay_catalog(ops)[name], ops)[0]
+
+def _load_graph(name, ops, entry):
+    if _pending_edits(ops, entry["file"]):
+        record, replayed = _replay_record(entry, ops)
+        if replayed or not npstore.available():
+            return graph_from_record(name, record)
+    elif not npstore.available():
+        return graph_from_record(name, _read_json(_payload_path(entry)))
+
+    arrays_dir = _arrays_dir(entry)
+    if not npstore.is_current(arrays_dir, _payload_path(entry)):
+        npstore.write_graph(arrays_dir, graph_from_record(name, _read_json(_payload_path(entry))))
+    return npstore.open_graph(name, arrays_dir)
+
+def load_graph(name):
+    ops = journal.read_ops(JOURNAL_PATH)
+    entry = _replay_catalog(ops)[name]
+    graph = _load_graph(name, ops, entry)
+    graph.directory = _arrays_dir(entry)
+    graph.edit_seq = _edit_seq(ops, entry)
+    return graph
+
+def locate(name):
+    ops = journal.read_ops(JOURNAL_PATH)
+    entry = _replay_catalog(ops)[name]
+    return dict(entry, directory=_arrays_dir(entry), edit_seq=_edit_seq(ops, entry))
+
+def create_graph(name, record):
+    file_name = _new_file_name(read_catalog(), name)
+    _write_json(os.path.join(GRAPHS_DIR, file_name), record)
+    _append({"op": "create_graph", "file": file_name, "graph": name, "entry": _catalog_entry(file_name, record)})
+
+def apply_edits(location, ops):
+    for op in ops:
+        location["edit_seq"] = journal.append(JOURNAL_PATH, dict(op, file=location["file"]))["seq"]
+    if journal.size(JOURNAL_PATH) > COMPACT_BYTES:
+        compact()
+
+def apply_edit(name, op):
+    apply_edits(locate(name), [op])
+
+def rename_graph(old_name, new_name):
+    _append({"op": "rename_graph", "file": read_catalog()[old_name]["file"], "graph": new_name})
+
+def delete_graph(name):
+    entry = read_catalog()[name]
+    _append({"op": "delete_graph", "file": entry["file"]})
+    if os.path.exists(_payload_path(entry)):
+        os.remove(_payload_path(entry))
+    npstore.remove_graph(_arrays_dir(entry))
+    if os.path.exists(_properties_path(entry)):
+        os.remove(_properties_path(entry))
+
+def read_properties(name):
+    catalog = read_catalog()
+    if name not in catalog or not os.path.exists(_properties_path(catalog[name])):
+        return None
+    try:
+        return _read_json(_properties_path(catalog[name]))
+    except ValueError:
+        return None
+
+def write_properties(name, properties):
+    catalog = read_catalog()
+    if name in catalog:
+        _write_json(_properties_path(catalog[name]), properties)
+
+def compact():
+    with journal.locked(JOURNAL_PATH):
+        ops = journal.read_ops(JOURNAL_PATH)
+        if not ops:
+            return
+        catalog = _replay_catalog(ops)
+        edited = {op["file"] for op in ops if op["op"] in EDIT_OPS}
+
+        for name, entry in catalog.items():
+            if entry["file"] not in edited:
+                continue
+            record, replayed = _replay_record(entry, ops)
+            if replayed:
+                _write_json(_payload_path(entry), record)
+                catalog[name] = _catalog_entry(entry["file"], record)
+                if npstore.available():
+                    npstore.write_graph(_arrays_dir(entry), graph_from_record(name, record))
+
+        _write_json(CATALOG_PATH, catalog)
+        journal.checkpoint(JOURNAL_PATH, ops[-1]["seq"])
+
+if __name__ == "__main__":
+    if os.path.exists(SINGLE_FILE_PATH) or os.path.exists(LEGACY_PATH):
+        migrated = migrate_library()
+        print(f"{len(migrated)} grafos migrados para {GRAPHS_DIR}.")
+    else:
+        print("Nenhuma biblioteca antiga para migrar.")
+    compact()
+    print("Diário de edições compactado.")
@@ -0,0 +1,264 @@
+import os
+import threading
+
+from core import npstore, store
+
+META_FILE = "topo.json"
+VECTOR_MIN_LAYER = 64
+
+_lock = threading.Lock()
+_orders = {}
+
+class DynamicOrder:
+    def __init__(self, order, arcs, seq=0):
+        self.order = list(order)
+        self.position = {v: i for i, v in enumerate(self.order)}
+        self.successors = {v: set() for v in self.order}
+        self.predecessors = {v: set() for v in self.order}
+        self.seq = seq
+        for u, v in arcs:
+            self.successors[u].add(v)
+            self.predecessors[v].add(u)
+
+    def names(self):
+        return [v for v in self.order if v is not None]
+
+    def add_vertex(self, v):
+        if v not in self.position:
+            self.position[v] = len(self.order)
+            self.order.append(v)
+            self.successors[v] = set()
+            self.predecessors[v] = set()
+
+    def remove_vertex(self, v):
+        if v not in self.position:
+            return
+        self.order[self.position.pop(v)] = None
+        for w in self.successors.pop(v):
+            self.predecessors[w].discard(v)
+        for w in self.predecessors.pop(v):
+            self.successors[w].discard(v)
+
+    def rename_vertex(self, old, new):
+        if old not in self.position or new in self.position:
+            return
+        self.position[new] = self.position.pop(old)
+        self.order[self.position[new]] = new
+        self.successors[new] = self.successors.pop(old)
+        self.predecessors[new] = self.predecessors.pop(old)
+        for w in self.successors[new]:
+            self.predecessors[w].discard(old)
+            self.predecessors[w].add(new)
+        for w in self.predecessors[new]:
+            self.successors[w].discard(old)
+            self.successors[w].add(new)
+
+    def remove_arc(self, u, v):
+        if u in self.successors:
+            self.successors[u].discard(v)
+        if v in self.predecessors:
+            self.predecessors[v].discard(u)
+
+    def insert(self, u, v):
+        self.add_vertex(u)
+        self.add_vertex(v)
+        if u == v:
+            return [u]
+        if v in self.successors[u]:
+            return None
+        lower, upper = self.position[v], self.position[u]
+        if lower < upper:
+            cycle = self._reorder(u, v, lower, upper)
+            if cycle:
+                return cycle
+        self.successors[u].add(v)
+        self.predecessors[v].add(u)
+        return None
+
+    def _reorder(self, u, v, lower, upper):
+        parents = {v: None}
+        forward = []
+        stack = [v]
+        while stack:
+            w = stack.pop()
+            forward.append(w)
+            for x in self.successors[w]:
+                if x == u:
+                    cycle = [w]
+                    while parents[cycle[-1]] is not None:
+                        cycle.append(parents[cycle[-1]])
+                    return [u] + cycle[::-1]
+                if x not in parents and self.position[x] <= upper:
+                    parents[x] = w
+                    stack.append(x)
+
+        seen = {u}
+        backward = []
+        stack = [u]
+        while stack:
+            w = stack.pop()
+            backward.append(w)
+            for x in self.predecessors[w]:
+                if x not in seen and self.position[x] >= lower:
+                    seen.add(x)
+                    stack.append(x)
+
+        backward.sort(key=self.position.__getitem__)
+        forward.sort(key=self.position.__getitem__)
+        slots = sorted(self.position[w] for w in backward + forward)
+        for w, slot in zip(backward + forward, slots):
+            self.position[w] = slot
+            self.order[slot] = w
+        return None
+
+    def apply(self, op):
+        kind = op["op"]
+        if kind == "add_vertex":
+            self.add_vertex(op["vertex"])
+        elif kind == "remove_vertex":
+            self.remove_vertex(op["vertex"])
+        elif kind == "rename_vertex":
+            self.rename_vertex(op["old"], op["new"])
+        elif kind == "set_edge":
+            if op["weight"] == 0:
+                self.remove_arc(op["source"], op["target"])
+            else:
+                return self.insert(op["source"], op["target"])
+        return None
+
+class KahnSweep:
+    def __init__(self, graph):
+        self.graph = graph
+        self.cycle = None
+        self.sorted_count = 0
+
+    def __iter__(self):
+        if npstore.available():
+            return self._numpy_layers()
+        return self._layers()
+
+    def _layers(self):
+        offsets = self.graph.out_offsets.tolist()
+        targets = self.graph.out_targets.tolist()
+        in_offsets = self.graph.in_offsets.tolist()
+        indegree = [in_offsets[v + 1] - in_offsets[v] for v in range(self.graph.num_vertices())]
+        layer = [v for v, degree in enumerate(indegree) if degree == 0]
+        while layer:
+            yield layer
+            self.sorted_count += len(layer)
+            following = []
+            for u in layer:
+                for v in targets[offsets[u]:offsets[u + 1]]:
+                    indegree[v] -= 1
+                    if indegree[v] == 0:
+                        following.append(v)
+            layer = following
+        self._find_cycle(indegree)
+
+    def _numpy_layers(self):
+        import numpy as np
+        offsets = np.asarray(self.graph.out_offsets, dtype=np.int64)
+        targets = np.asarray(self.graph.out_targets, dtype=np.int64)
+        indegree = np.diff(np.asarray(self.graph.in_offsets, dtype=np.int64))
+        layer = np.flatnonzero(indegree == 0).tolist()
+        while layer:
+            yield layer
+            self.sorted_count += len(layer)
+            if len(layer) < VECTOR_MIN_LAYER:
+                following = []
+                for u in layer:
+                    for v in targets[offsets[u]:offsets[u + 1]].tolist():
+                        indegree[v] -= 1
+                        if indegree[v] == 0:
+                            following.append(v)
+                layer = following
+                continue
+            layer = np.asarray(layer)
+            starts, counts = offsets[layer], offsets[layer + 1] - offsets[layer]
+            total = int(counts.sum())
+            arcs = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+            heads, decrements = np.unique(targets[arcs], return_counts=True)
+            indegree[heads] -= decrements
+            layer = heads[indegree[heads] == 0].tolist()
+        self._find_cycle(indegree.tolist())
+
+    def _find_cycle(self, indegree):
+        remaining = [v for v, degree in enumerate(indegree) if degree > 0]
+        if not remaining:
+            return
+        step = {}
+        v = remaining[0]
+        while v not in step:
+            step[v] = next(u for u in self.graph.in_neighbors(v) if indegree[u] > 0)
+            v = step[v]
+        cycle = [v]
+        while step[cycle[-1]] != v:
+            cycle.append(step[cycle[-1]])
+        self.cycle = cycle[::-1]
+
+def _meta_path(graph):
+    directory = getattr(graph, "directory", None)
+    return os.path.join(directory, META_FILE) if directory else None
+
+def _write(directory, names, seq):
+    os.makedirs(directory, exist_ok=True)
+    npstore.save_meta(os.path.join(directory, META_FILE), {"seq": seq, "order": names})
+
+def save(graph, order):
+    if _meta_path(graph) is not None:
+        _write(graph.directory, graph.names(order), graph.edit_seq)
+
+def discard(name, directory):
+    with _lock:
+        _orders.pop(name, None)
+    meta_path = os.path.join(directory, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+def load(graph):
+    meta_path = _meta_path(graph)
+    if meta_path is None:
+        return None
+    meta = npstore.load_meta(meta_path)
+    if meta is None or meta.get("seq", -1) < graph.edit_seq:
+        return None
+    return [graph.vertex_id(name) for name in meta["order"]]
+
+def open_order(name, location):
+    seq = location["edit_seq"]
+    with _lock:
+        dag = _orders.get(name)
+        if dag is not None and dag.seq == seq:
+            return dag
+
+    meta = npstore.load_meta(os.path.join(location["directory"], META_FILE))
+    if meta is None or meta.get("seq", -1) < seq:
+        return None
+    graph = store.load_graph(name)
+    if graph.type == "undirected":
+        return None
+    names = graph.names(range(graph.num_vertices()))
+    dag = DynamicOrder(meta["order"], ((names[u], names[v]) for u, v, weight in graph.arcs()), seq)
+    with _lock:
+        _orders[name] = dag
+    return dag
+
+def cycle_warning(cycle):
+    target = cycle[1] if len(cycle) > 1 else cycle[0]
+    return f"A aresta {cycle[0]} -> {target} foi salva, mas fecha o ciclo {' -> '.join(map(str, cycle + cycle[:1]))}. A ordem topológica salva foi descartada."
+
+def apply_edits(name, dag, ops, location):
+    if dag is None:
+        return None
+    for op in ops:
+        if op["op"] == "set_type" and op["type"] == "undirected":
+            discard(name, location["directory"])
+            return None
+        cycle = dag.apply(op)
+        if cycle:
+            discard(name, location["directory"])
+            return cycle
+
+    dag.seq = location["edit_seq"]
+    _write(location["directory"], dag.names(), dag.seq)
+    return None
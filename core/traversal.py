@@ -0,0 +1,53 @@
+from collections import deque
+
+def dfs(graph, start, neighbors=None, visited=None, pre=None, edge=None, post=None):
+    neighbors = neighbors or graph.out_neighbors
+    visited = set() if visited is None else visited
+
+    visited.add(start)
+    path = [start]
+    if pre and pre(start):
+        return path
+    iterators = [iter(neighbors(start))]
+
+    while iterators:
+        for v in iterators[-1]:
+            if edge and edge(path[-1], v):
+                return path
+            if v not in visited:
+                visited.add(v)
+                path.append(v)
+                if pre and pre(v):
+                    return path
+                iterators.append(iter(neighbors(v)))
+                break
+        else:
+            iterators.pop()
+            if post and post(path[-1]):
+                return path
+            path.pop()
+    return None
+
+def bfs(graph, start, neighbors=None, visited=None, pre=None, edge=None):
+    neighbors = neighbors or graph.out_neighbors
+    visited = set() if visited is None else visited
+
+    visited.add(start)
+    if pre and pre(start):
+        return True
+    queue = deque([start])
+
+    while queue:
+        u = queue.popleft()
+        for v in neighbors(u):
+            if edge and edge(u, v):
+                return True
+            if v not in visited:
+                visited.add(v)
+                if pre and pre(v):
+                    return True
+                queue.append(v)
+    return False
+
+def undirected_neighbors(graph):
+    return lambda u: graph.out_neighbors(u) + graph.in_neighbors(u)
@@ -0,0 +1,7 @@
+def show_result(result):
+    from tkinter import messagebox
+    kind, title, message = result
+    if kind == "error":
+        messagebox.showerror(title, message)
+    else:
+        messagebox.showinfo(title, message)
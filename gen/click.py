@@ -1,27 +1,46 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, ui
+
+def check_click(graph, vertices, log):
+    log(f"Vértices fornecidos: {vertices}")
+
+    for i, v1 in enumerate(vertices):
+        if not graph.has_vertex(v1):
+            log(f"Vértice {v1} não existe no grafo.")
+            return ("error", "Não é um Clique", f"Vértice {v1} não existe no grafo.")
+        for v2 in vertices[i+1:]:
+            if not graph.has_vertex(v2):
+                log(f"Vértice {v2} não existe no grafo.")
+                return ("error", "Não é um Clique", f"Vértice {v2} não existe no grafo.")
+            
+            if not graph.has_edge(graph.vertex_id(v1), graph.vertex_id(v2)):
+                log(f"Vértices {v1} e {v2} não são adjacentes. O conjunto não é um clique.")
+                return ("error", "Não é um Clique", f"Vértices {v1} e {v2} não são adjacentes. O conjunto não é um clique.")
+
+    log("O conjunto é um clique.")
+    return ("info", "Clique", "O conjunto é um clique.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,26 +52,28 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar Clique", command=self.check_click).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_click(self):
+        import tkinter as tk
+        from tkinter import simpledialog
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando verificação de clique...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
         vertices_input = simpledialog.askstring("Entrada", "Digite o conjunto de vértices (separados por vírgula):")
         if not vertices_input:
             self.log_message("Nenhum vértice fornecido.")
@@ -61,28 +82,10 @@ class VerificationApp:
         vertices = vertices_input.split(',')
         vertices = [v.strip() for v in vertices]
 
-        self.log_message(f"Vértices fornecidos: {vertices}")
-
-        for i, v1 in enumerate(vertices):
-            if v1 not in adjacency_matrix:
-                self.log_message(f"Vértice {v1} não existe no grafo.")
-                messagebox.showerror("Não é um Clique", f"Vértice {v1} não existe no grafo.")
-                return
-            for v2 in vertices[i+1:]:
-                if v2 not in adjacency_matrix:
-                    self.log_message(f"Vértice {v2} não existe no grafo.")
-                    messagebox.showerror("Não é um Clique", f"Vértice {v2} não existe no grafo.")
-                    return
-                
-                if adjacency_matrix[v1].get(v2, 1) == 0:
-                    self.log_message(f"Vértices {v1} e {v2} não são adjacentes. O conjunto não é um clique.")
-                    messagebox.showerror("Não é um Clique", f"Vértices {v1} e {v2} não são adjacentes. O conjunto não é um clique.")
-                    return
-
-        self.log_message("O conjunto é um clique.")
-        messagebox.showinfo("Clique", "O conjunto é um clique.")
+        ui.show_result(check_click(graph, vertices, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,27 +1,57 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, ui
+
+def check_dominating_set(graph, vertices, log):
+    all_vertices = set(graph.vertices)
+
+    test_set = set(vertices)
+    log(f"Conjunto de vértices fornecido: {test_set}")
+    
+    covered_vertices = set(test_set)
+
+    for vertex in test_set:
+        if graph.has_vertex(vertex):
+            covered_vertices.update(graph.names(graph.out_neighbors(graph.vertex_id(vertex))))
+
+    if covered_vertices == all_vertices:
+        log("O conjunto especificado cobre todos os vértices.")
+        for vertex in test_set:
+            temp_set = test_set - {vertex}
+            temp_covered = set(temp_set)
+            for v in temp_set:
+                if graph.has_vertex(v):
+                    temp_covered.update(graph.names(graph.out_neighbors(graph.vertex_id(v))))
+            if temp_covered == all_vertices:
+                log(f"O conjunto especificado {test_set} não é minimal.")
+                return ("error", "Não é um Conjunto Dominante Minimal", f"O conjunto especificado {test_set} não é minimal.")
+        log(f"O conjunto especificado {test_set} é um conjunto dominante minimal.")
+        return ("info", "Conjunto Dominante Minimal", f"O conjunto especificado {test_set} é um conjunto dominante minimal.")
+    else:
+        missing_vertices = all_vertices - covered_vertices
+        log(f"O conjunto especificado não é um conjunto dominante. Vértices faltando: {', '.join(missing_vertices)}.")
+        return ("error", "Não é um Conjunto Dominante", f"O conjunto especificado não é um conjunto dominante. Vértices faltando: {', '.join(missing_vertices)}.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,65 +63,37 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar Conjunto Dominante", command=self.check_dominating_set).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_dominating_set(self):
+        import tkinter as tk
+        from tkinter import simpledialog
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando verificação do conjunto dominante especificado...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-        all_vertices = set(adjacency_matrix.keys())
-
         vertices_input = simpledialog.askstring("Entrada", "Digite o conjunto de vértices (separados por vírgula):")
         if not vertices_input:
             self.log_message("Nenhum vértice fornecido.")
             return
 
-        test_set = {v.strip() for v in vertices_input.split(',')}
-        self.log_message(f"Conjunto de vértices fornecido: {test_set}")
-        
-        covered_vertices = set(test_set)
-
-        for vertex in test_set:
-            if vertex in adjacency_matrix:
-                for neighbor in adjacency_matrix[vertex]:
-                    if adjacency_matrix[vertex][neighbor] != 0:
-                        covered_vertices.add(neighbor)
-
-        if covered_vertices == all_vertices:
-            self.log_message("O conjunto especificado cobre todos os vértices.")
-            for vertex in test_set:
-                temp_set = test_set - {vertex}
-                temp_covered = set(temp_set)
-                for v in temp_set:
-                    if v in adjacency_matrix:
-                        for neighbor in adjacency_matrix[v]:
-                            if adjacency_matrix[v][neighbor] != 0:
-                                temp_covered.add(neighbor)
-                if temp_covered == all_vertices:
-                    self.log_message(f"O conjunto especificado {test_set} não é minimal.")
-                    messagebox.showerror("Não é um Conjunto Dominante Minimal", f"O conjunto especificado {test_set} não é minimal.")
-                    return
-            self.log_message(f"O conjunto especificado {test_set} é um conjunto dominante minimal.")
-            messagebox.showinfo("Conjunto Dominante Minimal", f"O conjunto especificado {test_set} é um conjunto dominante minimal.")
-        else:
-            missing_vertices = all_vertices - covered_vertices
-            self.log_message(f"O conjunto especificado não é um conjunto dominante. Vértices faltando: {', '.join(missing_vertices)}.")
-            messagebox.showerror("Não é um Conjunto Dominante", f"O conjunto especificado não é um conjunto dominante. Vértices faltando: {', '.join(missing_vertices)}.")
+        ui.show_result(check_dominating_set(graph, [v.strip() for v in vertices_input.split(',')], self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
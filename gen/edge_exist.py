@@ -1,27 +1,37 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, ui
+
+def check_edge_existence(graph, vertex1, vertex2, log):
+    if graph.has_vertex(vertex1) and graph.has_vertex(vertex2) and \
+       graph.has_edge(graph.vertex_id(vertex1), graph.vertex_id(vertex2)):
+        weight = graph.weight(graph.vertex_id(vertex1), graph.vertex_id(vertex2))
+        message = f"A aresta ({vertex1} - {vertex2}) existe com peso {weight}."
+    else:
+        message = f"A aresta ({vertex1} - {vertex2}) não existe."
+    log(message)
+    return ("info", "Existência da Aresta", message)
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,42 +43,32 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar Existência de Aresta", command=self.check_edge).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
     
     def check_edge(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        from tkinter import simpledialog
+        graph = self.get_selected_graph()
+        if not graph:
             return
         vertex1 = simpledialog.askstring("Vértice", "Digite o vértice inicial da aresta:")
         vertex2 = simpledialog.askstring("Vértice", "Digite o vértice final da aresta:")
         
         if vertex1 and vertex2:
             self.log_message(f"Verificando a existência da aresta entre {vertex1} e {vertex2}...")
-            self.check_edge_existence(graph_info, vertex1.strip(), vertex2.strip())
-    
-    def check_edge_existence(self, graph_info, vertex1, vertex2):
-        adjacency_matrix = graph_info['adjacency_matrix']
-        
-        if vertex1 in adjacency_matrix and vertex2 in adjacency_matrix and \
-           adjacency_matrix[vertex1].get(vertex2, 0) != 0:
-            weight = adjacency_matrix[vertex1][vertex2]
-            message = f"A aresta ({vertex1} - {vertex2}) existe com peso {weight}."
-            self.log_message(message)
-            messagebox.showinfo("Existência da Aresta", message)
-        else:
-            message = f"A aresta ({vertex1} - {vertex2}) não existe."
-            self.log_message(message)
-            messagebox.showinfo("Existência da Aresta", message)
+            ui.show_result(check_edge_existence(graph, vertex1.strip(), vertex2.strip(), self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,27 +1,45 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, ui
+
+def check_independent_set(graph, vertices, log):
+    for i, v1 in enumerate(vertices):
+        if not graph.has_vertex(v1):
+            log(f"Vértice {v1} não encontrado no grafo.")
+            return ("error", "Erro", f"Vértice {v1} não encontrado no grafo.")
+        
+        for v2 in vertices[i+1:]:
+            if not graph.has_vertex(v2):
+                log(f"Vértice {v2} não encontrado no grafo.")
+                return ("error", "Erro", f"Vértice {v2} não encontrado no grafo.")
+            
+            if graph.has_edge(graph.vertex_id(v1), graph.vertex_id(v2)):
+                log(f"Vértices {v1} e {v2} são adjacentes. O conjunto não é independente.")
+                return ("error", "Não é Conjunto Independente", f"Vértices {v1} e {v2} são adjacentes. O conjunto não é independente.")
+
+    log("O conjunto é independente.")
+    return ("info", "Conjunto Independente", "O conjunto é independente.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -33,26 +51,28 @@ class VerificationApp:
         tk.Button(self.root, text="Verificar Conjunto de Vértices Independentes", command=self.check_independent_set).pack(pady=20)
         
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_independent_set(self):
+        import tkinter as tk
+        from tkinter import simpledialog
         self.log_text.delete(1.0, tk.END)
         self.log_message("Iniciando verificação do conjunto independente...")
 
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
         vertices_input = simpledialog.askstring("Entrada", "Digite o conjunto de vértices (separados por vírgula):")
         if not vertices_input:
             self.log_message("Nenhum vértice fornecido.")
@@ -61,27 +81,10 @@ class VerificationApp:
         vertices = vertices_input.split(',')
         vertices = [v.strip() for v in vertices]
 
-        for i, v1 in enumerate(vertices):
-            if v1 not in adjacency_matrix:
-                self.log_message(f"Vértice {v1} não encontrado no grafo.")
-                messagebox.showerror("Erro", f"Vértice {v1} não encontrado no grafo.")
-                return
-            
-            for v2 in vertices[i+1:]:
-                if v2 not in adjacency_matrix:
-                    self.log_message(f"Vértice {v2} não encontrado no grafo.")
-                    messagebox.showerror("Erro", f"Vértice {v2} não encontrado no grafo.")
-                    return
-                
-                if adjacency_matrix[v1].get(v2, 0) != 0:
-                    self.log_message(f"Vértices {v1} e {v2} são adjacentes. O conjunto não é independente.")
-                    messagebox.showerror("Não é Conjunto Independente", f"Vértices {v1} e {v2} são adjacentes. O conjunto não é independente.")
-                    return
-
-        self.log_message("O conjunto é independente.")
-        messagebox.showinfo("Conjunto Independente", "O conjunto é independente.")
+        ui.show_result(check_independent_set(graph, vertices, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
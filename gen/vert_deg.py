@@ -1,13 +1,23 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store, ui
+
+def check_vertex_degree(graph, vertex, log):
+    if not graph.has_vertex(vertex):
+        log(f"Erro: O vértice {vertex} não existe no grafo.")
+        return ("error", "Erro", f"O vértice {vertex} não existe no grafo.")
+
+    degree = graph.out_degree(graph.vertex_id(vertex))
+    log(f"O grau do vértice {vertex} é {degree}.")
+    return ("info", "Grau do Vértice", f"O grau do vértice {vertex} é {degree}.")
 
 class VerificationApp:
     def __init__(self, root):
+        import tkinter as tk
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         
         self.log_text = tk.Text(self.root, height=20, width=70)
@@ -19,18 +29,18 @@ class VerificationApp:
         self.log_message("Aplicativo inicializado.")
 
     def load_graphs(self):
+        from tkinter import messagebox
         self.log_message("Tentando carregar grafos do arquivo...")
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.log_message("Erro: Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
         self.log_message(f"{len(self.graph_names)} grafos carregados com sucesso.")
 
     def create_widgets(self):
+        import tkinter as tk
         self.log_message("Criando widgets da interface...")
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         
@@ -42,21 +52,24 @@ class VerificationApp:
         self.log_message("Widgets criados.")
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             self.log_message("Erro: Nome de grafo inválido selecionado.")
             return None
         self.log_message(f"Grafo selecionado: {graph_name}.")
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def check_vertex_degree(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        from tkinter import simpledialog
+        graph = self.get_selected_graph()
+        if not graph:
             self.log_message("Verificação de grau cancelada.")
             return
 
@@ -64,16 +77,10 @@ class VerificationApp:
         self.log_message(f"Vértice solicitado: {vertex}.")
 
         if vertex:
-            adjacency_matrix = graph_info['adjacency_matrix']
-            if vertex in adjacency_matrix:
-                degree = sum(1 for v in adjacency_matrix[vertex] if adjacency_matrix[vertex][v] != 0)
-                messagebox.showinfo("Grau do Vértice", f"O grau do vértice {vertex} é {degree}.")
-                self.log_message(f"O grau do vértice {vertex} é {degree}.")
-            else:
-                messagebox.showerror("Erro", f"O vértice {vertex} não existe no grafo.")
-                self.log_message(f"Erro: O vértice {vertex} não existe no grafo.")
+            ui.show_result(check_vertex_degree(graph, vertex, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
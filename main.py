@@ -1,5 +1,7 @@
+import sys
+import time
 import tkinter as tk
-import subprocess
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -15,31 +17,33 @@ class MainApp:
         tk.Button(self.root, text="Projeto Final", command=self.proj_graph).pack(pady=10)
 
     def edit_graph(self):
-        result = subprocess.run(["python", "editor.py"], capture_output=True, text=True, cwd="./src")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/editor.py")
 
     def check_graph(self):
-        result = subprocess.run(["python", "check.py"], capture_output=True, text=True, cwd="./src")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/check.py")
     
     def quest_graph(self):
-        result = subprocess.run(["python", "quest.py"], capture_output=True, text=True, cwd="./src")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/quest.py")
     
     def gen_graph(self):
-        result = subprocess.run(["python", "path.py"], capture_output=True, text=True, cwd="./src")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/path.py")
     
     def proj_graph(self):
-        result = subprocess.run(["python", "project.py"], capture_output=True, text=True, cwd="./")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "project.py")
     
+def print_import_report():
+    started = time.perf_counter()
+    timings, heavy = registry.import_report()
+    for path, seconds in sorted(timings, key=lambda item: item[1], reverse=True):
+        print(f"{seconds * 1000:9.2f} ms  {path}")
+    print(f"{(time.perf_counter() - started) * 1000:9.2f} ms  total")
+    print("Bibliotecas pesadas carregadas: " + (", ".join(heavy) if heavy else "nenhuma"))
+
 if __name__ == "__main__":
+    if "--import-report" in sys.argv:
+        print_import_report()
+        sys.exit()
+
     root = tk.Tk()
     root.geometry("640x480")
     app = MainApp(root)
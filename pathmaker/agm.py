@@ -1,15 +1,64 @@
-import tkinter as tk
-import networkx as nx
-import matplotlib.pyplot as plt
-from tkinter import messagebox
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, mst, store, ui
+
+def spanning_forest(graph, start_vertex, log):
+    if not graph.has_vertex(start_vertex):
+        log(f"Vértice inicial {start_vertex} não existe no grafo.")
+        return None
+    return mst.minimum_spanning_forest(graph)
+
+def forest_edges(graph, forest):
+    if not forest:
+        return []
+    return [(graph.name_of(u), graph.name_of(v), weight) for u, v, weight in forest.edges]
+
+def report_mst(graph, start_vertex, forest, log):
+    if not forest or not forest.edges:
+        log("Nenhuma AGM encontrada.")
+        return ("error", "AGM", "Nenhuma AGM encontrada.")
+
+    named_edges = forest_edges(graph, forest)
+    selected_vertices = [start_vertex]
+    predecessors = {}
+    for u, v, weight in named_edges:
+        selected_vertices.append(u)
+        selected_vertices.append(v)
+        predecessors[v] = u
+    edges = [f"{u}-{v} (peso {w})" for u, v, w in named_edges]
+    total_weight = forest.total_weight()
+
+    if forest.component_count() == 1:
+        log("Árvore Geradora Mínima encontrada com peso total: " + str(total_weight))
+    else:
+        log(f"O grafo não é conexo: Floresta Geradora Mínima com {forest.component_count()} componentes e peso total: {total_weight}")
+    log("Arestas na AGM:\n" + "\n".join(edges))
+    log("Vértices selecionados: " + ", ".join(list(set(selected_vertices))))
+    log("Antecessores: " + ", ".join([f"{v}: {p}" for v, p in predecessors.items()]))
+
+    if forest.component_count() == 1:
+        return ("info", "AGM", "Árvore Geradora Mínima encontrada:\n" + "\n".join(edges) + f"\nPeso Total: {total_weight}")
+    components = []
+    for component, (total, vertices) in enumerate(zip(forest.totals, forest.components())):
+        members = ", ".join(graph.names(vertices))
+        log(f"Componente {component + 1} ({members}): peso {total}")
+        components.append(f"Componente {component + 1} ({members}): peso {total}")
+    return ("info", "Floresta Geradora Mínima", "O grafo não é conexo. Floresta Geradora Mínima encontrada:\n" + "\n".join(edges) + "\n" + "\n".join(components) + f"\nPeso Total: {total_weight}")
+
+def find_mst(graph, start_vertex, log):
+    if not graph.has_weights or graph.type != "undirected":
+        return ("error", "Erro", "A AGM só pode ser encontrada para grafos não direcionados com pesos.")
+
+    log("Iniciando a busca pela Árvore Geradora Mínima...")
+    return report_mst(graph, start_vertex, spanning_forest(graph, start_vertex, log), log)
 
 class VerificationApp:
     def __init__(self, root):
+        import tkinter as tk
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
 
         self.log_text = tk.Text(self.root, height=20, width=70)
@@ -19,18 +68,18 @@ class VerificationApp:
         self.create_widgets()
 
     def load_graphs(self):
+        from tkinter import messagebox
         self.log_message("Tentando carregar grafos do arquivo...")
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.log_message("Erro: Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
         self.log_message(f"{len(self.graph_names)} grafos carregados com sucesso.")
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -44,20 +93,23 @@ class VerificationApp:
         tk.Button(self.root, text="Encontrar Árvore Geradora Mínima (AGM)", command=self.find_mst).pack(pady=20)
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
         self.log_message(f"Grafo selecionado: {graph_name}.")
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def find_mst(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        from tkinter import messagebox
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
         start_vertex = self.start_vertex.get()
@@ -65,81 +117,19 @@ class VerificationApp:
             messagebox.showerror("Erro", "Por favor, insira um vértice inicial.")
             return
 
-        if not graph_info.get('has_weights', False) or graph_info.get('type') != "undirected":
+        if not graph.has_weights or graph.type != "undirected":
             messagebox.showerror("Erro", "A AGM só pode ser encontrada para grafos não direcionados com pesos.")
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
         self.log_message("Iniciando a busca pela Árvore Geradora Mínima...")
-        mst, total_weight, selected_vertices, predecessors = self.kruskal_mst(adjacency_matrix, start_vertex)
-
-        if mst:
-            edges = [f"{u}-{v} (peso {w})" for u, v, w in mst]
-            self.log_message("Árvore Geradora Mínima encontrada com peso total: " + str(total_weight))
-            self.log_message("Arestas na AGM:\n" + "\n".join(edges))
-            self.log_message("Vértices selecionados: " + ", ".join(selected_vertices))
-            self.log_message("Antecessores: " + ", ".join([f"{v}: {p}" for v, p in predecessors.items()]))
-            messagebox.showinfo("AGM", "Árvore Geradora Mínima encontrada:\n" + "\n".join(edges) + f"\nPeso Total: {total_weight}")
-        else:
-            self.log_message("Nenhuma AGM encontrada.")
-            messagebox.showerror("AGM", "Nenhuma AGM encontrada.")
-    
-        self.draw_mst(mst)
-
-    def kruskal_mst(self, adjacency_matrix, start_vertex):
-        edges = []
-        for u in adjacency_matrix:
-            for v, weight in adjacency_matrix[u].items():
-                if u < v and weight > 0:
-                    edges.append((weight, u, v))
-
-        edges.sort()
-        mst = []
-        total_weight = 0
-
-        parent = {}
-        rank = {}
-        selected_vertices = []
-        predecessors = {}
-
-        def find(vertex):
-            if parent[vertex] != vertex:
-                parent[vertex] = find(parent[vertex])
-            return parent[vertex]
-
-        def union(vertex1, vertex2):
-            root1 = find(vertex1)
-            root2 = find(vertex2)
-            if root1 != root2:
-                if rank[root1] > rank[root2]:
-                    parent[root2] = root1
-                elif rank[root1] < rank[root2]:
-                    parent[root1] = root2
-                else:
-                    parent[root2] = root1
-                    rank[root1] += 1
-
-        for vertex in adjacency_matrix:
-            parent[vertex] = vertex
-            rank[vertex] = 0
-
-        if start_vertex in adjacency_matrix:
-            selected_vertices.append(start_vertex)
-            for weight, u, v in edges:
-                if find(u) != find(v):
-                    union(u, v)
-                    mst.append((u, v, weight))
-                    total_weight += weight
-                    selected_vertices.append(u)
-                    selected_vertices.append(v)
-                    predecessors[v] = u
-        else:
-            self.log_message(f"Vértice inicial {start_vertex} não existe no grafo.")
-            return [], 0, [], {}
-
-        return mst, total_weight, list(set(selected_vertices)), predecessors
+        forest = spanning_forest(graph, start_vertex, self.log_message)
+        ui.show_result(report_mst(graph, start_vertex, forest, self.log_message))
+        self.draw_mst(forest_edges(graph, forest))
 
     def draw_mst(self, mst):
+        import matplotlib.pyplot as plt
+        import networkx as nx
+
         G = nx.Graph()
         for u, v, weight in mst:
             G.add_edge(u, v, weight=weight)
@@ -154,6 +144,7 @@ class VerificationApp:
         plt.show()
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
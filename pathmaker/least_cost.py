@@ -1,14 +1,69 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
-import heapq
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import alt, apsp, cache, ch, paths, properties, store, ui
+
+def path_from_tree(graph, tree, goal):
+    goal_id = graph.vertex_id(goal)
+    if not tree.reached(goal_id):
+        return None, float('inf'), {}
+    return graph.names(tree.path(goal_id)), tree.cost(goal_id), tree.predecessor_names()
+
+def dijkstra_shortest_path(graph, start, goal, log):
+    tree = paths.dijkstra(graph, graph.vertex_id(start), graph.vertex_id(goal), log)
+    return path_from_tree(graph, tree, goal)
+
+def find_lowest_cost_path(graph, start_vertex, end_vertex, log):
+    if not graph.has_weights:
+        return ("error", "Erro", "Esta função só funciona para grafos ponderados.")
+
+    if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
+        return ("error", "Erro", "Um ou ambos os vértices não existem no grafo.")
+
+    matrix = apsp.load(graph, "cost")
+    min_weight = properties.get(graph)["min_weight"]
+    if not matrix and ch.rebuilding(graph.name):
+        log("A hierarquia de contração está sendo reconstruída após uma edição; até terminar, a consulta usa ALT ou Dijkstra.")
+    if matrix:
+        log("Consultando a matriz de distâncias pré-calculada...")
+        start_id, end_id = graph.vertex_id(start_vertex), graph.vertex_id(end_vertex)
+        path = matrix.path(start_id, end_id)
+        path, cost, predecessors = (graph.names(path), matrix.distance(start_id, end_id), None) if path else (None, float('inf'), None)
+    elif min_weight is not None and min_weight < 0:
+        log("O grafo tem pesos negativos. Usando Bellman-Ford (SPFA) para o caminho mais curto.")
+        tree, cycle = paths.spfa(graph, graph.vertex_id(start_vertex), log)
+        if cycle:
+            cycle_names = " -> ".join(graph.names(cycle))
+            log(f"Ciclo negativo encontrado: {cycle_names}")
+            return ("error", "Ciclo Negativo", f"O grafo tem um ciclo negativo alcançável a partir de {start_vertex}: {cycle_names}. O caminho de menor custo não está definido.")
+        path, cost, predecessors = path_from_tree(graph, tree, end_vertex)
+    elif ch.load(graph):
+        log("Usando hierarquias de contração para o caminho mais curto.")
+        path, cost = ch.load(graph).query(graph.vertex_id(start_vertex), graph.vertex_id(end_vertex))
+        path, predecessors = (graph.names(path) if path else None), None
+    elif alt.load(graph):
+        log("Usando A* com marcos (ALT) para o caminho mais curto.")
+        tree = alt.astar(graph, graph.vertex_id(start_vertex), graph.vertex_id(end_vertex), alt.load(graph), log)
+        path, cost, predecessors = path_from_tree(graph, tree, end_vertex)
+    else:
+        path, cost, predecessors = dijkstra_shortest_path(graph, start_vertex, end_vertex, log)
+
+    if path:
+        log(f"Caminho de menor custo de {start_vertex} a {end_vertex}: " + " -> ".join(path) + f" com custo {cost}")
+        log("Vértices escolhidos: " + " -> ".join(path))
+        if predecessors is not None:
+            log("Antecessores: " + ", ".join([f"{v}: {p}" for v, p in predecessors.items() if p is not None]))
+        return ("info", "Caminho de Menor Custo", f"Caminho de menor custo de {start_vertex} a {end_vertex}: " + " -> ".join(path) + f" com custo {cost}")
+    else:
+        log(f"Nenhum caminho existe entre {start_vertex} e {end_vertex}.")
+        return ("error", "Sem Caminho", f"Nenhum caminho existe entre {start_vertex} e {end_vertex}.")
 
 class VerificationApp:
     def __init__(self, root):
+        import tkinter as tk
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
@@ -16,19 +71,19 @@ class VerificationApp:
         self.load_graphs()
 
     def load_graphs(self):
+        from tkinter import messagebox
         self.log_message("Tentando carregar grafos do arquivo...")
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.log_message("Erro: Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
         self.update_graph_menu()
         self.log_message(f"{len(self.graph_names)} grafos carregados com sucesso.")
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, "Escolha um grafo")
@@ -47,122 +102,35 @@ class VerificationApp:
         self.selected_graph.set(self.graph_names[0] if self.graph_names else "Escolha um grafo")
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def find_lowest_cost_path(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        from tkinter import messagebox, simpledialog
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        if not graph_info.get('has_weights', False):
+        if not graph.has_weights:
             messagebox.showerror("Erro", "Esta função só funciona para grafos ponderados.")
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
         start_vertex = simpledialog.askstring("Entrada", "Digite o vértice inicial:")
         end_vertex = simpledialog.askstring("Entrada", "Digite o vértice final:")
 
-        if start_vertex not in adjacency_matrix or end_vertex not in adjacency_matrix:
-            messagebox.showerror("Erro", "Um ou ambos os vértices não existem no grafo.")
-            return
-
-        if self.has_negative_cycle(adjacency_matrix, start_vertex):
-            self.log_message("O grafo tem um ciclo negativo. Usando Bellman-Ford para o caminho mais curto.")
-            path, cost, predecessors = self.bellman_ford_shortest_path(adjacency_matrix, start_vertex, end_vertex)
-        else:
-            path, cost, predecessors = self.dijkstra_shortest_path(adjacency_matrix, start_vertex, end_vertex)
-
-        if path:
-            self.log_message(f"Caminho de menor custo de {start_vertex} a {end_vertex}: " + " -> ".join(path) + f" com custo {cost}")
-            self.log_message("Vértices escolhidos: " + " -> ".join(path))
-            self.log_message("Antecessores: " + ", ".join([f"{v}: {p}" for v, p in predecessors.items() if p is not None]))
-            messagebox.showinfo("Caminho de Menor Custo", f"Caminho de menor custo de {start_vertex} a {end_vertex}: " + " -> ".join(path) + f" com custo {cost}")
-        else:
-            self.log_message(f"Nenhum caminho existe entre {start_vertex} e {end_vertex}.")
-            messagebox.showerror("Sem Caminho", f"Nenhum caminho existe entre {start_vertex} e {end_vertex}.")
-
-    def has_negative_cycle(self, adjacency_matrix, start):
-        min_costs = {vertex: float('inf') for vertex in adjacency_matrix}
-        min_costs[start] = 0
-
-        vertices = list(adjacency_matrix.keys())
-        for _ in range(len(vertices) - 1):
-            for u in adjacency_matrix:
-                for v, weight in adjacency_matrix[u].items():
-                    if weight != 0 and min_costs[u] != float('inf') and min_costs[u] + weight < min_costs[v]:
-                        min_costs[v] = min_costs[u] + weight
-
-        for u in adjacency_matrix:
-            for v, weight in adjacency_matrix[u].items():
-                if weight != 0 and min_costs[u] != float('inf') and min_costs[u] + weight < min_costs[v]:
-                    return True
-
-        return False
-
-    def bellman_ford_shortest_path(self, adjacency_matrix, start, goal):
-        min_costs = {vertex: float('inf') for vertex in adjacency_matrix}
-        predecessors = {vertex: None for vertex in adjacency_matrix}
-        min_costs[start] = 0
-
-        vertices = list(adjacency_matrix.keys())
-        for _ in range(len(vertices) - 1):
-            for u in adjacency_matrix:
-                for v, weight in adjacency_matrix[u].items():
-                    if weight != 0 and min_costs[u] != float('inf') and min_costs[u] + weight < min_costs[v]:
-                        min_costs[v] = min_costs[u] + weight
-                        predecessors[v] = u
-                        self.log_message(f"Atualizando custo de {v} para {min_costs[v]} (predecessor: {u})")
-
-        if min_costs[goal] == float('inf'):
-            return None, float('inf'), {}
-
-        path = []
-        current = goal
-        while current is not None:
-            path.insert(0, current)
-            current = predecessors[current]
-
-        return path, min_costs[goal], predecessors
-
-    def dijkstra_shortest_path(self, adjacency_matrix, start, goal):
-        min_costs = {vertex: float('inf') for vertex in adjacency_matrix}
-        min_costs[start] = 0
-        priority_queue = [(0, start, [start])]
-        visited = set()
-        predecessors = {vertex: None for vertex in adjacency_matrix}
-
-        while priority_queue:
-            current_cost, current_vertex, path = heapq.heappop(priority_queue)
-
-            if current_vertex in visited:
-                continue
-
-            visited.add(current_vertex)
-            self.log_message(f"Visitando {current_vertex} com custo atual {current_cost}")
-
-            if current_vertex == goal:
-                return path, current_cost, predecessors
-
-            for neighbor, weight in adjacency_matrix[current_vertex].items():
-                if weight > 0 and neighbor not in visited:
-                    new_cost = current_cost + weight
-                    if new_cost < min_costs[neighbor]:
-                        min_costs[neighbor] = new_cost
-                        predecessors[neighbor] = current_vertex
-                        heapq.heappush(priority_queue, (new_cost, neighbor, path + [neighbor]))
-                        self.log_message(f"Atualizando custo de {neighbor} para {new_cost} (predecessor: {current_vertex})")
-
-        return None, float('inf'), {}
+        ui.show_result(find_lowest_cost_path(graph, start_vertex, end_vertex, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
@@ -1,28 +1,101 @@
-import tkinter as tk
-from tkinter import messagebox, simpledialog
 from collections import deque
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import apsp, cache, paths, store, ui
+
+def bfs_shortest_path(graph, start, goal, log):
+    start_id = graph.vertex_id(start)
+    goal_id = graph.vertex_id(goal)
+    queue = deque([start_id])
+    visited = set()
+    parents = [None] * graph.num_vertices()
+    predecessors = {}
+    levels = {start: 0}
+    level = 0
+
+    while queue:
+        level += 1
+        for _ in range(len(queue)):
+            vertex = queue.popleft()
+
+            if vertex == goal_id:
+                path = [vertex]
+                while path[-1] != start_id:
+                    path.append(parents[path[-1]])
+                return graph.names(path[::-1]), predecessors, levels
+
+            if vertex not in visited:
+                visited.add(vertex)
+                log(f"Visitando vértice: {graph.name_of(vertex)}")
+
+                for neighbor in graph.out_neighbors(vertex):
+                    if neighbor not in visited:
+                        queue.append(neighbor)
+                        if parents[neighbor] is None:
+                            parents[neighbor] = vertex
+                        predecessors[graph.name_of(neighbor)] = graph.name_of(vertex)
+                        levels[graph.name_of(neighbor)] = level
+                        log(f"Adicionando vizinho: {graph.name_of(neighbor)}, Antecessor: {graph.name_of(vertex)}, Nível: {level}")
+
+    return None, predecessors, levels
+
+def find_shortest_path(graph, start_vertex, end_vertex, log):
+    if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
+        return ("error", "Erro", "Um ou ambos os vértices não existem no grafo.")
+
+    matrix = apsp.load(graph, "hops")
+    if matrix:
+        log("Consultando a matriz de distâncias pré-calculada...")
+        path = matrix.path(graph.vertex_id(start_vertex), graph.vertex_id(end_vertex))
+        path = graph.names(path) if path else None
+    else:
+        path, predecessors, levels = bfs_shortest_path(graph, start_vertex, end_vertex, log)
+
+    if path:
+        log(f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
+        if not matrix:
+            log(f"Antecessores: {', '.join(f'{k}: {v}' for k, v in predecessors.items())}")
+            log(f"Níveis: {', '.join(f'{k}: {v}' for k, v in levels.items())}")
+        return ("info", "Caminho Mais Curto", f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
+    else:
+        log(f"Não existe caminho entre {start_vertex} e {end_vertex}.")
+        return ("error", "Sem Caminho", f"Não existe caminho entre {start_vertex} e {end_vertex}.")
+
+def find_shortest_path_bidirectional(graph, start_vertex, end_vertex, log):
+    if not graph.has_vertex(start_vertex) or not graph.has_vertex(end_vertex):
+        return ("error", "Erro", "Um ou ambos os vértices não existem no grafo.")
+
+    path, explored = paths.bidirectional_bfs(graph, graph.vertex_id(start_vertex), graph.vertex_id(end_vertex))
+    log(f"Busca bidirecional explorou {explored} de {graph.num_vertices()} vértices.")
+
+    if path:
+        path = graph.names(path)
+        log(f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
+        return ("info", "Caminho Mais Curto", f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
+    else:
+        log(f"Não existe caminho entre {start_vertex} e {end_vertex}.")
+        return ("error", "Sem Caminho", f"Não existe caminho entre {start_vertex} e {end_vertex}.")
 
 class VerificationApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Verificações de Grafos")
-        self.graph_data = {}
         self.graph_names = []
         self.load_graphs()
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        from tkinter import messagebox
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
+        import tkinter as tk
         tk.Label(self.root, text="Selecione um grafo para verificação:").pack()
         self.selected_graph = tk.StringVar(value="Escolha um grafo")
         self.graph_menu = tk.OptionMenu(self.root, self.selected_graph, *self.graph_names)
@@ -32,75 +105,45 @@ class VerificationApp:
         self.log_text.pack()
         
         tk.Button(self.root, text="Encontrar Caminho Mais Curto", command=self.find_shortest_path).pack(pady=20)
+        tk.Button(self.root, text="Encontrar Caminho Mais Curto (Busca Bidirecional)", command=self.find_shortest_path_bidirectional).pack()
 
     def log_message(self, message):
+        import tkinter as tk
         self.log_text.insert(tk.END, message + "\n")
         self.log_text.see(tk.END)
 
     def get_selected_graph(self):
+        from tkinter import messagebox
         graph_name = self.selected_graph.get()
-        if graph_name == "Escolha um grafo" or graph_name not in self.graph_data:
+        if graph_name == "Escolha um grafo" or graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um nome de grafo válido.")
             return None
-        return self.graph_data[graph_name]
+        return cache.load_graph(graph_name)
 
     def find_shortest_path(self):
-        graph_info = self.get_selected_graph()
-        if not graph_info:
+        from tkinter import simpledialog
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        adjacency_matrix = graph_info['adjacency_matrix']
-
         start_vertex = simpledialog.askstring("Entrada", "Digite o vértice de início:")
         end_vertex = simpledialog.askstring("Entrada", "Digite o vértice de término:")
 
-        if start_vertex not in adjacency_matrix or end_vertex not in adjacency_matrix:
-            messagebox.showerror("Erro", "Um ou ambos os vértices não existem no grafo.")
+        ui.show_result(find_shortest_path(graph, start_vertex, end_vertex, self.log_message))
+
+    def find_shortest_path_bidirectional(self):
+        from tkinter import simpledialog
+        graph = self.get_selected_graph()
+        if not graph:
             return
 
-        path, predecessors, levels = self.bfs_shortest_path(adjacency_matrix, start_vertex, end_vertex)
-
-        if path:
-            self.log_message(f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
-            self.log_message(f"Antecessores: {', '.join(f'{k}: {v}' for k, v in predecessors.items())}")
-            self.log_message(f"Níveis: {', '.join(f'{k}: {v}' for k, v in levels.items())}")
-            messagebox.showinfo("Caminho Mais Curto", f"Caminho mais curto de {start_vertex} para {end_vertex}: " + " -> ".join(path))
-        else:
-            self.log_message(f"Não existe caminho entre {start_vertex} e {end_vertex}.")
-            messagebox.showerror("Sem Caminho", f"Não existe caminho entre {start_vertex} e {end_vertex}.")
-
-    def bfs_shortest_path(self, adjacency_matrix, start, goal):
-        queue = deque([[start]])
-        visited = set()
-        predecessors = {}
-        levels = {start: 0}
-        level = 0
-
-        while queue:
-            level += 1
-            for _ in range(len(queue)):
-                path = queue.popleft()
-                vertex = path[-1]
-
-                if vertex == goal:
-                    return path, predecessors, levels
-
-                if vertex not in visited:
-                    visited.add(vertex)
-                    self.log_message(f"Visitando vértice: {vertex}")
-
-                    for neighbor in adjacency_matrix[vertex]:
-                        if adjacency_matrix[vertex][neighbor] != 0 and neighbor not in visited:
-                            new_path = list(path)
-                            new_path.append(neighbor)
-                            queue.append(new_path)
-                            predecessors[neighbor] = vertex
-                            levels[neighbor] = level
-                            self.log_message(f"Adicionando vizinho: {neighbor}, Antecessor: {vertex}, Nível: {level}")
-
-        return None, predecessors, levels
+        start_vertex = simpledialog.askstring("Entrada", "Digite o vértice de início:")
+        end_vertex = simpledialog.askstring("Entrada", "Digite o vértice de término:")
+
+        ui.show_result(find_shortest_path_bidirectional(graph, start_vertex, end_vertex, self.log_message))
 
 if __name__ == "__main__":
+    import tkinter as tk
     root = tk.Tk()
     root.geometry("640x480")
     app = VerificationApp(root)
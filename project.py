@@ -1,6 +1,6 @@
 import tkinter as tk
-import subprocess
 from tkinter import ttk
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -51,84 +51,52 @@ class MainApp:
             button.pack(pady=5, fill='x')
 
     def check_if_cyclic(self):
-        result = subprocess.run(["python", "cyclic.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/cyclic.py")
     
     def check_dag_and_topological_sort(self):
-        result = subprocess.run(["python", "dag_top_gen.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/dag_top_gen.py")
 
     def check_eulerian(self):
-        result = subprocess.run(["python", "eulerian.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/eulerian.py")
 
     def find_minimum_allocation(self):
-        result = subprocess.run(["python", "min_alloc.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/min_alloc.py")
 
     def check_planarity(self):
-        result = subprocess.run(["python", "planarity.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/planarity.py")
 
     def check_strongly_connected_components(self):
-        result = subprocess.run(["python", "str_con_comp.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/str_con_comp.py")
 
     def check_if_undirected_and_connected(self):
-        result = subprocess.run(["python", "und_con.py"], capture_output=True, text=True, cwd="./check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/und_con.py")
 
     def check_click(self):
-        result = subprocess.run(["python", "click.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/click.py")
 
     def check_dominating_set(self):
-        result = subprocess.run(["python", "domain_set.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/domain_set.py")
 
     def check_edge(self):
-        result = subprocess.run(["python", "edge_exist.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/edge_exist.py")
 
     def check_independent_set(self):
-        result = subprocess.run(["python", "indie_vert_set.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/indie_vert_set.py")
 
     def check_vertex_adjacency(self):
-        result = subprocess.run(["python", "vert_adj.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/vert_adj.py")
 
     def check_vertex_degree(self):
-        result = subprocess.run(["python", "vert_deg.py"], capture_output=True, text=True, cwd="./gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/vert_deg.py")
 
     def find_mst(self):
-        result = subprocess.run(["python", "agm.py"], capture_output=True, text=True, cwd="./pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/agm.py")
 
     def find_lowest_cost_path(self):
-        result = subprocess.run(["python", "least_cost.py"], capture_output=True, text=True, cwd="./pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/least_cost.py")
 
     def find_shortest_path(self):
-        result = subprocess.run(["python", "least_path.py"], capture_output=True, text=True, cwd="./pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/least_path.py")
 
 if __name__ == "__main__":
     root = tk.Tk()
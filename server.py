@@ -0,0 +1,156 @@
+import argparse
+import json
+import os
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from urllib.parse import parse_qsl, urlsplit
+
+from batch import answer
+from core import cache, registry, store
+
+class Stats:
+    def __init__(self, window=10000):
+        self.lock = threading.Lock()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.errors = 0
+        self.queries = Counter()
+        self.latencies = deque(maxlen=window)
+
+    def record(self, seconds, ok, query=None):
+        with self.lock:
+            self.requests += 1
+            if not ok:
+                self.errors += 1
+            if query:
+                self.queries[query] += 1
+            self.latencies.append(seconds)
+
+    def snapshot(self):
+        with self.lock:
+            latencies = sorted(self.latencies)
+            uptime = time.monotonic() - self.started
+            requests, errors, queries = self.requests, self.errors, dict(self.queries)
+
+        def percentile(p):
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(p / 100 * len(latencies)))] * 1000
+
+        return {
+            "uptime_s": round(uptime, 3),
+            "requests": requests,
+            "errors": errors,
+            "throughput_rps": round(requests / uptime, 3) if uptime else 0.0,
+            "latency_ms": {
+                "samples": len(latencies),
+                "p50": round(percentile(50), 3),
+                "p90": round(percentile(90), 3),
+                "p99": round(percentile(99), 3),
+                "max": round(latencies[-1] * 1000, 3) if latencies else 0.0,
+            },
+            "queries": queries,
+        }
+
+class PooledHTTPServer(HTTPServer):
+    def __init__(self, address, handler, workers):
+        super().__init__(address, handler)
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.stats = Stats()
+
+    def process_request(self, request, client_address):
+        self.pool.submit(self.process_request_thread, request, client_address)
+
+    def process_request_thread(self, request, client_address):
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+class QueryHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_query(self, query):
+        name = query.get("graph")
+        if not name:
+            return 400, {"error": "Informe o campo 'graph'."}
+        try:
+            graph = cache.load_graph(name)
+        except KeyError:
+            return 404, {"error": f"Grafo não encontrado: {name}"}
+        try:
+            return 200, answer(graph, query, query.get("log") in (True, 1, "1", "true"))
+        except (TypeError, ValueError) as e:
+            return 400, {"error": str(e)}
+
+    def dispatch(self, path, query):
+        if path == "/query":
+            return self.handle_query(query)
+        if path == "/graphs":
+            return 200, {"graphs": store.list_graphs()}
+        if path == "/queries":
+            return 200, {key: list(entry[2]) for key, entry in registry.ALGORITHMS.items()}
+        if path == "/stats":
+            return 200, self.server.stats.snapshot()
+        return 404, {"error": f"Caminho desconhecido: {path}"}
+
+    def respond(self, path, query):
+        started = time.perf_counter()
+        try:
+            status, data = self.dispatch(path, query)
+        except Exception as e:
+            status, data = 500, {"error": f"Erro interno: {type(e).__name__}: {e}"}
+        self.send_json(status, data)
+        if path != "/stats":
+            self.server.stats.record(time.perf_counter() - started, status == 200, query.get("query"))
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        self.respond(url.path, dict(parse_qsl(url.query)))
+
+    def do_POST(self):
+        url = urlsplit(self.path)
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            query = json.loads(self.rfile.read(length) or b"{}")
+            if not isinstance(query, dict):
+                raise ValueError("O corpo deve ser um objeto JSON.")
+        except ValueError as e:
+            self.send_json(400, {"error": str(e)})
+            self.server.stats.record(0.0, False)
+            return
+        self.respond(url.path, query)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Servidor local de consultas sobre a biblioteca de grafos.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--workers", type=int, default=min(32, (os.cpu_count() or 1) + 4))
+    args = parser.parse_args()
+
+    server = PooledHTTPServer((args.host, args.port), QueryHandler, args.workers)
+    print(f"Servindo em http://{args.host}:{args.port} com {args.workers} workers.")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
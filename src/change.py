@@ -1,7 +1,10 @@
 import tkinter as tk
 from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import ch, journal, store, topo
 
 class ChangeGraphApp:
     def __init__(self, root):
@@ -14,15 +17,12 @@ class ChangeGraphApp:
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
+        if not store.library_exists():
             messagebox.showerror("Erro", "Arquivo não encontrado.")
             self.root.destroy()
             return
 
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
         tk.Label(self.root, text="Selecione um grafo para editar:").pack(pady=10)
@@ -40,57 +40,68 @@ class ChangeGraphApp:
 
     def get_graph_info(self):
         self.graph_name = self.selected_graph.get()
-        if self.graph_name == "Escolha um grafo" or self.graph_name not in self.graph_data:
+        if self.graph_name == "Escolha um grafo" or self.graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um grafo válido.")
             return None
+        if self.graph_name not in self.graph_data:
+            self.graph_data[self.graph_name] = store.adjacency_from_record(store.read_record(self.graph_name))
         return self.graph_data[self.graph_name]
 
-    def save_changes(self):
-        with open("../lib/adjacency_matrix.json", "w") as f:
-            json.dump(self.graph_data, f, indent=4)
-        messagebox.showinfo("Salvo", "Alterações salvas em adjacency_matrix.json")
+    def save_changes(self, *ops):
+        graph_info = self.graph_data[self.graph_name]
+        saved = "Alterações salvas na biblioteca de grafos"
+        if ops:
+            location = store.locate(self.graph_name)
+            order = topo.open_order(self.graph_name, location)
+            for op in ops:
+                journal.apply_op(graph_info, op)
+            store.apply_edits(location, ops)
+            if ch.schedule_rebuild(self.graph_name, location["directory"]):
+                saved += ".\nA hierarquia de contração está sendo reconstruída em segundo plano; até terminar, least_cost usa ALT ou Dijkstra."
+            cycle = topo.apply_edits(self.graph_name, order, ops, location)
+            if cycle:
+                messagebox.showwarning("Ciclo", topo.cycle_warning(cycle))
+        messagebox.showinfo("Salvo", saved)
 
     def rename_graph(self):
         self.graph_name = self.selected_graph.get()
-        if self.graph_name == "Escolha um grafo" or self.graph_name not in self.graph_data:
+        if self.graph_name == "Escolha um grafo" or self.graph_name not in self.graph_names:
             messagebox.showerror("Erro", "Por favor, selecione um grafo válido para renomear.")
             return
 
         new_name = simpledialog.askstring("Renomear Grafo", "Digite um novo nome para o grafo:")
         if new_name:
-            if new_name in self.graph_data:
+            if new_name in self.graph_names:
                 messagebox.showerror("Erro", "Já existe um grafo com esse nome.")
                 return
-            self.graph_data[new_name] = self.graph_data.pop(self.graph_name)
+            store.rename_graph(self.graph_name, new_name)
+            self.graph_names[self.graph_names.index(self.graph_name)] = new_name
+            if self.graph_name in self.graph_data:
+                self.graph_data[new_name] = self.graph_data.pop(self.graph_name)
             self.graph_name = new_name
             self.selected_graph.set(new_name)
-            self.save_changes()
+            messagebox.showinfo("Salvo", "Alterações salvas na biblioteca de grafos")
 
     def change_graph_type(self):
         graph_info = self.get_graph_info()
         if graph_info:
             new_type = "undirected" if graph_info["type"] == "directed" else "directed"
-            graph_info["type"] = new_type
-            self.save_changes()
+            self.save_changes({"op": "set_type", "type": new_type})
 
     def modify_vertices(self):
         graph_info = self.get_graph_info()
         if graph_info:
+            ops = []
             choice = messagebox.askyesno("Modificar Vértices", "O que você gostaria de modificar? (Sim para adicionar / Não para remover)")
             if choice:
                 new_vertex = simpledialog.askstring("Adicionar Vértice", "Digite o nome do novo vértice:")
                 if new_vertex and new_vertex not in graph_info["adjacency_matrix"]:
-                    graph_info["adjacency_matrix"][new_vertex] = {v: 0 for v in graph_info["adjacency_matrix"]}
-                    for v in graph_info["adjacency_matrix"]:
-                        graph_info["adjacency_matrix"][v][new_vertex] = 0
+                    ops.append({"op": "add_vertex", "vertex": new_vertex})
             else:
                 remove_vertex = simpledialog.askstring("Remover Vértice", "Digite o nome do vértice a ser removido:")
                 if remove_vertex and remove_vertex in graph_info["adjacency_matrix"]:
-                    del graph_info["adjacency_matrix"][remove_vertex]
-                    for v in graph_info["adjacency_matrix"]:
-                        if remove_vertex in graph_info["adjacency_matrix"][v]:
-                            del graph_info["adjacency_matrix"][v][remove_vertex]
-            self.save_changes()
+                    ops.append({"op": "remove_vertex", "vertex": remove_vertex})
+            self.save_changes(*ops)
 
     def rename_vertex(self):
         graph_info = self.get_graph_info()
@@ -99,11 +110,7 @@ class ChangeGraphApp:
             if old_vertex and old_vertex in graph_info["adjacency_matrix"]:
                 new_vertex = simpledialog.askstring("Novo Nome do Vértice", "Digite o novo nome para o vértice:")
                 if new_vertex and new_vertex not in graph_info["adjacency_matrix"]:
-                    graph_info["adjacency_matrix"][new_vertex] = graph_info["adjacency_matrix"].pop(old_vertex)
-                    for v in graph_info["adjacency_matrix"]:
-                        if old_vertex in graph_info["adjacency_matrix"][v]:
-                            graph_info["adjacency_matrix"][v][new_vertex] = graph_info["adjacency_matrix"][v].pop(old_vertex)
-                    self.save_changes()
+                    self.save_changes({"op": "rename_vertex", "old": old_vertex, "new": new_vertex})
                 else:
                     messagebox.showerror("Erro", "O novo nome do vértice já existe ou é inválido.")
             else:
@@ -112,6 +119,7 @@ class ChangeGraphApp:
     def change_edge_vertices(self):
         graph_info = self.get_graph_info()
         if graph_info:
+            ops = []
             old_edge = simpledialog.askstring("Mudar Aresta", "Digite a aresta (ex: A-B):")
             if old_edge:
                 v1, v2 = old_edge.split("-")
@@ -119,24 +127,30 @@ class ChangeGraphApp:
                     new_v1 = simpledialog.askstring("Novo Origem", "Digite o novo vértice de origem:")
                     new_v2 = simpledialog.askstring("Nova Destino", "Digite o novo vértice de destino:")
                     if new_v1 and new_v2:
-                        weight = graph_info["adjacency_matrix"][v1].pop(v2)
-                        if v1 in graph_info["adjacency_matrix"] and new_v1 in graph_info["adjacency_matrix"]:
-                            graph_info["adjacency_matrix"][new_v1][new_v2] = weight
-            self.save_changes()
+                        weight = graph_info["adjacency_matrix"][v1][v2]
+                        ops.append({"op": "set_edge", "source": v1, "target": v2, "weight": 0})
+                        if graph_info["type"] == "undirected":
+                            ops.append({"op": "set_edge", "source": v2, "target": v1, "weight": 0})
+                        if new_v1 in graph_info["adjacency_matrix"]:
+                            ops.append({"op": "set_edge", "source": new_v1, "target": new_v2, "weight": weight})
+                            if graph_info["type"] == "undirected" and new_v2 in graph_info["adjacency_matrix"]:
+                                ops.append({"op": "set_edge", "source": new_v2, "target": new_v1, "weight": weight})
+            self.save_changes(*ops)
 
     def change_edge_weight(self):
         graph_info = self.get_graph_info()
         if graph_info:
+            ops = []
             edge = simpledialog.askstring("Mudar Peso da Aresta", "Digite a aresta (ex: A-B):")
             if edge:
                 v1, v2 = edge.split("-")
                 if v1 in graph_info["adjacency_matrix"] and v2 in graph_info["adjacency_matrix"][v1]:
                     new_weight = simpledialog.askinteger("Novo Peso", f"Digite o novo peso para a aresta {v1}-{v2}:")
                     if new_weight is not None:
-                        graph_info["adjacency_matrix"][v1][v2] = new_weight
-                        if graph_info["type"] == "não direcionado":
-                            graph_info["adjacency_matrix"][v2][v1] = new_weight
-            self.save_changes()
+                        ops.append({"op": "set_edge", "source": v1, "target": v2, "weight": new_weight})
+                        if graph_info["type"] == "undirected":
+                            ops.append({"op": "set_edge", "source": v2, "target": v1, "weight": new_weight})
+            self.save_changes(*ops)
 
 if __name__ == "__main__":
     root = tk.Tk()
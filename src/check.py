@@ -1,5 +1,9 @@
 import tkinter as tk
-import subprocess
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -17,39 +21,25 @@ class MainApp:
         tk.Button(self.root, text="Verificar se o Grafo é Não Direcionado e Conectado", command=self.check_if_undirected_and_connected).pack(pady=10)
 
     def check_if_cyclic(self):
-        result = subprocess.run(["python", "cyclic.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/cyclic.py")
     
     def check_dag_and_topological_sort(self):
-        result = subprocess.run(["python", "dag_top_gen.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/dag_top_gen.py")
     
     def check_eulerian(self):
-        result = subprocess.run(["python", "eulerian.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/eulerian.py")
     
     def find_minimum_allocation(self):
-        result = subprocess.run(["python", "min_alloc.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/min_alloc.py")
     
     def check_planarity(self):
-        result = subprocess.run(["python", "planarity.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/planarity.py")
     
     def check_strongly_connected_components(self):
-        result = subprocess.run(["python", "str_con_comp.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/str_con_comp.py")
     
     def check_if_undirected_and_connected(self):
-        result = subprocess.run(["python", "und_con.py"], capture_output=True, text=True, cwd="../check")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "check/und_con.py")
         
 if __name__ == "__main__":
     root = tk.Tk()
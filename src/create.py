@@ -1,7 +1,10 @@
 import tkinter as tk 
 from tkinter import messagebox, simpledialog
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import store
 
 class GraphApp:
     def __init__(self, root):
@@ -35,7 +38,7 @@ class GraphApp:
         vertices_input = simpledialog.askstring("Vértices", "Digite os vértices separados por vírgulas (ex.: A,B,C):")
         if vertices_input:
             self.vertices = [v.strip().upper() for v in vertices_input.split(",")]
-            self.adjacency_matrix = {v: {u: 0 for u in self.vertices} for v in self.vertices}
+            self.adjacency_matrix = {v: {} for v in self.vertices}
             print("Vértices:", self.vertices)
             print("Matriz de Adjacência inicial:", self.adjacency_matrix)
             self.get_edges()
@@ -73,34 +76,24 @@ class GraphApp:
         self.save_to_json()
 
     def save_to_json(self):
-        file_path = "../lib/adjacency_matrix.json"
-
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-
-        graphs = {}
-        if os.path.exists(file_path):
-            with open(file_path, "r") as f:
-                graphs = json.load(f)
-
-        if self.graph_name in graphs:
+        if store.graph_exists(self.graph_name):
             if messagebox.askyesno("Nome Duplicado", f"O grafo '{self.graph_name}' já existe. Deseja substituir?"):
-                del graphs[self.graph_name]
+                store.delete_graph(self.graph_name)
             else:
                 messagebox.showinfo("Cancelado", "A criação do grafo foi cancelada.")
-                self.root.quit()
+                self.root.destroy()
                 return
 
-        graphs[self.graph_name] = {
+        record = store.record_from_adjacency({
             "type": self.graph_type,
             "has_weights": self.has_weights,
             "adjacency_matrix": self.adjacency_matrix
-        }
+        })
 
         try:
-            with open(file_path, "w") as f:
-                json.dump(graphs, f, indent=4)
-            messagebox.showinfo("Salvo", f"Grafo '{self.graph_name}' salvo em adjacency_matrix.json")
-            self.root.quit()
+            store.create_graph(self.graph_name, record)
+            messagebox.showinfo("Salvo", f"Grafo '{self.graph_name}' salvo na biblioteca de grafos")
+            self.root.destroy()
         except Exception as e:
             messagebox.showerror("Erro", f"Falha ao salvar o grafo: {e}")
 
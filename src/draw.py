@@ -1,25 +1,26 @@
-import json
-import networkx as nx
-import matplotlib.pyplot as plt
+import os
+import sys
 import tkinter as tk
 from tkinter import ttk
 
-def draw_graph_from_json(file_path, graph_name):
-    with open(file_path, 'r') as file:
-        data = json.load(file)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import cache, store
 
-    if graph_name not in data:
+def draw_graph_from_store(graph_name):
+    import matplotlib.pyplot as plt
+    import networkx as nx
+
+    if not store.graph_exists(graph_name):
         print(f"Grafo '{graph_name}' não encontrado.")
         return
 
-    graph_data = data[graph_name]
+    graph = cache.load_graph(graph_name)
 
-    G = nx.DiGraph() if graph_data["type"] == "directed" else nx.Graph()
+    G = nx.DiGraph() if graph.is_directed else nx.Graph()
 
-    for node, edges in graph_data["adjacency_matrix"].items():
-        for target, weight in edges.items():
-            if weight > 0:
-                G.add_edge(node, target, weight=weight)
+    for u, v, weight in graph.arcs():
+        if weight > 0:
+            G.add_edge(graph.name_of(u), graph.name_of(v), weight=weight)
 
     pos = nx.spring_layout(G)
     nx.draw(G, pos, with_labels=True, node_color='lightblue', node_size=2000, font_size=16, font_weight='bold')
@@ -30,36 +31,37 @@ def draw_graph_from_json(file_path, graph_name):
     plt.title(graph_name)
     plt.show()
 
-def create_graph_buttons(frame, graph_names):
-    for graph_name in graph_names:
-        button = tk.Button(frame, text=graph_name, command=lambda name=graph_name: draw_graph_from_json('../lib/adjacency_matrix.json', name))
-        button.pack(pady=10, fill='x')
-
-root = tk.Tk()
-root.title("Seleção de Grafo")
-root.geometry("640x480") 
-
-canvas = tk.Canvas(root)
-scrollbar = ttk.Scrollbar(root, orient="vertical", command=canvas.yview)
-scrollable_frame = tk.Frame(canvas)
+class DrawGraphApp:
+    def __init__(self, root):
+        self.root = root
+        self.root.title("Seleção de Grafo")
 
-scrollable_frame.bind(
-    "<Configure>",
-    lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
-)
+        self.canvas = tk.Canvas(self.root)
+        self.scrollbar = ttk.Scrollbar(self.root, orient="vertical", command=self.canvas.yview)
+        self.scrollable_frame = tk.Frame(self.canvas)
 
-canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
+        self.scrollable_frame.bind(
+            "<Configure>",
+            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        )
 
-canvas.configure(yscrollcommand=scrollbar.set)
+        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
 
-canvas.pack(side="left", fill="both", expand=True)
-scrollbar.pack(side="right", fill="y")
+        self.canvas.configure(yscrollcommand=self.scrollbar.set)
 
-with open('../lib/adjacency_matrix.json', 'r') as file:
-    data = json.load(file)
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.scrollbar.pack(side="right", fill="y")
 
-graph_names = list(data.keys())
+        self.graph_names = store.list_graphs()
+        self.create_graph_buttons()
 
-create_graph_buttons(scrollable_frame, graph_names)
+    def create_graph_buttons(self):
+        for graph_name in self.graph_names:
+            button = tk.Button(self.scrollable_frame, text=graph_name, command=lambda name=graph_name: draw_graph_from_store(name))
+            button.pack(pady=10, fill='x')
 
-root.mainloop()
\ No newline at end of file
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.geometry("640x480")
+    app = DrawGraphApp(root)
+    root.mainloop()
\ No newline at end of file
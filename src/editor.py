@@ -1,5 +1,9 @@
 import tkinter as tk
-import subprocess
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -14,24 +18,16 @@ class MainApp:
         tk.Button(self.root, text="Deletar Grafo", command=self.delete_graph).pack(pady=10)
 
     def create_graph(self):
-        result = subprocess.run(["python", "create.py"], capture_output=True, text=True, cwd="./")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/create.py")
 
     def edit_graph(self):
-        result = subprocess.run(["python", "change.py"], capture_output=True, text=True, cwd="./")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/change.py")
     
     def visualize_graph(self):
-        result = subprocess.run(["python", "draw.py"], capture_output=True, text=True, cwd="./")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/draw.py")
 
     def delete_graph(self):
-        result = subprocess.run(["python", "erase.py"], capture_output=True, text=True, cwd="./")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "src/erase.py")
        
 if __name__ == "__main__":
     root = tk.Tk()
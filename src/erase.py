@@ -1,14 +1,17 @@
 import tkinter as tk
 from tkinter import messagebox, ttk
-import json
 import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import store
 
 class EraseGraphApp:
     def __init__(self, root):
         self.root = root
         self.root.title("Apagar Grafo")
 
-        self.graph_data = {}
+        self.graph_names = []
         self.load_graphs()
 
         self.canvas = tk.Canvas(self.root)
@@ -30,15 +33,12 @@ class EraseGraphApp:
         self.create_widgets()
 
     def load_graphs(self):
-        if not os.path.exists("../lib/adjacency_matrix.json"):
-            messagebox.showerror("Erro", "Arquivo adjacency_matrix.json não encontrado.")
+        if not store.library_exists():
+            messagebox.showerror("Erro", "Biblioteca de grafos não encontrada.")
             self.root.destroy()
             return
 
-        with open("../lib/adjacency_matrix.json", "r") as f:
-            self.graph_data = json.load(f)
-        
-        self.graph_names = list(self.graph_data.keys())
+        self.graph_names = store.list_graphs()
 
     def create_widgets(self):
         tk.Label(self.scrollable_frame, text="Selecione um grafo para apagar:").pack(pady=10)
@@ -50,15 +50,11 @@ class EraseGraphApp:
     def confirm_delete(self, graph_name):
         confirm = messagebox.askyesno("Confirmar Exclusão", f"Você tem certeza que deseja apagar o grafo '{graph_name}'?")
         if confirm:
-            del self.graph_data[graph_name]
-            self.save_changes()
+            store.delete_graph(graph_name)
+            self.graph_names.remove(graph_name)
             messagebox.showinfo("Apagado", f"Grafo '{graph_name}' foi apagado.")
             self.refresh_buttons()
 
-    def save_changes(self):
-        with open("../lib/adjacency_matrix.json", "w") as f:
-            json.dump(self.graph_data, f, indent=4)
-
     def refresh_buttons(self):
         for widget in self.scrollable_frame.winfo_children():
             widget.destroy()
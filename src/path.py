@@ -1,5 +1,9 @@
 import tkinter as tk
-import subprocess
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -13,19 +17,13 @@ class MainApp:
         tk.Button(self.root, text="Encontrar Caminho Mais Curto", command=self.find_shortest_path).pack(pady=10)
 
     def find_mst(self):
-        result = subprocess.run(["python", "agm.py"], capture_output=True, text=True, cwd="../pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/agm.py")
     
     def find_lowest_cost_path(self):
-        result = subprocess.run(["python", "least_cost.py"], capture_output=True, text=True, cwd="../pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/least_cost.py")
     
     def find_shortest_path(self):
-        result = subprocess.run(["python", "least_path.py"], capture_output=True, text=True, cwd="../pathmaker")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "pathmaker/least_path.py")
     
 if __name__ == "__main__":
     root = tk.Tk()
@@ -1,5 +1,9 @@
 import tkinter as tk
-import subprocess
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from core import registry
 
 class MainApp:
     def __init__(self, root):
@@ -16,34 +20,22 @@ class MainApp:
         tk.Button(self.root, text="Verificar Grau do Vértice", command=self.check_vertex_degree).pack(pady=10)
         
     def check_click(self):
-        result = subprocess.run(["python", "click.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/click.py")
     
     def check_dominating_set(self):
-        result = subprocess.run(["python", "domain_set.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/domain_set.py")
     
     def check_edge(self):
-        result = subprocess.run(["python", "edge_exist.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/edge_exist.py")
     
     def check_independent_set(self):
-        result = subprocess.run(["python", "indie_vert_set.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/indie_vert_set.py")
     
     def check_vertex_adjacency(self):
-        result = subprocess.run(["python", "vert_adj.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/vert_adj.py")
     
     def check_vertex_degree(self):
-        result = subprocess.run(["python", "vert_deg.py"], capture_output=True, text=True, cwd="../gen")
-        print(result.stdout)
-        print(result.stderr)
+        registry.open_app(self.root, "gen/vert_deg.py")
     
 if __name__ == "__main__":
     root = tk.Tk()
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from core import cache, store
+
+@pytest.fixture
+def library(tmp_path, monkeypatch):
+    graphs_dir = str(tmp_path / "graphs")
+    monkeypatch.setattr(store, "GRAPHS_DIR", graphs_dir)
+    monkeypatch.setattr(store, "CATALOG_PATH", os.path.join(graphs_dir, "catalog.json"))
+    monkeypatch.setattr(store, "JOURNAL_PATH", os.path.join(graphs_dir, "journal.log"))
+    monkeypatch.setattr(store, "SINGLE_FILE_PATH", str(tmp_path / "graphs.json"))
+    monkeypatch.setattr(store, "LEGACY_PATH", str(tmp_path / "adjacency_matrix.json"))
+    cache.clear()
+
+    def create(name, vertices, edges, graph_type="directed", has_weights=True):
+        store.create_graph(name, {
+            "type": graph_type,
+            "has_weights": has_weights,
+            "is_bipartite": False,
+            "is_complete": False,
+            "vertices": list(vertices),
+            "edges": [list(edge) for edge in edges],
+        })
+        return store.load_graph(name)
+
+    yield create
+    cache.clear()
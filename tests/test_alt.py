@@ -0,0 +1,37 @@
+import pytest
+
+from core import alt, paths, store
+
+pytest.importorskip("numpy")
+
+def ring(n):
+    vertices = [str(v) for v in range(n)]
+    arcs = [(v, (v + 1) % n, 1 + v % 4) for v in range(n)] + [(v, (v + 7) % n, 5 + v % 3) for v in range(0, n, 2)]
+    return vertices, arcs
+
+def test_astar_matches_dijkstra(library):
+    graph = library("anel", *ring(30))
+    index = alt.select_landmarks(graph, 4)
+    assert len(set(index.landmarks)) == 4
+    for source in range(0, 30, 3):
+        tree = paths.dijkstra(graph, source)
+        for target in range(30):
+            found = alt.astar(graph, source, target, index)
+            assert found.cost(target) == tree.cost(target)
+            path = found.path(target)
+            assert sum(graph.weight(a, b) for a, b in zip(path, path[1:])) == tree.cost(target)
+
+def test_lower_bounds_never_overestimate(library):
+    graph = library("anel", *ring(30))
+    index = alt.select_landmarks(graph, 3)
+    for target in (0, 11, 29):
+        bounds = index.lower_bounds(target)
+        backward = paths.dijkstra(graph, target, reverse=True)
+        assert all(bounds[v] <= backward.cost(v) for v in range(30))
+
+def test_landmarks_are_dropped_after_an_edit(library):
+    library("anel", *ring(12))
+    alt.build("anel", 2)
+    assert alt.load(store.load_graph("anel")) is not None
+    store.apply_edit("anel", {"op": "set_edge", "source": "0", "target": "6", "weight": 1})
+    assert alt.load(store.load_graph("anel")) is None
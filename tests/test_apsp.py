@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from core import apsp, paths, store
+from core.graph import Graph
+
+pytest.importorskip("numpy")
+
+def random_edges(seed, n, m):
+    rng = random.Random(seed)
+    arcs = {}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            arcs[(u, v)] = rng.randint(1, 9)
+    return [str(v) for v in range(n)], [(u, v, w) for (u, v), w in sorted(arcs.items())]
+
+def assert_matches_searches(graph, metric, matrix):
+    for source in range(graph.num_vertices()):
+        tree = paths.bfs_tree(graph, source) if metric == "hops" else paths.dijkstra(graph, source)
+        for target in range(graph.num_vertices()):
+            assert matrix.distance(source, target) == tree.cost(target)
+            path = matrix.path(source, target)
+            if not tree.reached(target):
+                assert path is None
+                continue
+            assert path[0] == source and path[-1] == target
+            length = len(path) - 1 if metric == "hops" else sum(graph.weight(a, b) for a, b in zip(path, path[1:]))
+            assert length == tree.cost(target)
+
+@pytest.mark.parametrize("metric", apsp.METRICS)
+def test_both_methods_match_single_source_searches(library, metric):
+    for seed in range(6):
+        graph = library(f"g{seed}", *random_edges(seed, 14, 30))
+        for method in (apsp.floyd_warshall, apsp.repeated_search):
+            distances, next_hops = method(graph, metric)
+            assert_matches_searches(graph, metric, apsp.DistanceMatrix(graph, metric, distances, next_hops, True))
+
+def test_saved_matrix_is_dropped_after_an_edit(library):
+    library("g", *random_edges(1, 10, 20))
+    apsp.build("g", "cost")
+    graph = store.load_graph("g")
+    assert_matches_searches(graph, "cost", apsp.load(graph, "cost"))
+
+    store.apply_edit("g", {"op": "set_edge", "source": "0", "target": "9", "weight": 1})
+    assert apsp.load(store.load_graph("g"), "cost") is None
+
+def test_negative_cycle_is_rejected():
+    graph = Graph("negativo", "abc", [(0, 1, 1), (1, 2, -3), (2, 0, 1)], has_weights=True)
+    with pytest.raises(ValueError):
+        apsp.floyd_warshall(graph, "cost")
@@ -0,0 +1,37 @@
+from core import assignment, registry, store
+
+def test_hall_violation_reports_blocked_rows():
+    costs = [[(0, 2), (1, 1)], [(0, 2), (1, 2)], [(0, 1), (1, 2)]]
+    problem = assignment.AssignmentProblem(None, [0, 1, 2], [0, 1, 2], costs, True)
+    result, blocked = assignment.solve(problem)
+    assert result is None
+    rows, columns = blocked
+    assert sorted(rows) == [0, 1, 2]
+    assert sorted(columns) == [0, 1]
+
+def test_min_alloc_reports_infeasible_graph():
+    vertices = ["a0", "a1", "a2", "b0", "b1", "b2", "z"]
+    edges = [[0, 3, 2], [1, 3, 1], [2, 3, 2], [2, 4, 2], [2, 5, 1]]
+    record = {"type": "undirected", "has_weights": True, "is_bipartite": False, "is_complete": False, "vertices": vertices, "edges": edges}
+    kind, title, message = registry.run("min_alloc", store.graph_from_record("alocacao", record), {}, None)
+    assert kind == "error"
+    assert title == "Alocação Impossível"
+
+def test_min_alloc_matches_brute_force():
+    costs = [[(0, 4), (1, 1), (2, 3)], [(0, 2), (1, 0), (2, 5)], [(0, 3), (1, 2), (2, 2)]]
+    problem = assignment.AssignmentProblem(None, [0, 1, 2], [0, 1, 2], costs, True)
+    result, blocked = assignment.solve(problem)
+    assert blocked is None
+    assert result.cost == 5
+
+def test_each_component_puts_its_smaller_side_in_rows():
+    vertices = ["a", "x1", "x2", "y1", "y2", "b", "z"]
+    edges = [[0, 1, 3], [0, 2, 1], [3, 5, 2], [4, 5, 4]]
+    record = {"type": "undirected", "has_weights": True, "is_bipartite": False, "is_complete": False, "vertices": vertices, "edges": edges}
+    graph = store.graph_from_record("componentes", record)
+    problem = assignment.from_graph(graph)
+    assert graph.names(problem.rows) == ["a", "b"]
+
+    kind, title, message = registry.run("min_alloc", graph, {}, None)
+    assert kind == "info"
+    assert message == "Alocação mínima com custo 3:\na -> x2\nb -> y1"
@@ -0,0 +1,57 @@
+import json
+
+from batch import run_batch
+from core import registry
+
+def lines(*queries):
+    return [json.dumps(query) if isinstance(query, dict) else query for query in queries]
+
+def test_answers_in_order_with_ids(library):
+    library("g", "abc", [(0, 1, 2), (1, 2, 3)])
+    library("h", "xy", [(0, 1, 1), (1, 0, 1)])
+    results = list(run_batch("g", lines(
+        {"id": 1, "query": "least_cost", "start_vertex": "a", "end_vertex": "c"},
+        "",
+        {"id": 2, "query": "dag_top_gen", "graph": "h"},
+        {"id": 3, "query": "nada"},
+        {"id": 4, "graph": "z", "query": "dag_top_gen"},
+        "[1, 2]",
+        "{quebrado",
+    )))
+
+    assert [result.get("id") for result in results] == [1, 2, 3, 4, None, None]
+    assert results[0]["message"].endswith("a -> b -> c com custo 5")
+    assert results[1]["query"] == "dag_top_gen" and "error" not in results[1]
+    assert all("error" in result for result in results[2:])
+
+def test_parameterless_queries_run_once_per_graph(library, monkeypatch):
+    library("g", "ab", [(0, 1, 1)])
+    calls = []
+    run = registry.run
+
+    def counting(key, graph, params=None, log=None):
+        calls.append((key, graph.name))
+        return run(key, graph, params, log)
+
+    monkeypatch.setattr(registry, "run", counting)
+    results = list(run_batch("g", lines(*[{"id": i, "query": "dag_top_gen"} for i in range(3)])))
+    assert calls == [("dag_top_gen", "g")]
+    assert [result["id"] for result in results] == [0, 1, 2]
+    assert len({result["message"] for result in results}) == 1
+
+    list(run_batch("g", lines({"query": "dag_top_gen"}), with_log=True))
+    assert len(calls) == 2
+
+def test_unexpected_errors_do_not_stop_the_run(library, monkeypatch):
+    library("g", "ab", [(0, 1, 1)])
+    run = registry.run
+
+    def failing(key, graph, params=None, log=None):
+        if key == "vert_deg":
+            raise IndexError("fora do intervalo")
+        return run(key, graph, params, log)
+
+    monkeypatch.setattr(registry, "run", failing)
+    results = list(run_batch("g", lines({"id": 1, "query": "vert_deg", "vertex": "a"}, {"id": 2, "query": "vert_adj", "vertex": "a"})))
+    assert results[0] == {"error": "Erro interno: IndexError: fora do intervalo", "id": 1}
+    assert results[1]["id"] == 2 and "error" not in results[1]
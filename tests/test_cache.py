@@ -0,0 +1,32 @@
+import pytest
+
+from core import cache, store
+
+def test_warm_graph_is_reused(library):
+    library("g", "ab", [(0, 1, 1)])
+    assert cache.load_graph("g") is cache.load_graph("g")
+
+def test_journal_edit_invalidates(library):
+    library("g", "ab", [(0, 1, 1)])
+    before = cache.load_graph("g")
+    store.apply_edit("g", {"op": "set_edge", "source": "b", "target": "a", "weight": 7})
+    after = cache.load_graph("g")
+    assert after is not before
+    assert after.weight(1, 0) == 7
+
+def test_catalog_change_invalidates(library):
+    library("g", "ab", [(0, 1, 1)])
+    library("h", "c", [])
+    store.compact()
+    before = cache.load_graph("g")
+    store.rename_graph("h", "k")
+    store.compact()
+    assert cache.load_graph("g") is not before
+    assert store.list_graphs() == ["g", "k"]
+
+def test_deleted_graph_is_not_served(library):
+    library("g", "ab", [(0, 1, 1)])
+    cache.load_graph("g")
+    store.delete_graph("g")
+    with pytest.raises(KeyError):
+        cache.load_graph("g")
@@ -0,0 +1,84 @@
+import time
+
+import pytest
+
+from core import ch, paths, store
+
+pytest.importorskip("numpy")
+
+def grid(size):
+    vertices = [f"{r},{c}" for r in range(size) for c in range(size)]
+    edges = []
+    for r in range(size):
+        for c in range(size):
+            v = r * size + c
+            if c + 1 < size:
+                edges.append((v, v + 1, 1 + (r * 7 + c * 3) % 5))
+            if r + 1 < size:
+                edges.append((v, v + size, 1 + (r * 5 + c * 11) % 4))
+    return vertices, edges
+
+def test_queries_match_dijkstra(library):
+    graph = library("grade", *grid(6), graph_type="undirected")
+    hierarchy = ch.build("grade")
+    for source in range(0, 36, 5):
+        tree = paths.dijkstra(graph, source)
+        for target in range(36):
+            path, cost = hierarchy.query(source, target)
+            assert cost == tree.costs[target]
+            assert path[0] == source and path[-1] == target
+
+def wait_for_rebuild(name):
+    deadline = time.monotonic() + 30
+    while ch.rebuilding(name) and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert not ch.rebuilding(name)
+
+def test_stale_index_is_rejected_and_rebuilt(library):
+    library("grade", *grid(4), graph_type="undirected")
+    assert not ch.schedule_rebuild("grade", store.locate("grade")["directory"])
+    ch.build("grade")
+    assert ch.load(store.load_graph("grade")) is not None
+
+    store.apply_edit("grade", {"op": "set_edge", "source": "0,0", "target": "3,3", "weight": 1})
+    assert ch.load(store.load_graph("grade")) is None
+
+    assert ch.schedule_rebuild("grade", store.locate("grade")["directory"])
+    wait_for_rebuild("grade")
+    graph = store.load_graph("grade")
+    hierarchy = ch.load(graph)
+    assert hierarchy is not None
+    assert hierarchy.query(graph.vertex_id("0,0"), graph.vertex_id("3,3"))[1] == 1
+
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_failed_rebuild_releases_the_name(tmp_path, monkeypatch):
+    calls = []
+
+    def fail(name):
+        calls.append(name)
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(ch, "build", fail)
+    (tmp_path / ch.META_FILE).write_text("{}")
+    for attempt in (1, 2):
+        assert ch.schedule_rebuild("grade", str(tmp_path))
+        wait_for_rebuild("grade")
+        assert calls == ["grade"] * attempt
+
+def test_interrupted_build_still_allows_a_rebuild(library, monkeypatch):
+    library("grade", *grid(4), graph_type="undirected")
+    ch.build("grade")
+    save_array = ch.npstore.save_array
+
+    def interrupted(path, values):
+        raise OSError("disco cheio")
+
+    monkeypatch.setattr(ch.npstore, "save_array", interrupted)
+    with pytest.raises(OSError):
+        ch.build("grade")
+    monkeypatch.setattr(ch.npstore, "save_array", save_array)
+
+    assert ch.load(store.load_graph("grade")) is None
+    assert ch.schedule_rebuild("grade", store.locate("grade")["directory"])
+    wait_for_rebuild("grade")
+    assert ch.load(store.load_graph("grade")) is not None
@@ -0,0 +1,47 @@
+import itertools
+import random
+
+from core import cycles, registry
+from core.graph import Graph
+
+def digraph(n, arcs, graph_type="directed"):
+    if graph_type == "undirected":
+        arcs = arcs + [(v, u) for u, v in arcs if u != v]
+    return Graph(f"ciclos_{n}_{len(arcs)}", [str(v) for v in range(n)], [(u, v, 1) for u, v in arcs], graph_type=graph_type)
+
+def brute_force(n, arcs):
+    found = set()
+    for length in range(1, n + 1):
+        for path in itertools.permutations(range(n), length):
+            if path[0] == min(path) and all((path[i], path[(i + 1) % length]) in arcs for i in range(length)):
+                found.add(path)
+    return found
+
+def test_cycles_match_brute_force():
+    random.seed(5)
+    for _ in range(30):
+        n = 6
+        arcs = {(random.randrange(n), random.randrange(n)) for _ in range(12)}
+        listed = set()
+        for cycle in cycles.CycleSearch(digraph(n, sorted(arcs))):
+            start = cycle.index(min(cycle))
+            listed.add(tuple(cycle[start:] + cycle[:start]))
+        assert listed == brute_force(n, arcs)
+
+def test_length_and_count_limits():
+    graph = digraph(5, [(u, v) for u in range(5) for v in range(5) if u != v])
+    assert all(len(cycle) <= 3 for cycle in cycles.CycleSearch(graph, max_length=3))
+    search = cycles.CycleSearch(graph, max_cycles=4)
+    assert len(list(search)) == 4
+    assert search.stopped == "count"
+
+def test_undirected_cycles_are_listed_once():
+    graph = digraph(4, [(0, 1), (1, 2), (2, 3), (3, 0), (0, 2)], "undirected")
+    assert len(list(cycles.CycleSearch(graph, undirected=True))) == 3
+
+def test_cyclic_answer_does_not_depend_on_the_time_limit(monkeypatch):
+    monkeypatch.setattr(cycles, "TIME_LIMIT", 0)
+    kind, title, message = registry.run("cyclic", digraph(3, [(0, 1), (1, 2), (2, 0)]))
+    assert kind == "info" and "contém ciclos" in message
+    kind, title, message = registry.run("cyclic", digraph(3, [(0, 1), (1, 2)], "undirected"))
+    assert "não contém um ciclo" in message
@@ -0,0 +1,55 @@
+import random
+from collections import Counter
+
+from core import euler
+from core.graph import Graph
+
+def random_graph(rng, n, directed):
+    pairs = [(u, v) for u in range(n) for v in range(n) if (u != v if directed else u <= v) and rng.random() < 0.35]
+    arcs = [(u, v, 1) for u, v in pairs]
+    if not directed:
+        arcs += [(v, u, 1) for u, v in pairs if u != v]
+    graph = Graph("euler", [str(v) for v in range(n)], arcs, graph_type="directed" if directed else "undirected")
+    return graph, pairs
+
+def connected(n, pairs):
+    touched = {v for pair in pairs for v in pair}
+    if not touched:
+        return True
+    parent = list(range(n))
+    def find(v):
+        while parent[v] != v:
+            v = parent[v]
+        return v
+    for u, v in pairs:
+        parent[find(u)] = find(v)
+    return len({find(v) for v in touched}) == 1
+
+def check(directed):
+    rng = random.Random(24)
+    found = Counter()
+    for _ in range(400):
+        n = rng.randint(2, 7)
+        graph, pairs = random_graph(rng, n, directed)
+        if not pairs:
+            continue
+        start, end, unbalanced = euler.endpoints(graph, directed)
+        if start is None:
+            assert unbalanced
+            continue
+        walk = euler.EulerWalk(graph, directed, start, end)
+        trail = list(walk)
+        if not walk.complete():
+            assert not connected(n, pairs)
+            continue
+        assert trail[0] == start and trail[-1] == end
+        used = Counter((u, v) if directed else (min(u, v), max(u, v)) for u, v in zip(trail, trail[1:]))
+        assert used == Counter(pairs)
+        found["circuit" if walk.is_circuit() else "trail"] += 1
+    assert found["circuit"] and found["trail"]
+
+def test_directed_trails_use_every_arc_once():
+    check(True)
+
+def test_undirected_trails_use_every_edge_once():
+    check(False)
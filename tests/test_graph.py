@@ -0,0 +1,49 @@
+import random
+
+from core.graph import Graph
+
+def random_arcs(seed, n=10, m=30):
+    rng = random.Random(seed)
+    arcs = {}
+    for _ in range(m):
+        arcs[(rng.randrange(n), rng.randrange(n))] = rng.choice([rng.randint(-3, 9) or 1, rng.random() + 0.5])
+    return arcs
+
+def test_rows_match_the_arc_list():
+    for seed in range(20):
+        arcs = random_arcs(seed)
+        shuffled = list(arcs.items())
+        random.Random(seed).shuffle(shuffled)
+        graph = Graph("csr", [f"v{v}" for v in range(10)], [(u, v, w) for (u, v), w in shuffled], has_weights=True)
+
+        assert graph.num_arcs() == len(arcs)
+        assert sorted(graph.arcs()) == sorted((u, v, w) for (u, v), w in arcs.items())
+        for v in range(10):
+            assert graph.out_neighbors(v) == sorted(t for s, t in arcs if s == v)
+            assert graph.in_neighbors(v) == sorted(s for s, t in arcs if t == v)
+            assert graph.out_degree(v) == len(graph.out_neighbors(v))
+            assert graph.in_degree(v) == len(graph.in_neighbors(v))
+            assert dict(graph.out_edges(v)) == {t: w for (s, t), w in arcs.items() if s == v}
+            assert dict(graph.in_edges(v)) == {s: w for (s, t), w in arcs.items() if t == v}
+        for u in range(10):
+            for v in range(10):
+                assert graph.weight(u, v) == arcs.get((u, v), 0)
+                assert graph.has_edge(u, v) == ((u, v) in arcs)
+
+def test_names_and_ids():
+    graph = Graph("nomes", ["a", "2", "c"], [(0, 1, 1)])
+    assert graph.vertex_id("2") == 1 and graph.vertex_id("z") is None
+    assert graph.has_vertex("c") and not graph.has_vertex("d")
+    assert graph.names([2, 0]) == ["c", "a"]
+    assert graph.is_directed
+
+def test_from_arrays_shares_the_rows():
+    graph = Graph("origem", "abcd", [(0, 1, 2), (1, 2, 3), (3, 0, 1)], graph_type="undirected")
+    copy = Graph.from_arrays(
+        "copia", graph.vertices,
+        graph.out_offsets, graph.out_targets, graph.out_weights,
+        graph.in_offsets, graph.in_sources, graph.in_weights,
+        graph_type="undirected",
+    )
+    assert list(copy.arcs()) == list(graph.arcs())
+    assert copy.in_neighbors(0) == [3] and not copy.is_directed
@@ -0,0 +1,19 @@
+import os
+import subprocess
+import sys
+
+from core import registry
+
+def test_loading_every_tool_defers_heavy_imports():
+    script = "from core import registry; timings, heavy = registry.import_report(); print(len(timings)); print(','.join(heavy))"
+    result = subprocess.run([sys.executable, "-c", script], cwd=registry.ROOT_DIR, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=registry.ROOT_DIR), timeout=120)
+    assert result.returncode == 0, result.stderr
+    count, heavy = result.stdout.splitlines()
+    assert int(count) == len(registry.APPS)
+    assert heavy == ""
+
+def test_queries_load_without_tkinter():
+    script = "import sys; sys.modules['tkinter'] = None; import batch, server; from core import registry; [registry.load_module(path) for path, function, params in registry.ALGORITHMS.values()]; print('tkinter' in sys.modules and sys.modules['tkinter'] is not None)"
+    result = subprocess.run([sys.executable, "-c", script], cwd=registry.ROOT_DIR, capture_output=True, text=True, env=dict(os.environ, PYTHONPATH=registry.ROOT_DIR), timeout=120)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "False"
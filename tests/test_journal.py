@@ -0,0 +1,69 @@
+import multiprocessing
+
+from core import journal, store
+
+def snapshot(name):
+    graph = store.load_graph(name)
+    return sorted((graph.name_of(u), graph.name_of(v), weight) for u, v, weight in graph.arcs()), sorted(graph.names(range(graph.num_vertices())))
+
+def test_edits_replay_before_and_after_compaction(library):
+    library("g", "abc", [(0, 1, 2)])
+    location = store.locate("g")
+    store.apply_edits(location, [
+        {"op": "add_vertex", "vertex": "d"},
+        {"op": "set_edge", "source": "c", "target": "d", "weight": 5},
+        {"op": "rename_vertex", "old": "a", "new": "x"},
+        {"op": "remove_vertex", "vertex": "b"},
+    ])
+    expected = ([("c", "d", 5)], ["c", "d", "x"])
+    assert snapshot("g") == expected
+    assert location["edit_seq"] == journal.last_seq(store.JOURNAL_PATH)
+
+    store.compact()
+    ops = journal.read_ops(store.JOURNAL_PATH)
+    assert [op["op"] for op in ops] == ["checkpoint"]
+    assert snapshot("g") == expected
+    assert store.read_record("g")["journal_seq"] == location["edit_seq"]
+
+    store.apply_edit("g", {"op": "set_edge", "source": "x", "target": "c", "weight": 1})
+    assert snapshot("g") == ([("c", "d", 5), ("x", "c", 1)], ["c", "d", "x"])
+
+def test_catalog_ops_replay(library):
+    library("a", "uv", [(0, 1, 1)])
+    store.rename_graph("a", "b")
+    library("c", "w", [])
+    store.delete_graph("c")
+    assert store.list_graphs() == ["b"]
+    store.compact()
+    assert store.list_graphs() == ["b"]
+    assert snapshot("b") == ([("u", "v", 1)], ["u", "v"])
+
+def test_torn_tail_is_ignored(library):
+    library("g", "ab", [])
+    with open(store.JOURNAL_PATH, "a") as f:
+        f.write('{"op":"set_edge","file":"g.json","source":"a","tar')
+    assert snapshot("g") == ([], ["a", "b"])
+    store.apply_edit("g", {"op": "set_edge", "source": "a", "target": "b", "weight": 3})
+    assert snapshot("g") == ([("a", "b", 3)], ["a", "b"])
+
+def test_appending_does_not_replay_the_journal(library, monkeypatch):
+    library("g", "ab", [])
+    location = store.locate("g")
+    def fail(path):
+        raise AssertionError("journal replayed")
+    monkeypatch.setattr(journal, "read_ops", fail)
+    store.apply_edits(location, [{"op": "set_edge", "source": "a", "target": "b", "weight": 1}] * 3)
+
+def _append_many(path, count):
+    for i in range(count):
+        journal.append(path, {"op": "add_vertex", "vertex": str(i)})
+
+def test_concurrent_writers_get_distinct_seqs(tmp_path):
+    path = str(tmp_path / "journal.log")
+    context = multiprocessing.get_context("fork")
+    workers = [context.Process(target=_append_many, args=(path, 50)) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    assert sorted(op["seq"] for op in journal.read_ops(path)) == list(range(1, 201))
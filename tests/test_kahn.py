@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from core import npstore, properties, registry, topo
+from core.graph import Graph
+
+def digraph(n, arcs):
+    return Graph(f"kahn_{n}_{len(arcs)}", [str(v) for v in range(n)], [(u, v, 1) for u, v in arcs])
+
+def check_layers(graph, layers):
+    layer_of = {v: i for i, layer in enumerate(layers) for v in layer}
+    assert len(layer_of) == sum(len(layer) for layer in layers)
+    for u, v, weight in graph.arcs():
+        assert layer_of[u] < layer_of[v]
+    for i, layer in enumerate(layers[1:], 1):
+        for v in layer:
+            assert any(layer_of[u] == i - 1 for u in graph.in_neighbors(v))
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_layers_respect_arcs(monkeypatch, vectorized):
+    if vectorized:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(npstore, "available", lambda: False)
+    random.seed(11)
+    n = 400
+    arcs = {(u, v) for u, v in (sorted(random.sample(range(n), 2)) for _ in range(1500))}
+    graph = digraph(n, sorted(arcs))
+    sweep = topo.KahnSweep(graph)
+    layers = list(sweep)
+    assert sweep.cycle is None
+    assert sweep.sorted_count == n
+    check_layers(graph, layers)
+
+@pytest.mark.parametrize("vectorized", [True, False])
+def test_witness_cycle(monkeypatch, vectorized):
+    if not vectorized:
+        monkeypatch.setattr(npstore, "available", lambda: False)
+    graph = digraph(6, [(0, 1), (1, 2), (2, 3), (3, 1), (3, 4), (5, 0)])
+    sweep = topo.KahnSweep(graph)
+    list(sweep)
+    assert sweep.sorted_count == 2
+    cycle = sweep.cycle
+    assert sorted(cycle) == [1, 2, 3]
+    assert all(graph.has_edge(u, v) for u, v in zip(cycle, cycle[1:] + cycle[:1]))
+
+def test_dag_check_skips_the_property_cache(monkeypatch):
+    def fail(graph):
+        raise AssertionError("properties computed")
+    monkeypatch.setattr(properties, "compute", fail)
+    kind, title, message = registry.run("dag_top_gen", digraph(3, [(0, 1), (1, 2)]))
+    assert kind == "info" and "0, 1, 2" in message
+    kind, title, message = registry.run("dag_top_gen", digraph(3, [(0, 1), (1, 2), (2, 0)]))
+    assert title == "Grafo Cíclico"
@@ -0,0 +1,21 @@
+import os
+
+from core import store
+
+def test_one_graph_loads_without_reading_the_others(library):
+    library("a", "xy", [(0, 1, 4)])
+    library("b", "z", [])
+    store.compact()
+    with open(os.path.join(store.GRAPHS_DIR, store.read_catalog()["b"]["file"]), "w") as f:
+        f.write("{corrompido")
+
+    assert store.list_graphs() == ["a", "b"]
+    graph = store.load_graph("a")
+    assert graph.names(range(graph.num_vertices())) == ["x", "y"]
+    assert graph.weight(0, 1) == 4
+
+def test_catalog_summarises_each_graph(library):
+    library("g", "abc", [(0, 1, 1), (1, 2, 1)], graph_type="undirected")
+    entry = store.read_catalog()["g"]
+    assert (entry["type"], entry["vertices"], entry["edges"]) == ("undirected", 3, 2)
+    assert store.graph_exists("g") and not store.graph_exists("h")
@@ -0,0 +1,60 @@
+import itertools
+import random
+
+import pytest
+
+from core import mst
+from core.graph import Graph
+
+def random_graph(seed, n, m):
+    rng = random.Random(seed)
+    edges = {}
+    for _ in range(m):
+        u, v = sorted((rng.randrange(n), rng.randrange(n)))
+        if u != v:
+            edges[(u, v)] = rng.randint(1, 6)
+    arcs = [(u, v, w) for (u, v), w in edges.items()] + [(v, u, w) for (u, v), w in edges.items()]
+    return Graph(f"arvore_{seed}", [str(v) for v in range(n)], arcs, graph_type="undirected", has_weights=True), edges
+
+def find(parent, v):
+    while parent[v] != v:
+        v = parent[v]
+    return v
+
+def is_forest(n, edges):
+    parent = list(range(n))
+    for u, v in edges:
+        a, b = find(parent, u), find(parent, v)
+        if a == b:
+            return False
+        parent[a] = b
+    return True
+
+def brute_force(n, edges):
+    parent = list(range(n))
+    for u, v in edges:
+        parent[find(parent, u)] = find(parent, v)
+    size = n - len({find(parent, v) for v in range(n)})
+    return min(sum(edges[e] for e in c) for c in itertools.combinations(edges, size) if is_forest(n, c)), size
+
+def assert_minimum(graph, edges, forest):
+    n = graph.num_vertices()
+    weight, size = brute_force(n, edges)
+    assert len(forest.edges) == size
+    assert is_forest(n, [(u, v) for u, v, _ in forest.edges])
+    assert all(edges[(min(u, v), max(u, v))] == w for u, v, w in forest.edges)
+    assert forest.total_weight() == weight
+    assert forest.component_count() == n - size
+    assert sorted(v for members in forest.components() for v in members) == list(range(n))
+
+@pytest.mark.parametrize("method", mst.METHODS)
+def test_forest_weight_matches_brute_force(method):
+    for seed in range(25):
+        graph, edges = random_graph(seed, 7, 11)
+        assert_minimum(graph, edges, mst.minimum_spanning_forest(graph, method))
+
+def test_parallel_boruvka(monkeypatch):
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(mst, "POOL_MIN_EDGES", 1)
+    graph, edges = random_graph(7, 8, 14)
+    assert_minimum(graph, edges, mst.boruvka(graph, workers=2))
@@ -0,0 +1,36 @@
+import os
+
+import pytest
+
+from core import npstore, store
+from core.graph import Graph
+
+np = pytest.importorskip("numpy")
+
+def test_round_trip_is_memory_mapped(tmp_path):
+    graph = Graph("g", ["a", "bb", "c"], [(0, 1, 2.5), (2, 0, 1), (1, 2, 4)], graph_type="directed", has_weights=True, is_complete=True)
+    npstore.write_graph(str(tmp_path), graph)
+    loaded = npstore.open_graph("g", str(tmp_path))
+
+    assert isinstance(loaded.out_targets, np.memmap)
+    assert list(loaded.arcs()) == list(graph.arcs())
+    assert loaded.names(range(3)) == ["a", "bb", "c"]
+    assert loaded.vertex_id("bb") == 1
+    assert loaded.in_neighbors(0) == [2]
+    assert loaded.weight(0, 1) == 2.5
+    assert (loaded.type, loaded.has_weights, loaded.is_bipartite, loaded.is_complete) == ("directed", True, False, True)
+
+def test_arrays_follow_the_payload(library):
+    library("g", "ab", [(0, 1, 1)])
+    store.compact()
+    entry = store.read_catalog()["g"]
+    arrays_dir = os.path.join(store.GRAPHS_DIR, os.path.splitext(entry["file"])[0])
+    payload = os.path.join(store.GRAPHS_DIR, entry["file"])
+
+    assert store.load_graph("g").weight(0, 1) == 1
+    assert npstore.is_current(arrays_dir, payload)
+
+    store.apply_edit("g", {"op": "set_edge", "source": "a", "target": "b", "weight": 6})
+    store.compact()
+    assert store.load_graph("g").weight(0, 1) == 6
+    assert npstore.is_current(arrays_dir, payload)
@@ -0,0 +1,108 @@
+import random
+
+from core import paths, registry
+from core.graph import Graph
+
+def random_graph(seed, n=12, m=40, low=1, high=9):
+    rng = random.Random(seed)
+    arcs = {}
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            arcs[(u, v)] = rng.randint(low, high)
+    return Graph(f"caminhos_{seed}", [str(v) for v in range(n)], [(u, v, w) for (u, v), w in sorted(arcs.items())], has_weights=True)
+
+def bellman_ford(graph, source):
+    costs = [paths.INF] * graph.num_vertices()
+    costs[source] = 0
+    for _ in range(graph.num_vertices()):
+        for u, v, weight in graph.arcs():
+            if costs[u] + weight < costs[v]:
+                costs[v] = costs[u] + weight
+    return costs
+
+def assert_tree_paths(graph, tree):
+    for v in range(graph.num_vertices()):
+        path = tree.path(v)
+        if not tree.reached(v):
+            assert path is None
+            continue
+        assert path[0] == tree.source and path[-1] == v
+        assert sum(graph.weight(a, b) for a, b in zip(path, path[1:])) == tree.cost(v)
+
+def test_dijkstra_matches_bellman_ford():
+    for seed in range(20):
+        graph = random_graph(seed)
+        tree = paths.dijkstra(graph, 0)
+        assert tree.complete
+        assert tree.costs == bellman_ford(graph, 0)
+        assert_tree_paths(graph, tree)
+
+def test_dijkstra_stops_at_target():
+    for seed in range(20):
+        graph = random_graph(seed)
+        full = paths.dijkstra(graph, 0)
+        for target in range(graph.num_vertices()):
+            tree = paths.dijkstra(graph, 0, target)
+            assert tree.cost(target) == full.cost(target)
+            if full.reached(target):
+                assert not tree.complete
+                path = tree.path(target)
+                assert path[-1] == target
+                assert sum(graph.weight(a, b) for a, b in zip(path, path[1:])) == full.cost(target)
+
+def test_reverse_search_gives_costs_to_the_source():
+    graph = random_graph(3)
+    backward = paths.dijkstra(graph, 5, reverse=True)
+    for v in range(graph.num_vertices()):
+        assert backward.cost(v) == paths.dijkstra(graph, v).cost(5)
+
+def test_spfa_handles_negative_weights():
+    for seed in range(20):
+        rng = random.Random(seed)
+        arcs = {(u, v): rng.randint(-5, 9) for u, v in ((rng.randrange(12), rng.randrange(12)) for _ in range(40)) if u < v}
+        graph = Graph("negativo", [str(v) for v in range(12)], [(u, v, w) for (u, v), w in sorted(arcs.items())], has_weights=True)
+        tree, cycle = paths.spfa(graph, 0)
+        assert cycle is None and tree.complete
+        assert tree.costs == bellman_ford(graph, 0)
+        assert_tree_paths(graph, tree)
+
+def test_spfa_reports_a_negative_cycle():
+    graph = Graph("ciclo", "abcde", [(0, 1, 2), (1, 2, 1), (2, 3, -4), (3, 1, 1), (3, 4, 1)], has_weights=True)
+    tree, cycle = paths.spfa(graph, 0)
+    assert not tree.complete
+    assert cycle[0] == cycle[-1]
+    assert sum(graph.weight(a, b) for a, b in zip(cycle, cycle[1:])) < 0
+
+def test_least_cost_skips_bellman_ford_without_negative_weights(library, monkeypatch):
+    def fail(*args, **kwargs):
+        raise AssertionError("SPFA executado sem pesos negativos")
+
+    graph = library("g", "abc", [(0, 1, 2), (1, 2, 3), (0, 2, 9)])
+    monkeypatch.setattr(paths, "spfa", fail)
+    kind, title, message = registry.run("least_cost", graph, {"start_vertex": "a", "end_vertex": "c"})
+    assert kind == "info" and message.endswith("a -> b -> c com custo 5")
+
+def test_least_cost_uses_spfa_for_negative_weights(library):
+    graph = library("n", "abc", [(0, 1, 2), (1, 2, -3), (0, 2, 9)])
+    kind, title, message = registry.run("least_cost", graph, {"start_vertex": "a", "end_vertex": "c"})
+    assert message.endswith("a -> b -> c com custo -1")
+
+    graph = library("c", "abc", [(0, 1, 2), (1, 2, -3), (2, 1, 1)])
+    kind, title, message = registry.run("least_cost", graph, {"start_vertex": "a", "end_vertex": "c"})
+    assert (kind, title) == ("error", "Ciclo Negativo")
+
+def test_bidirectional_bfs_finds_a_shortest_path():
+    for seed in range(30):
+        graph = random_graph(seed, n=15, m=25)
+        for source in range(0, 15, 4):
+            hops = paths.bfs_tree(graph, source)
+            for target in range(15):
+                path, explored = paths.bidirectional_bfs(graph, source, target)
+                assert explored <= graph.num_vertices()
+                if not hops.reached(target):
+                    assert path is None
+                    continue
+                assert path[0] == source and path[-1] == target
+                assert len(path) - 1 == hops.cost(target)
+                assert all(graph.has_edge(a, b) for a, b in zip(path, path[1:]))
@@ -0,0 +1,128 @@
+import itertools
+import random
+
+from core import planarity, registry
+from core.graph import Graph
+
+def undirected(n, edges):
+    arcs = [(u, v, 1) for u, v in edges] + [(v, u, 1) for u, v in edges]
+    return Graph(f"planar_{n}_{len(edges)}", [str(v) for v in range(n)], arcs, graph_type="undirected")
+
+def assert_valid_embedding(n, edges, embedding):
+    adjacency = {v: set() for v in range(n)}
+    for u, v in edges:
+        adjacency[u].add(v)
+        adjacency[v].add(u)
+    for v in range(n):
+        assert sorted(embedding.clockwise(v)) == sorted(adjacency[v])
+
+    seen = set()
+    faces = 0
+    for dart in ((u, v) for u in range(n) for v in adjacency[u]):
+        if dart in seen:
+            continue
+        faces += 1
+        while dart not in seen:
+            seen.add(dart)
+            u, v = dart
+            rotation = embedding.clockwise(v)
+            dart = (v, rotation[(rotation.index(u) + 1) % len(rotation)])
+
+    components = 0
+    reached = set()
+    for start in range(n):
+        if adjacency[start] and start not in reached:
+            components += 1
+            stack = [start]
+            reached.add(start)
+            while stack:
+                for w in adjacency[stack.pop()]:
+                    if w not in reached:
+                        reached.add(w)
+                        stack.append(w)
+    assert len(reached) - len(edges) + faces == 2 * components
+
+def assert_valid_witness(edges, witness):
+    edges = set(edges)
+    branch = set(witness.branch_vertices)
+    interior = set()
+    ends = []
+    for path in witness.paths:
+        assert path[0] in branch and path[-1] in branch and path[0] != path[-1]
+        for u, v in zip(path, path[1:]):
+            assert (min(u, v), max(u, v)) in edges
+        inner = set(path[1:-1])
+        assert len(inner) == len(path) - 2
+        assert not inner & branch and not inner & interior
+        interior |= inner
+        ends.append(frozenset((path[0], path[-1])))
+    assert len(ends) == len(set(ends))
+
+    if witness.kind == "K5":
+        assert len(branch) == 5
+        assert set(ends) == {frozenset(pair) for pair in itertools.combinations(branch, 2)}
+    else:
+        left, right = witness.parts()
+        assert len(left) == len(right) == 3 and set(left) | set(right) == branch
+        assert set(ends) == {frozenset((u, v)) for u in left for v in right}
+
+def check(n, edges):
+    graph = undirected(n, edges)
+    edges = planarity.simple_edges(graph)
+    embedding, witness = planarity.test(graph, witness=True)
+    assert (embedding is None) != (witness is None)
+    if embedding:
+        assert_valid_embedding(n, edges, embedding)
+    else:
+        assert_valid_witness(edges, witness)
+    return embedding is not None
+
+def test_kuratowski_graphs():
+    assert not check(5, list(itertools.combinations(range(5), 2)))
+    assert not check(6, [(u, v) for u in range(3) for v in range(3, 6)])
+    petersen = [(i, (i + 1) % 5) for i in range(5)] + [(i, i + 5) for i in range(5)] + [(5 + i, 5 + (i + 2) % 5) for i in range(5)]
+    assert not check(10, petersen)
+
+def test_planar_families():
+    grid = [(r * 4 + c, r * 4 + c + 1) for r in range(4) for c in range(3)] + [(r * 4 + c, r * 4 + c + 4) for r in range(3) for c in range(4)]
+    assert check(16, grid)
+    wheel = [(0, i) for i in range(1, 8)] + [(i, i % 7 + 1) for i in range(1, 8)]
+    assert check(8, wheel)
+    assert check(5, [(u, v) for u, v in itertools.combinations(range(5), 2) if (u, v) != (0, 1)])
+
+def test_random_graphs_give_a_valid_certificate():
+    random.seed(19)
+    outcomes = set()
+    for _ in range(120):
+        n = random.randint(5, 11)
+        edges = [pair for pair in itertools.combinations(range(n), 2) if random.random() < 0.4]
+        outcomes.add(check(n, edges))
+    assert outcomes == {True, False}
+
+def test_witness_is_only_searched_on_request(monkeypatch):
+    rows = 60
+    grid = [(r * rows + c, r * rows + c + 1) for r in range(rows) for c in range(rows - 1)]
+    grid += [(r * rows + c, r * rows + c + rows) for r in range(rows - 1) for c in range(rows)]
+    grid += [(r * rows + c, r * rows + c + rows + 1) for r in range(rows - 1) for c in range(rows - 1)]
+    last = rows * rows - 1
+    grid += [(0, last), (rows - 1, last - rows + 1), (1, last - 1)]
+    graph = undirected(rows * rows, grid)
+
+    def fail(*args):
+        raise AssertionError("busca de testemunha não solicitada")
+
+    monkeypatch.setattr(planarity, "kuratowski_subgraph", fail)
+    assert planarity.test(graph) == (None, None)
+    kind, title, message = registry.run("planarity", graph)
+    assert message == "O grafo não é planar."
+
+    dense = undirected(6, list(itertools.combinations(range(6), 2)))
+    kind, title, message = registry.run("planarity", dense)
+    assert "3V - 6" in message
+
+    monkeypatch.undo()
+    kind, title, message = registry.run("kuratowski", dense)
+    assert message.startswith("O grafo contém uma subdivisão de K")
+    embedding, witness = planarity.test(dense, witness=True)
+    assert embedding is None and len(witness.branch_vertices) in (5, 6)
+    assert_valid_witness(planarity.simple_edges(dense), witness)
@@ -0,0 +1,35 @@
+from core import properties, registry, store
+
+def fail(graph):
+    raise AssertionError("properties computed")
+
+def test_properties_persist_until_the_graph_changes(library, monkeypatch):
+    library("g", "abc", [(0, 1, 1), (1, 2, 1)])
+    first = properties.get(store.load_graph("g"))
+    assert first["weak_component_count"] == 1 and first["acyclic"]
+    assert first["out_degrees"] == [1, 1, 0] and first["in_degrees"] == [0, 1, 1]
+
+    compute = properties.compute
+    monkeypatch.setattr(properties, "compute", fail)
+    assert properties.get(store.load_graph("g"))["version"] == first["version"]
+
+    store.apply_edit("g", {"op": "set_edge", "source": "c", "target": "a", "weight": 1})
+    monkeypatch.setattr(properties, "compute", compute)
+    changed = properties.get(store.load_graph("g"))
+    assert changed["version"] != first["version"]
+    assert not changed["acyclic"] and changed["strong_component_count"] == 1
+    assert changed["out_degrees"] == [1, 1, 1] and changed["in_degrees"] == [1, 1, 1]
+
+def test_directedness_comes_from_the_stored_type(library):
+    graph = library("simetrico", "ab", [(0, 1, 1), (1, 0, 1)])
+    assert properties.get(graph)["asymmetric_arc"] is None
+    kind, title, message = registry.run("und_con", graph)
+    assert message == "O grafo é direcionado."
+    kind, title, message = registry.run("eulerian", graph)
+    assert title == "Grafo Euleriano" and "direcionado é Euleriano" in message
+
+def test_undirected_checks_skip_the_asymmetry_scan(library, monkeypatch):
+    graph = library("triangulo", "abc", [(0, 1, 1), (1, 2, 1), (2, 0, 1)], graph_type="undirected")
+    monkeypatch.setattr(properties, "compute", fail)
+    kind, title, message = registry.run("eulerian", graph)
+    assert title == "Grafo Euleriano"
@@ -0,0 +1,45 @@
+import json
+import os
+
+from core import store
+
+LEGACY = {
+    "setas": {
+        "type": "directed",
+        "has_weights": True,
+        "adjacency_matrix": {"a": {"b": 3, "c": 0}, "b": {"a": 1}, "c": {}},
+    },
+    "linhas": {
+        "type": "undirected",
+        "has_weights": False,
+        "adjacency_matrix": {"x": {"y": 1, "x": 1}, "y": {"x": 1, "z": 1}, "z": {"y": 1}},
+    },
+}
+
+def nonzero(adjacency_matrix):
+    return {u: {v: w for v, w in row.items() if w != 0} for u, row in adjacency_matrix.items()}
+
+def test_adjacency_round_trip():
+    for graph_info in LEGACY.values():
+        record = store.record_from_adjacency(graph_info)
+        back = store.adjacency_from_record(record)
+        assert back["adjacency_matrix"] == nonzero(graph_info["adjacency_matrix"])
+        assert back["type"] == graph_info["type"] and back["has_weights"] == graph_info["has_weights"]
+
+def test_undirected_edges_are_stored_once():
+    record = store.record_from_adjacency(LEGACY["linhas"])
+    assert sorted(tuple(edge[:2]) for edge in record["edges"]) == [(0, 0), (0, 1), (1, 2)]
+    graph = store.graph_from_record("linhas", record)
+    assert graph.num_arcs() == 5
+    assert graph.has_edge(2, 1) and graph.has_edge(1, 2)
+
+def test_legacy_library_is_migrated(library):
+    with open(store.LEGACY_PATH, "w") as f:
+        json.dump(LEGACY, f)
+
+    assert sorted(store.list_graphs()) == ["linhas", "setas"]
+    assert not os.path.exists(store.LEGACY_PATH)
+    assert store.read_catalog()["setas"]["edges"] == 2
+    graph = store.load_graph("setas")
+    assert graph.weight(graph.vertex_id("a"), graph.vertex_id("b")) == 3
+    assert not graph.has_edge(graph.vertex_id("a"), graph.vertex_id("c"))
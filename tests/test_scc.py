@@ -0,0 +1,51 @@
+import random
+
+from core import scc
+from core.graph import Graph
+
+def random_graph(seed, n=12, m=18):
+    rng = random.Random(seed)
+    arcs = sorted({(rng.randrange(n), rng.randrange(n)) for _ in range(m)})
+    return Graph(f"componentes_{seed}", [str(v) for v in range(n)], [(u, v, 1) for u, v in arcs])
+
+def reachable(graph, source):
+    seen = {source}
+    stack = [source]
+    while stack:
+        for v in graph.out_neighbors(stack.pop()):
+            if v not in seen:
+                seen.add(v)
+                stack.append(v)
+    return seen
+
+def test_components_match_mutual_reachability():
+    for seed in range(30):
+        graph = random_graph(seed)
+        labels, count = scc.tarjan(graph)
+        reach = [reachable(graph, v) for v in range(graph.num_vertices())]
+        for u in range(graph.num_vertices()):
+            for v in range(graph.num_vertices()):
+                assert (labels[u] == labels[v]) == (v in reach[u] and u in reach[v])
+        assert sorted(set(labels)) == list(range(count))
+
+def test_condensation_is_topologically_labelled():
+    for seed in range(30):
+        graph = random_graph(seed)
+        dag = scc.condensation(graph)
+        expected = {(dag.labels[u], dag.labels[v]) for u, v, weight in graph.arcs() if dag.labels[u] != dag.labels[v]}
+        arcs = list(dag.arcs())
+        assert len(arcs) == len(expected) == dag.num_arcs()
+        assert set(arcs) == expected
+        assert all(source < target for source, target in arcs)
+
+def test_subgraph_components_ignore_outside_vertices():
+    adjacency = {"a": ["b", "x"], "b": ["a", "c"], "c": ["d"], "d": ["c", "x"]}
+    assert sorted(sorted(component) for component in scc.subgraph_components(adjacency)) == [["a", "b"], ["c", "d"]]
+
+def test_long_cycle_does_not_recurse():
+    n = 20000
+    graph = Graph("longo", [str(v) for v in range(n)], [(v, (v + 1) % n, 1) for v in range(n)])
+    labels, count = scc.tarjan(graph)
+    assert count == 1
+    adjacency = {v: [(v + 1) % n] for v in range(n)}
+    assert [len(component) for component in scc.subgraph_components(adjacency)] == [n]
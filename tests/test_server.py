@@ -0,0 +1,50 @@
+import json
+import threading
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
+
+import pytest
+
+import server
+from core import registry
+
+@pytest.fixture
+def serve(library):
+    library("g", "abc", [(0, 1, 2), (1, 2, 3)])
+    httpd = server.PooledHTTPServer(("127.0.0.1", 0), server.QueryHandler, 2)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+
+    def post(path, query):
+        url = f"http://127.0.0.1:{httpd.server_address[1]}{path}"
+        request = Request(url, json.dumps(query).encode("utf-8"), {"Content-Type": "application/json"})
+        try:
+            with urlopen(request, timeout=10) as response:
+                return response.status, json.loads(response.read())
+        except HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    yield httpd, post
+    httpd.shutdown()
+    httpd.server_close()
+
+def test_answers_and_reports_client_errors(serve):
+    httpd, post = serve
+    status, data = post("/query", {"graph": "g", "query": "dag_top_gen"})
+    assert status == 200 and data["query"] == "dag_top_gen"
+    assert post("/query", {"query": "dag_top_gen"})[0] == 400
+    assert post("/query", {"graph": "h", "query": "dag_top_gen"})[0] == 404
+    assert post("/nada", {})[0] == 404
+
+def test_unexpected_exception_becomes_json_500(serve, monkeypatch):
+    httpd, post = serve
+
+    def fail(*args, **kwargs):
+        raise RuntimeError("falhou")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(registry, "run", fail)
+        status, data = post("/query", {"graph": "g", "query": "dag_top_gen"})
+    assert status == 500
+    assert "falhou" in data["error"]
+    assert post("/query", {"graph": "g", "query": "dag_top_gen"})[0] == 200
@@ -0,0 +1,122 @@
+import random
+
+from core import store, topo
+
+def edge(u, v, weight=1):
+    return {"op": "set_edge", "source": u, "target": v, "weight": weight}
+
+def save_edits(name, ops):
+    location = store.locate(name)
+    dag = topo.open_order(name, location)
+    store.apply_edits(location, ops)
+    return dag, topo.apply_edits(name, dag, ops, location)
+
+def respects(dag):
+    order = dag.names()
+    position = {v: i for i, v in enumerate(order)}
+    assert len(order) == len(position)
+    return all(position[u] < position[v] for u in dag.successors for v in dag.successors[u])
+
+def reaches(dag, start, goal):
+    seen = {start}
+    stack = [start]
+    while stack:
+        for w in dag.successors[stack.pop()]:
+            if w == goal:
+                return True
+            if w not in seen:
+                seen.add(w)
+                stack.append(w)
+    return False
+
+def test_several_inserts_respect_every_arc():
+    dag = topo.DynamicOrder([0, 1, 2, 3], [])
+    for u, v in ((1, 3), (3, 2), (2, 0)):
+        assert dag.apply(edge(u, v)) is None
+    assert respects(dag)
+    assert dag.apply(edge(0, 1)) == [0, 1, 3, 2]
+
+def test_random_inserts_match_reachability():
+    random.seed(7)
+    for _ in range(50):
+        dag = topo.DynamicOrder(range(12), [])
+        for _ in range(40):
+            u, v = random.sample(range(12), 2)
+            closes = reaches(dag, v, u)
+            cycle = dag.insert(u, v)
+            assert (cycle is not None) == closes
+            if cycle:
+                assert cycle[0] == u and cycle[1] == v
+                assert all(b in dag.successors[a] for a, b in zip(cycle[1:], cycle[2:]))
+                break
+            assert respects(dag)
+
+def test_vertex_edits_keep_the_order():
+    dag = topo.DynamicOrder(["A", "B", "C"], [("A", "B"), ("B", "C")])
+    dag.apply({"op": "rename_vertex", "old": "B", "new": "X"})
+    dag.apply({"op": "remove_vertex", "vertex": "A"})
+    dag.apply(edge("D", "X"))
+    assert respects(dag)
+    assert dag.apply(edge("C", "D")) == ["C", "D", "X"]
+
+def test_editor_keeps_saved_order_current(library):
+    graph = library("g", "abcd", [])
+    topo.save(graph, [v for layer in topo.KahnSweep(graph) for v in layer])
+
+    for u, v in (("b", "d"), ("d", "c"), ("c", "a")):
+        dag, cycle = save_edits("g", [edge(u, v)])
+        assert dag is not None and cycle is None
+
+    graph = store.load_graph("g")
+    order = topo.load(graph)
+    position = {v: i for i, v in enumerate(order)}
+    assert sorted(order) == list(range(4))
+    assert all(position[u] < position[v] for u, v, weight in graph.arcs())
+
+    store.apply_edit("g", edge("a", "b"))
+    assert topo.open_order("g", store.locate("g")) is None
+    assert topo.load(store.load_graph("g")) is None
+
+def test_cycle_warning_names_the_new_edge(library):
+    graph = library("g", "abc", [(0, 1, 1), (1, 2, 1)])
+    topo.save(graph, [v for layer in topo.KahnSweep(graph) for v in layer])
+
+    dag, cycle = save_edits("g", [edge("c", "a")])
+    assert cycle == ["c", "a", "b"]
+    assert topo.cycle_warning(cycle).startswith("A aresta c -> a foi salva, mas fecha o ciclo c -> a -> b -> c.")
+    assert store.load_graph("g").has_edge(2, 0)
+
+    graph = library("h", "ab", [(0, 1, 1)])
+    topo.save(graph, [0, 1])
+    dag, cycle = save_edits("h", [edge("b", "b")])
+    assert cycle == ["b"]
+    assert topo.cycle_warning(cycle).startswith("A aresta b -> b foi salva, mas fecha o ciclo b -> b.")
+
+def test_compaction_keeps_current_orders(library):
+    library("parado", "ab", [(0, 1, 1)])
+    library("editado", "abc", [(0, 1, 1)])
+    library("desatualizado", "ab", [])
+    for name in ("parado", "editado", "desatualizado"):
+        graph = store.load_graph(name)
+        topo.save(graph, [v for layer in topo.KahnSweep(graph) for v in layer])
+
+    save_edits("editado", [edge("b", "c")])
+    store.apply_edit("desatualizado", edge("b", "a"))
+    store.compact()
+
+    assert topo.load(store.load_graph("parado")) is not None
+    assert topo.load(store.load_graph("editado")) is not None
+    assert topo.load(store.load_graph("desatualizado")) is None
+
+def test_one_save_with_several_edits(library):
+    graph = library("lote", "abcd", [])
+    topo.save(graph, [v for layer in topo.KahnSweep(graph) for v in layer])
+    dag, cycle = save_edits("lote", [edge("b", "d"), edge("d", "c"), edge("c", "a")])
+    assert cycle is None
+    graph = store.load_graph("lote")
+    position = {v: i for i, v in enumerate(topo.load(graph))}
+    assert all(position[u] < position[v] for u, v, weight in graph.arcs())
+
+    dag, cycle = save_edits("lote", [edge("a", "b"), edge("a", "c")])
+    assert cycle == ["a", "b", "d", "c"]
+    assert topo.load(store.load_graph("lote")) is None
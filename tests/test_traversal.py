@@ -0,0 +1,65 @@
+import sys
+
+import pytest
+
+from core import registry, traversal
+from core.graph import Graph
+
+DEEP = 30000
+
+def stack_depth():
+    depth = 0
+    frame = sys._getframe()
+    while frame:
+        depth += 1
+        frame = frame.f_back
+    return depth
+
+def test_dfs_hooks_and_early_exit():
+    graph = Graph("arvore", "abcdef", [(0, 1, 1), (0, 2, 1), (1, 3, 1), (2, 4, 1), (4, 5, 1)])
+    pre, post = [], []
+    assert traversal.dfs(graph, 0, pre=pre.append, post=post.append) is None
+    assert pre == [0, 1, 3, 2, 4, 5]
+    assert post == [3, 1, 5, 4, 2, 0]
+
+    assert traversal.dfs(graph, 0, pre=lambda v: v == 4) == [0, 2, 4]
+    assert traversal.dfs(graph, 0, edge=lambda u, v: (u, v) == (4, 5)) == [0, 2, 4]
+    assert traversal.dfs(graph, 0, post=lambda v: v == 1) == [0, 1]
+
+def test_dfs_follows_long_paths_without_recursion():
+    graph = Graph("caminho", [str(v) for v in range(DEEP)], [(v, v + 1, 1) for v in range(DEEP - 1)])
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(stack_depth() + 50)
+    try:
+        path = traversal.dfs(graph, 0, pre=lambda v: v == DEEP - 1)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert path == list(range(DEEP))
+
+def test_bfs_visits_by_distance_and_stops_early():
+    graph = Graph("arvore", "abcdef", [(0, 1, 1), (0, 2, 1), (1, 3, 1), (2, 4, 1), (4, 5, 1)])
+    order = []
+    assert not traversal.bfs(graph, 0, pre=lambda v: order.append(v))
+    assert order == [0, 1, 2, 3, 4, 5]
+
+    visited = set()
+    assert traversal.bfs(graph, 0, visited=visited, pre=lambda v: v == 4)
+    assert 5 not in visited
+    assert traversal.bfs(graph, 5, neighbors=traversal.undirected_neighbors(graph), edge=lambda u, v: (u, v) == (1, 3))
+
+@pytest.mark.parametrize("graph_type", ["directed", "undirected"])
+@pytest.mark.parametrize("key", ["cyclic", "dag_top_gen", "eulerian", "str_con_comp", "und_con", "planarity"])
+def test_checks_handle_long_paths_without_recursion(key, graph_type):
+    arcs = [(v, v + 1, 1) for v in range(DEEP - 1)]
+    if graph_type == "undirected":
+        arcs += [(v + 1, v, 1) for v in range(DEEP - 1)]
+    graph = Graph("caminho", [str(v) for v in range(DEEP)], arcs, graph_type=graph_type)
+    registry.load_module(registry.ALGORITHMS[key][0])
+
+    limit = sys.getrecursionlimit()
+    sys.setrecursionlimit(stack_depth() + 150)
+    try:
+        kind, title, message = registry.run(key, graph)
+    finally:
+        sys.setrecursionlimit(limit)
+    assert kind in ("info", "error", "warning")